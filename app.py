@@ -27,6 +27,9 @@ from utils.claude_client import (
     generate_titles_from_transcript,
     generate_toc_from_transcript,
     generate_draft_from_transcript,
+    generate_drafts_concurrently,
+    write_stream,
+    DIGEST_MAX_CHARS,
 )
 from utils.voice_handler import (
     render_voice_mode_ui,
@@ -39,7 +42,16 @@ from utils.youtube_handler import (
     get_transcript,
     validate_youtube_url,
     process_multiple_videos,
+    iter_process_videos,
+    iter_fetch_transcripts,
     merge_transcripts_for_book,
+    format_timestamp,
+    build_timestamp_url,
+    parse_collection_url,
+    list_collection_videos,
+    pending_collection_entries,
+    record_collection_sync,
+    synced_video_ids,
 )
 from utils.contact_handler import render_contact_section, get_pending_messages_count
 from utils.help_chatbot import (
@@ -92,6 +104,17 @@ from utils.autosave_handler import (
     save_progress,
     get_time_since_last_save,
 )
+from utils.draft_stats import DraftStore, ensure_draft_store, count_chars
+from utils.disk_cache import make_cache_key
+from utils.toc_index import get_toc_index, section_key as toc_section_key
+from utils.transcript_index import get_transcript_index
+from utils.section_alignment import get_section_alignment
+from utils.batch_handler import (
+    submit_draft_batch,
+    start_batch_poller,
+    get_batch_status,
+    apply_batch_results,
+)
 try:
     from utils.mode_transition import (
         init_mode_transition_state,
@@ -2348,7 +2371,8 @@ def init_session_state():
             "selected_title": "",
             "generated_toc": "",
             "parsed_toc": [],  # 파싱된 목차 구조
-            "drafts": {},
+            "drafts": DraftStore(),  # 꼭지별 글자 수 인덱스를 함께 관리
+            "draft_batch_job": None,  # 진행 중인 초안 일괄 생성 작업 (배치 ID 등)
             "current_section_index": 0,  # 현재 작성 중인 장 인덱스
             "chat_messages": [],
             "show_chatbot": False,
@@ -2374,7 +2398,9 @@ def init_session_state():
             "youtube_mode_active": False,  # 유튜브 모드 활성화 여부
             "youtube_urls": [],  # 입력된 유튜브 URL 리스트
             "youtube_videos": [],  # 처리된 영상 정보 리스트
+            "youtube_collections": {},  # 재생목록/채널별로 가져온 영상 ID (새 영상만 동기화)
             "youtube_transcripts": {},  # 영상별 자막 저장
+            "youtube_failed_transcripts": {},  # 자막이 없어 건너뛴 영상 (영상 ID → 사유)
             "youtube_merged_transcript": "",  # 통합된 자막
             "youtube_analysis": "",  # 자막 분석 결과
             "youtube_step": 1,  # 유튜브 모드 내 단계 (1-4)
@@ -2562,15 +2588,11 @@ def parse_toc(toc_text):
 def get_progress_stats():
     """진행 상황 통계 계산"""
     parsed_toc = st.session_state.parsed_toc
-    drafts = st.session_state.drafts
+    drafts = ensure_draft_store(st.session_state)
 
     total_sections = len(parsed_toc)
     completed_sections = len(drafts)
-
-    total_chars = sum(
-        len(d.replace(" ", "").replace("\n", ""))
-        for d in drafts.values()
-    )
+    total_chars = drafts.total_chars
 
     target_chars = 60000  # 목표 6만자
 
@@ -2710,8 +2732,12 @@ def render_sidebar():
                 st.session_state.youtube_step = 1
                 st.session_state.youtube_urls = []
                 st.session_state.youtube_videos = []
+                st.session_state.youtube_collections = {}
                 st.session_state.youtube_transcripts = {}
+                st.session_state.youtube_failed_transcripts = {}
                 st.session_state.youtube_merged_transcript = ""
+                st.session_state.youtube_transcript_index = None
+                st.session_state.youtube_section_alignment = None
                 st.session_state.youtube_analysis = ""
                 st.rerun()
             st.caption("유튜브 영상을 책으로 변환")
@@ -3534,7 +3560,9 @@ def render_step2():
         if st.button("🎯 제목 10개 생성하기", use_container_width=True, type="primary"):
             with st.spinner("✨ AI가 제목을 생성하고 있습니다..."):
                 try:
-                    result = generate_titles(st.session_state.book_info)
+                    # 생성되는 대로 바로 화면에 표시
+                    stream = generate_titles(st.session_state.book_info, stream=True)
+                    result = write_stream(stream)
                     if result:
                         st.session_state.generated_titles = result
                         st.rerun()
@@ -3599,7 +3627,8 @@ def render_step2():
         if st.session_state.generated_titles:
             if st.button("🔄 다시 생성하기"):
                 with st.spinner("✨ 다시 생성 중..."):
-                    result = generate_titles(st.session_state.book_info)
+                    stream = generate_titles(st.session_state.book_info, use_cache=False, stream=True)
+                    result = write_stream(stream)
                     if result:
                         st.session_state.generated_titles = result
                         st.rerun()
@@ -3653,7 +3682,9 @@ def render_step3():
         # 목차 생성 버튼
         if st.button("📋 목차 만들어줘! (책의 5가지 부분, 40장)", use_container_width=True, type="primary"):
             with st.spinner("✨ AI가 목차를 만들고 있어... (약 1분 걸려)"):
-                result = generate_toc(st.session_state.book_info)
+                # 생성되는 대로 바로 화면에 표시
+                stream = generate_toc(st.session_state.book_info, stream=True)
+                result = write_stream(stream)
                 if result:
                     st.session_state.generated_toc = result
                     st.session_state.parsed_toc = parse_toc(result)
@@ -3720,7 +3751,8 @@ def render_step3():
         if st.session_state.generated_toc:
             if st.button("🔄 목차 다시 만들기"):
                 with st.spinner("✨ 다시 만드는 중..."):
-                    result = generate_toc(st.session_state.book_info)
+                    stream = generate_toc(st.session_state.book_info, use_cache=False, stream=True)
+                    result = write_stream(stream)
                     if result:
                         st.session_state.generated_toc = result
                         st.session_state.parsed_toc = parse_toc(result)
@@ -3742,7 +3774,7 @@ def render_step3():
 
 def get_section_key(section):
     """섹션 키 생성 (단순화)"""
-    return f"{section['section_num']}_{section['section_title']}"
+    return toc_section_key(section)
 
 
 def get_part_transcript(full_transcript: str, part_number: int) -> str:
@@ -3802,6 +3834,23 @@ def get_part_transcript(full_transcript: str, part_number: int) -> str:
     return full_transcript[:8000]
 
 
+def get_section_reference(section_info: dict, transcript: str, transcript_index=None, alignment=None):
+    """
+    꼭지 초안에 넣을 자막과 검색 인덱스 반환
+
+    영상 구간 정렬이 있으면 그 꼭지의 타임스탬프 구간 자막만 쓰고,
+    없으면 Part 자막 + 자막 인덱스 검색을 씁니다.
+
+    Returns:
+        (자막 텍스트, 자막 인덱스 또는 None)
+    """
+    key = f"{section_info['section_number']}_{section_info['section_title']}"
+    span = alignment.span_for(key) if alignment else None
+    if span:
+        return span["text"], None
+    return get_part_transcript(transcript, section_info["part_number"]), transcript_index
+
+
 def is_section_completed(section, drafts):
     """섹션 완료 여부 확인"""
     return get_section_key(section) in drafts
@@ -3818,11 +3867,53 @@ def get_section_status(section, drafts, current_idx, section_idx):
 
 
 def is_part_completed(part_num, parsed_toc, drafts):
-    """특정 Part의 모든 장 완료 여부"""
+    """특정 Part의 모든 장 완료 여부 (목차 인덱스의 Part별 완료 수로 확인)"""
+    if parsed_toc is st.session_state.get("parsed_toc") and drafts is st.session_state.get("drafts"):
+        return get_toc_index(st.session_state).is_part_completed(part_num)
     part_sections = [s for s in parsed_toc if s['part'] == part_num]
     return all(is_section_completed(s, drafts) for s in part_sections)
 
 
+def render_draft_batch_status() -> bool:
+    """
+    절약 모드(일괄 생성) 진행 상태 표시 및 도착한 결과 반영
+
+    Returns:
+        아직 진행 중인 작업이 있으면 True
+    """
+    job = st.session_state.get("draft_batch_job")
+    if not job:
+        return False
+
+    # 재접속/새로고침 후에도 백그라운드 확인이 이어지도록 매번 확인
+    start_batch_poller(job)
+
+    applied = apply_batch_results(job, st.session_state.drafts)
+    if applied is not None:
+        st.session_state.draft_batch_job = None
+        for _ in applied["added"]:
+            on_chapter_complete()
+        trigger_important_save("draft_batch_completed")
+
+        st.success(f"📦 절약 모드로 {len(applied['added'])}개 장이 도착했어요!")
+        if applied["failed"]:
+            st.warning(f"{len(applied['failed'])}개 장은 만들지 못했어요. '✨ AI로 글 만들기'로 다시 만들어주세요.")
+        return False
+
+    status = get_batch_status(job) or {}
+    st.markdown("### 📦 절약 모드 진행 중")
+    counts = status.get("counts", {})
+    total = len(job.get("sections", {}))
+    finished = counts.get("succeeded", 0) + counts.get("errored", 0)
+    if total:
+        st.progress(min(finished / total, 1.0))
+    st.caption(f"{finished}/{total}개 완료 · 요청 시각 {job.get('submitted_at', '')[:16].replace('T', ' ')}")
+
+    if st.button("🔄 진행 상황 확인", use_container_width=True, key="check_draft_batch"):
+        st.rerun()
+    return True
+
+
 def render_step4():
     """4단계: 첫 번째 글 생성 - 순차적 플로우"""
     # UX 개선: 현재 위치 브레드크럼 표시
@@ -3847,7 +3938,7 @@ def render_step4():
     render_badges_display()
 
     parsed_toc = st.session_state.parsed_toc
-    drafts = st.session_state.drafts
+    drafts = ensure_draft_store(st.session_state)
 
     # 현재 상태에 따른 명확한 안내 메시지
     completed_count = len(drafts)
@@ -4048,7 +4139,7 @@ def render_step4():
                     trigger_important_save("manual_draft_saved")
                     # 성취 시스템 호출 - 장 완료 처리
                     on_chapter_complete()
-                    char_count = len(manual_draft.replace(" ", "").replace("\n", ""))
+                    char_count = count_chars(manual_draft)
                     motivation = get_motivation_by_progress()
                     st.success(f"✅ 저장했어! ({char_count}자)\n\n{motivation}")
                     st.rerun()
@@ -4057,18 +4148,16 @@ def render_step4():
         st.markdown("### 📋 진행 현황")
 
         # 현재 Part만 표시 (인지 부하 감소)
+        toc_index = get_toc_index(st.session_state)
         current_part_num = current_section['part']
-        current_part_sections = [s for s in parsed_toc if s['part'] == current_part_num]
-        part_completed = sum(1 for s in current_part_sections
-                            if f"{s['section_num']}_{s['section_title']}" in drafts)
+        current_part_indices = toc_index.part_indices.get(current_part_num, [])
+        part_completed = toc_index.part_completed.get(current_part_num, 0)
 
-        st.markdown(f"**Part {current_part_num}** ({part_completed}/{len(current_part_sections)})")
+        st.markdown(f"**Part {current_part_num}** ({part_completed}/{len(current_part_indices)})")
 
         # 키보드 접근성 개선: 각 버튼에 명확한 상태 설명
-        for idx, section in enumerate(parsed_toc):
-            if section['part'] != current_part_num:
-                continue
-
+        for idx in current_part_indices:
+            section = parsed_toc[idx]
             prefix, help_text = get_section_status(section, drafts, current_idx, idx)
             display_text = f"{prefix} {section['section_num']}. {section['section_title'][:12]}..."
 
@@ -4086,24 +4175,24 @@ def render_step4():
             for part_num in range(1, 6):
                 if part_num == current_part_num:
                     continue
-                part_sections = [s for s in parsed_toc if s['part'] == part_num]
-                if not part_sections:
+                part_indices = toc_index.part_indices.get(part_num)
+                if not part_indices:
                     continue
-                completed = sum(1 for s in part_sections
-                               if f"{s['section_num']}_{s['section_title']}" in drafts)
-                if st.button(f"Part {part_num} ({completed}/{len(part_sections)})",
+                completed = toc_index.part_completed[part_num]
+                if st.button(f"Part {part_num} ({completed}/{len(part_indices)})",
                             key=f"part_{part_num}"):
-                    first_section = part_sections[0]
-                    st.session_state.current_section_index = parsed_toc.index(first_section)
+                    st.session_state.current_section_index = part_indices[0]
                     st.rerun()
 
         st.markdown("---")
 
-        # 전체 미완료 장 수
-        all_unfinished = [s for s in parsed_toc
-                         if f"{s['section_num']}_{s['section_title']}" not in drafts]
+        # 진행 중인 절약 모드(일괄 생성) 작업 상태
+        batch_running = render_draft_batch_status()
 
-        if all_unfinished:
+        # 전체 미완료 장 수 (절약 모드 결과가 방금 반영됐을 수 있으니 다시 맞춤)
+        all_unfinished = get_toc_index(st.session_state).unfinished_sections()
+
+        if all_unfinished and not batch_running:
             st.markdown(f"### ⚡ 빠른 완성")
             st.markdown(f"**남은 장: {len(all_unfinished)}개**")
 
@@ -4112,10 +4201,9 @@ def render_step4():
                 progress_bar = st.progress(0)
                 status_text = st.empty()
 
-                for i, section in enumerate(all_unfinished):
+                jobs = []
+                for section in all_unfinished:
                     key = f"{section['section_num']}_{section['section_title']}"
-                    status_text.text(f"📝 {i+1}/{len(all_unfinished)}: {section['section_title'][:20]}...")
-
                     section_info = {
                         "part_number": section["part"],
                         "part_title": section["part_title"],
@@ -4124,14 +4212,21 @@ def render_step4():
                         "core_message": "",
                         "examples": "",
                     }
+                    jobs.append((key, section_info))
+
+                status_text.text(f"📝 {len(jobs)}개 장을 동시에 쓰고 있어요...")
 
-                    result = generate_draft(st.session_state.book_info, section_info)
+                # 완료되는 순서대로 바로 저장 및 진행률 반영
+                for i, (key, result) in enumerate(
+                    generate_drafts_concurrently(st.session_state.book_info, jobs)
+                ):
                     if result:
                         st.session_state.drafts[key] = result
                         # 성취 시스템 호출 - 장 완료 처리
                         on_chapter_complete()
 
-                    progress_bar.progress((i + 1) / len(all_unfinished))
+                    status_text.text(f"📝 {i+1}/{len(jobs)}: {key.split('_', 1)[-1][:20]}...")
+                    progress_bar.progress((i + 1) / len(jobs))
 
                 st.balloons()
                 st.snow()
@@ -4139,7 +4234,35 @@ def render_step4():
                 st.rerun()
 
             st.caption("💡 남은 모든 장을 한번에 자동 생성해요")
-        else:
+
+            # 절약 모드: 바로 볼 필요가 없으면 배치로 제출 (비용 절반)
+            if st.button("📦 절약 모드로 전체 생성", use_container_width=True):
+                jobs = [
+                    (f"{section['section_num']}_{section['section_title']}", {
+                        "part_number": section["part"],
+                        "part_title": section["part_title"],
+                        "section_number": section["section_num"],
+                        "section_title": section["section_title"],
+                        "core_message": "",
+                        "examples": "",
+                    })
+                    for section in all_unfinished
+                ]
+                try:
+                    job = submit_draft_batch(st.session_state.book_info, jobs)
+                except Exception as e:
+                    job = None
+                    st.error(f"일괄 생성 요청에 실패했어요. 잠시 후 다시 시도해주세요. ({str(e)[:100]})")
+
+                if job:
+                    st.session_state.draft_batch_job = job
+                    # 배치 ID를 바로 저장해서 창을 닫아도 나중에 결과를 받을 수 있게 함
+                    trigger_important_save("draft_batch_submitted")
+                    start_batch_poller(job)
+                    st.rerun()
+
+            st.caption("💡 절약 모드: 비용은 절반, 결과는 몇 분~몇 시간 뒤에 도착해요 (창을 닫아도 괜찮아요)")
+        elif not all_unfinished:
             st.success("🎉 모든 장 완료!")
 
     # 네비게이션
@@ -4240,10 +4363,12 @@ def render_step5():
                 st.warning("먼저 저자 정보를 저장해줘!")
             else:
                 with st.spinner("✨ 책 소개서를 만들고 있어요..."):
-                    result = generate_proposal(
+                    stream = generate_proposal(
                         st.session_state.book_info,
-                        st.session_state.author_info
+                        st.session_state.author_info,
+                        stream=True
                     )
+                    result = write_stream(stream)
                     if result:
                         st.session_state.generated_proposal = result
                         st.rerun()
@@ -4374,10 +4499,12 @@ def render_step6():
                 st.warning("먼저 웨비나 정보를 저장해줘!")
             else:
                 with st.spinner("✨ 홍보 페이지 글을 만들고 있어요..."):
-                    result = generate_landing_page(
+                    stream = generate_landing_page(
                         st.session_state.book_info,
-                        st.session_state.webinar_info
+                        st.session_state.webinar_info,
+                        stream=True
                     )
+                    result = write_stream(stream)
                     if result:
                         st.session_state.generated_landing_page = result
                         st.rerun()
@@ -4511,6 +4638,63 @@ def analyze_reading_level(text):
     }
 
 
+def get_export_files():
+    """
+    내보내기 결과 보관함 반환 (원고가 바뀌면 비움)
+
+    목차/원고/제목/책 정보가 같으면 한 번 만든 파일을 그대로 다시 씁니다.
+    """
+    fingerprint = make_cache_key(
+        st.session_state.parsed_toc,
+        st.session_state.drafts,
+        st.session_state.selected_title,
+        st.session_state.book_info,
+        st.session_state.generated_toc,
+    )
+    cache = st.session_state.get("export_cache")
+    if not cache or cache.get("fingerprint") != fingerprint:
+        cache = {"fingerprint": fingerprint, "files": {}}
+        st.session_state.export_cache = cache
+    return cache["files"]
+
+
+def get_or_build_export(files, fmt, builder):
+    """형식별 결과를 처음 요청될 때만 만들고 이후에는 재사용"""
+    if fmt not in files:
+        files[fmt] = builder()
+    return files[fmt]
+
+
+def render_lazy_download(files, fmt, label, builder, file_name, mime, help_text, missing_hint=None):
+    """
+    요청할 때만 만드는 다운로드 버튼
+
+    처음에는 '만들기' 버튼만 보여주고, 만든 뒤에는 같은 원고인 동안
+    바로 다운로드 버튼을 보여줍니다.
+    """
+    if fmt not in files:
+        if st.button(f"{label} 만들기", key=f"prepare_export_{fmt}", use_container_width=True, help=help_text):
+            with st.spinner(f"{label} 파일을 만들고 있어요..."):
+                get_or_build_export(files, fmt, builder)
+            st.rerun()
+        return
+
+    data = files[fmt]
+    if data:
+        st.download_button(
+            label=label,
+            data=data,
+            file_name=file_name,
+            mime=mime,
+            use_container_width=True,
+            help=help_text,
+            key=f"download_export_{fmt}",
+        )
+    elif missing_hint:
+        st.warning(missing_hint[0])
+        st.code(missing_hint[1], language="bash")
+
+
 def generate_book_manuscript():
     """책다운 원고 생성 (표지, 저작권, 에필로그 포함)"""
     title = st.session_state.selected_title or "무제"
@@ -5321,9 +5505,13 @@ def render_step7():
     # 통계
     stats = get_progress_stats()
 
-    # 원고 분석 (강화된 버전)
-    all_text = " ".join(st.session_state.drafts.values())
-    reading_analysis = analyze_reading_level(all_text)
+    # 원고 분석 (강화된 버전, 원고가 바뀔 때만 다시 분석)
+    export_files = get_export_files()
+    reading_analysis = get_or_build_export(
+        export_files,
+        "reading_analysis",
+        lambda: analyze_reading_level(" ".join(st.session_state.drafts.values())),
+    )
 
     # ===== 1. 강화된 통계 섹션 =====
     st.markdown("### 📊 원고 통계")
@@ -5519,65 +5707,52 @@ def render_step7():
     # ===== 3. 다운로드 섹션 =====
     st.markdown("### 📥 다운로드")
 
-    # 원고 생성
-    book_manuscript = generate_book_manuscript()
-    html_manuscript = generate_html_manuscript()
-    txt_manuscript = book_manuscript.replace('=', '-').replace('#', '')
-    print_html = generate_print_html()
-
-    # 다운로드 탭
+    # 다운로드 탭 (각 형식은 요청할 때만 생성)
     download_tab1, download_tab2, download_tab3 = st.tabs(["기본 형식", "문서 형식", "인쇄/출판"])
+    file_title = st.session_state.selected_title
 
     with download_tab1:
         st.markdown("**기본 다운로드 형식**")
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            st.download_button(
-                label="Markdown (.md)",
-                data=book_manuscript,
-                file_name=f"{st.session_state.selected_title}_원고.md",
-                mime="text/markdown",
-                use_container_width=True,
-                help="Notion, Obsidian, 블로그 등에서 편집 가능"
+            render_lazy_download(
+                export_files, "md", "Markdown (.md)",
+                lambda: get_or_build_export(export_files, "book_manuscript", generate_book_manuscript),
+                f"{file_title}_원고.md", "text/markdown",
+                "Notion, Obsidian, 블로그 등에서 편집 가능",
             )
 
         with col2:
-            st.download_button(
-                label="HTML (.html)",
-                data=html_manuscript,
-                file_name=f"{st.session_state.selected_title}_원고.html",
-                mime="text/html",
-                use_container_width=True,
-                help="웹브라우저에서 바로 열기 가능"
+            render_lazy_download(
+                export_files, "html", "HTML (.html)", generate_html_manuscript,
+                f"{file_title}_원고.html", "text/html",
+                "웹브라우저에서 바로 열기 가능",
             )
 
         with col3:
-            st.download_button(
-                label="텍스트 (.txt)",
-                data=txt_manuscript,
-                file_name=f"{st.session_state.selected_title}_원고.txt",
-                mime="text/plain",
-                use_container_width=True,
-                help="메모장, 한글 등에서 바로 편집"
+            render_lazy_download(
+                export_files, "txt", "텍스트 (.txt)",
+                lambda: get_or_build_export(
+                    export_files, "book_manuscript", generate_book_manuscript
+                ).replace('=', '-').replace('#', ''),
+                f"{file_title}_원고.txt", "text/plain",
+                "메모장, 한글 등에서 바로 편집",
             )
 
         with col4:
-            all_data = {
-                "book_info": st.session_state.book_info,
-                "selected_title": st.session_state.selected_title,
-                "generated_toc": st.session_state.generated_toc,
-                "drafts": st.session_state.drafts,
-                "stats": stats,
-                "reading_analysis": reading_analysis,
-            }
-            st.download_button(
-                label="JSON 백업",
-                data=json.dumps(all_data, ensure_ascii=False, indent=2),
-                file_name=f"{st.session_state.selected_title}_데이터.json",
-                mime="application/json",
-                use_container_width=True,
-                help="나중에 이어서 작업할 때 사용"
+            render_lazy_download(
+                export_files, "json", "JSON 백업",
+                lambda: json.dumps({
+                    "book_info": st.session_state.book_info,
+                    "selected_title": st.session_state.selected_title,
+                    "generated_toc": st.session_state.generated_toc,
+                    "drafts": st.session_state.drafts,
+                    "stats": stats,
+                    "reading_analysis": reading_analysis,
+                }, ensure_ascii=False, indent=2),
+                f"{file_title}_데이터.json", "application/json",
+                "나중에 이어서 작업할 때 사용",
             )
 
     with download_tab2:
@@ -5585,36 +5760,21 @@ def render_step7():
         doc_col1, doc_col2, doc_col3 = st.columns(3)
 
         with doc_col1:
-            # DOCX 다운로드
-            docx_data = generate_docx_manuscript()
-            if docx_data:
-                st.download_button(
-                    label="Word 문서 (.docx)",
-                    data=docx_data,
-                    file_name=f"{st.session_state.selected_title}_원고.docx",
-                    mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                    use_container_width=True,
-                    help="Microsoft Word에서 편집 가능"
-                )
-            else:
-                st.warning("DOCX 생성을 위해 python-docx 패키지가 필요합니다.")
-                st.code("pip install python-docx", language="bash")
+            render_lazy_download(
+                export_files, "docx", "Word 문서 (.docx)", generate_docx_manuscript,
+                f"{file_title}_원고.docx",
+                "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                "Microsoft Word에서 편집 가능",
+                missing_hint=("DOCX 생성을 위해 python-docx 패키지가 필요합니다.", "pip install python-docx"),
+            )
 
         with doc_col2:
-            # PDF 다운로드
-            pdf_data = generate_pdf_manuscript()
-            if pdf_data:
-                st.download_button(
-                    label="PDF 문서 (.pdf)",
-                    data=pdf_data,
-                    file_name=f"{st.session_state.selected_title}_원고.pdf",
-                    mime="application/pdf",
-                    use_container_width=True,
-                    help="PDF 뷰어에서 바로 열기 가능"
-                )
-            else:
-                st.warning("PDF 생성을 위해 reportlab 패키지가 필요합니다.")
-                st.code("pip install reportlab", language="bash")
+            render_lazy_download(
+                export_files, "pdf", "PDF 문서 (.pdf)", generate_pdf_manuscript,
+                f"{file_title}_원고.pdf", "application/pdf",
+                "PDF 뷰어에서 바로 열기 가능",
+                missing_hint=("PDF 생성을 위해 reportlab 패키지가 필요합니다.", "pip install reportlab"),
+            )
 
         with doc_col3:
             st.info("**TIP**: Word 문서는 출판사 제출용으로 적합합니다.")
@@ -5624,13 +5784,10 @@ def render_step7():
         print_col1, print_col2 = st.columns(2)
 
         with print_col1:
-            st.download_button(
-                label="인쇄용 HTML",
-                data=print_html,
-                file_name=f"{st.session_state.selected_title}_인쇄용.html",
-                mime="text/html",
-                use_container_width=True,
-                help="A4 페이지에 맞게 최적화, 목차 및 페이지 번호 포함"
+            render_lazy_download(
+                export_files, "print_html", "인쇄용 HTML", generate_print_html,
+                f"{file_title}_인쇄용.html", "text/html",
+                "A4 페이지에 맞게 최적화, 목차 및 페이지 번호 포함",
             )
 
         with print_col2:
@@ -5770,14 +5927,16 @@ def render_chatbot():
     if send_btn and user_input:
         st.session_state.chat_messages.append({"role": "user", "content": user_input})
 
-        with st.spinner("답변 중..."):
-            response = chat_with_coach(
-                st.session_state.chat_messages,
-                st.session_state.book_info
-            )
-            if response:
-                st.session_state.chat_messages.append({"role": "assistant", "content": response})
-        st.rerun()
+        st.markdown("**🤖 코치:**")
+        stream = chat_with_coach(
+            st.session_state.chat_messages,
+            st.session_state.book_info,
+            stream=True
+        )
+        response = write_stream(stream)
+        if response:
+            st.session_state.chat_messages.append({"role": "assistant", "content": response})
+            st.rerun()
 
     # 빠른 질문 (키보드 접근성 개선)
     st.markdown("#### 💡 자주 묻는 질문")
@@ -5794,11 +5953,12 @@ def render_chatbot():
             help=f"빠른 질문: {q}"  # 스크린리더 지원
         ):
             st.session_state.chat_messages.append({"role": "user", "content": q})
-            with st.spinner("답변 중..."):
-                response = chat_with_coach(st.session_state.chat_messages, st.session_state.book_info)
-                if response:
-                    st.session_state.chat_messages.append({"role": "assistant", "content": response})
-            st.rerun()
+            st.markdown("**🤖 코치:**")
+            stream = chat_with_coach(st.session_state.chat_messages, st.session_state.book_info, stream=True)
+            response = write_stream(stream)
+            if response:
+                st.session_state.chat_messages.append({"role": "assistant", "content": response})
+                st.rerun()
 
 
 # ============================================================
@@ -5843,10 +6003,78 @@ def render_youtube_mode():
         render_youtube_step4_drafts()
 
 
+def ingest_youtube_videos(urls, start_part=1, known_info=None):
+    """URL들의 영상 정보를 동시에 확인하고 진행률 표시 (성공한 영상만 part 순서로 반환)"""
+    progress_bar = st.progress(0)
+    total = max(1, sum(1 for url in urls if url))
+    videos = []
+    for done, result in enumerate(iter_process_videos(urls, fetch_transcript=False, start_part=start_part, known_info=known_info), 1):
+        if result['has_error']:
+            st.warning(f"⚠️ 영상 {result['part_number']}: {result.get('error') or '알 수 없는 오류'}")
+        else:
+            videos.append({
+                'url': result['url'],
+                'video_id': result['video_id'],
+                'info': result['info'],
+                'part_number': result['part_number'],
+            })
+        progress_bar.progress(done / total)
+    videos.sort(key=lambda v: v['part_number'])
+    return videos
+
+
+def set_youtube_transcripts(transcripts):
+    """영상별 자막 저장 + 통합 자막/검색 인덱스 갱신"""
+    # 완료 순서와 관계없이 Part 순서로 정렬
+    transcripts = dict(sorted(transcripts.items(), key=lambda item: item[1]['part_number']))
+    st.session_state.youtube_transcripts = transcripts
+    merged = "".join([f"\n\n=== Part {d['part_number']}: {d['title']} ===\n\n{d['text']}" for d in transcripts.values()])
+    previous = st.session_state.get("youtube_merged_transcript", "")
+    st.session_state.youtube_merged_transcript = merged.strip()
+    # 자막이 바뀌면(새 영상 추가 등) 분석은 다시 하고, 이미 만든 목차는 다시 만들도록 표시
+    if previous and st.session_state.youtube_merged_transcript != previous:
+        st.session_state.youtube_analysis = ""
+        if st.session_state.get("generated_toc"):
+            st.session_state.youtube_toc_outdated = True
+    # 꼭지별 자막 검색용 인덱스는 여기서 한 번만 만듦
+    if st.session_state.youtube_merged_transcript:
+        get_transcript_index(st.session_state, st.session_state.youtube_merged_transcript)
+
+
+def sync_youtube_collections():
+    """기록된 재생목록/채널을 다시 읽고 아직 가져오지 않은 새 영상만 뒤에 추가"""
+    registry = st.session_state.youtube_collections
+    existing = st.session_state.youtube_videos
+    known_ids = synced_video_ids(registry) | {v['video_id'] for v in existing}
+
+    added = []
+    for record in list(registry.values()):
+        collection, error = list_collection_videos(record['url'])
+        if error:
+            st.warning(f"⚠️ {record.get('title') or record['url']}: {error}")
+            continue
+        new_entries = pending_collection_entries(collection, known_ids)
+        if not new_entries:
+            continue
+        start_part = max([v['part_number'] for v in existing + added], default=0) + 1
+        videos = ingest_youtube_videos(
+            [entry['url'] for entry in new_entries],
+            start_part=start_part,
+            known_info={entry['video_id']: entry['info'] for entry in new_entries},
+        )
+        record_collection_sync(registry, collection, [v['video_id'] for v in videos])
+        known_ids.update(v['video_id'] for v in videos)
+        added.extend(videos)
+
+    if added:
+        st.session_state.youtube_videos = existing + added
+    return added
+
+
 def render_youtube_step1_url_input():
     """유튜브 모드 1단계: URL 입력"""
     st.markdown("### 📋 유튜브 링크 입력")
-    st.markdown('<div class="help-box">💡 <b>사용 방법:</b> 유튜브 영상 링크를 붙여넣으세요. 여러 개 입력 시 각각 하나의 Part가 됩니다. 자막이 있는 영상만 지원됩니다.</div>', unsafe_allow_html=True)
+    st.markdown('<div class="help-box">💡 <b>사용 방법:</b> 유튜브 영상 링크를 붙여넣으세요. 여러 개 입력 시 각각 하나의 Part가 됩니다. 재생목록/채널 링크를 넣으면 목록의 영상이 순서대로 Part가 됩니다. 자막이 있는 영상만 지원됩니다.</div>', unsafe_allow_html=True)
 
     url_input = st.text_area("🔗 유튜브 링크 (여러 개는 줄바꿈으로 구분)", placeholder="https://www.youtube.com/watch?v=...", height=150)
 
@@ -5860,22 +6088,50 @@ def render_youtube_step1_url_input():
             st.session_state.youtube_urls = urls
 
             with st.spinner("🔄 영상 정보를 확인하고 있습니다..."):
-                videos = []
+                # 재생목록/채널은 영상 목록으로 펼치고, URL 유효성 검사는 먼저 한 번에 함
+                valid_urls = []
+                known_info = {}
+                collections = []
+                seen_ids = set()
                 for i, url in enumerate(urls):
-                    # URL 유효성 검사
+                    if parse_collection_url(url):
+                        collection, error = list_collection_videos(url)
+                        if error:
+                            st.warning(f"⚠️ 링크 {i+1}: {error}")
+                            continue
+                        entries = pending_collection_entries(collection, seen_ids)
+                        collections.append(collection)
+                        for entry in entries:
+                            valid_urls.append(entry['url'])
+                            known_info[entry['video_id']] = entry['info']
+                            seen_ids.add(entry['video_id'])
+                        st.info(f"📚 {collection['title']}: 영상 {len(entries)}개")
+                        continue
+
                     is_valid, result = validate_youtube_url(url)
-                    if not is_valid:
+                    if is_valid and result not in seen_ids:
+                        valid_urls.append(url)
+                        seen_ids.add(result)
+                    elif not is_valid:
+                        valid_urls.append(None)
                         st.warning(f"⚠️ 영상 {i+1}: {result}")
-                        continue
 
-                    video_id = result  # 유효한 경우 result는 video_id
-                    info = get_video_info(url)
-                    if info and 'error' not in info:
-                        videos.append({'url': url, 'video_id': video_id, 'info': info, 'part_number': i + 1})
-                    else:
-                        st.warning(f"⚠️ 영상 {i+1}: {info.get('error', '알 수 없는 오류') if info else '알 수 없는 오류'}")
+                videos = ingest_youtube_videos(valid_urls, known_info=known_info)
                 if videos:
+                    # 재생목록/채널별로 가져온 영상 기록 (다음에는 새 영상만 동기화)
+                    registry = {}
+                    ingested_ids = {v['video_id'] for v in videos}
+                    for collection in collections:
+                        record_collection_sync(registry, collection, [e['video_id'] for e in collection['entries'] if e['video_id'] in ingested_ids])
+                    st.session_state.youtube_collections = registry
                     st.session_state.youtube_videos = videos
+                    # 이미 추출한 자막은 새 Part 번호에 맞추고, 목록에서 빠진 영상 자막은 정리
+                    if st.session_state.youtube_transcripts:
+                        parts = {v['video_id']: v['part_number'] for v in videos}
+                        set_youtube_transcripts({
+                            vid: {**data, 'part_number': parts[vid]}
+                            for vid, data in st.session_state.youtube_transcripts.items() if vid in parts
+                        })
                     st.success(f"✅ {len(videos)}개 영상 확인 완료!")
                     st.rerun()
                 else:
@@ -5888,8 +6144,19 @@ def render_youtube_step1_url_input():
         - `youtu.be/...`
         - `youtube.com/shorts/...`
         - `m.youtube.com/...`
+        - `youtube.com/playlist?list=...` (재생목록)
+        - `youtube.com/@채널이름` (채널 영상)
         """)
 
+        if st.session_state.get("youtube_collections") and st.session_state.youtube_videos:
+            if st.button("🔄 재생목록 새 영상 가져오기", use_container_width=True):
+                with st.spinner("🔄 재생목록/채널에 새 영상이 있는지 확인하고 있습니다..."):
+                    added = sync_youtube_collections()
+                if added:
+                    st.success(f"✅ 새 영상 {len(added)}개를 추가했어요! 자막 추출 단계에서 새 영상 자막만 가져와요.")
+                else:
+                    st.info("새로 올라온 영상이 없어요.")
+
     if st.session_state.youtube_videos:
         st.markdown("---")
         st.markdown("### 📺 확인된 영상 목록")
@@ -5921,32 +6188,40 @@ def render_youtube_step2_analyze():
             st.rerun()
         return
 
-    if not st.session_state.youtube_transcripts:
-        if st.button("🎯 자막 추출 시작", type="primary", use_container_width=True):
+    # 재생목록 동기화로 추가된 영상처럼 아직 자막이 없는 영상만 추출 (자막이 없다고 확인된 영상은 제외)
+    extracted = st.session_state.youtube_transcripts
+    failed = st.session_state.youtube_failed_transcripts
+    pending = [video for video in videos if video.get('video_id') not in extracted and video.get('video_id') not in failed]
+    skipped = [video for video in videos if video.get('video_id') in failed and video.get('video_id') not in extracted]
+    if skipped:
+        st.caption("⚠️ 자막이 없어 건너뛴 영상: " + ", ".join(f"Part {video.get('part_number')}" for video in skipped))
+    if pending:
+        button_label = "🎯 자막 추출 시작" if not extracted else f"🆕 새 영상 자막 추출 ({len(pending)}개)"
+        if st.button(button_label, type="primary", use_container_width=True):
             progress_bar = st.progress(0)
             status_text = st.empty()
-            transcripts = {}
-            for i, video in enumerate(videos):
+            status_text.text(f"📝 자막 추출 중... (0/{len(pending)})")
+            transcripts = dict(extracted)
+            # 여러 영상의 자막을 동시에 가져오고, 끝나는 대로 표시
+            for done, (video, transcript, lang_or_error) in enumerate(iter_fetch_transcripts(pending), 1):
                 video_id = video.get('video_id')
-                title = video.get('info', {}).get('title', f'영상 {i+1}')
-                status_text.text(f"📝 자막 추출 중... ({i+1}/{len(videos)})")
-                progress_bar.progress((i + 0.5) / len(videos))
-                transcript, lang_or_error = get_transcript(video_id)
+                title = video.get('info', {}).get('title', f"영상 {video.get('part_number')}")
+                status_text.text(f"📝 자막 추출 중... ({done}/{len(pending)})")
                 if transcript:
-                    transcripts[video_id] = {'text': transcript, 'language': lang_or_error, 'title': title, 'part_number': video.get('part_number', i+1)}
+                    transcripts[video_id] = {'text': transcript, 'language': lang_or_error, 'title': title, 'part_number': video.get('part_number', done)}
                     st.success(f"✅ Part {video.get('part_number')}: 완료 ({lang_or_error})")
                 else:
                     # 자막 없는 경우 구분 처리
                     if lang_or_error and lang_or_error.startswith("NO_TRANSCRIPT:"):
                         error_msg = lang_or_error.replace("NO_TRANSCRIPT:", "")
+                        # 다시 시도해도 자막이 없으므로 다음부터 추출 대상에서 뺌
+                        st.session_state.youtube_failed_transcripts[video_id] = error_msg
                         st.warning(f"⚠️ Part {video.get('part_number')}: {error_msg}")
                     else:
                         st.error(f"❌ Part {video.get('part_number')}: 실패 - {lang_or_error}")
-                progress_bar.progress((i + 1) / len(videos))
-            if transcripts:
-                st.session_state.youtube_transcripts = transcripts
-                merged = "".join([f"\n\n=== Part {d['part_number']}: {d['title']} ===\n\n{d['text']}" for d in transcripts.values()])
-                st.session_state.youtube_merged_transcript = merged.strip()
+                progress_bar.progress(done / len(pending))
+            if len(transcripts) > len(extracted):
+                set_youtube_transcripts(transcripts)
                 st.success(f"🎉 총 {len(transcripts)}개 영상 자막 추출 완료!")
                 st.rerun()
             else:
@@ -5966,6 +6241,8 @@ def render_youtube_step2_analyze():
                 st.text_area("자막", value=data['text'][:2000] + ("..." if len(data['text']) > 2000 else ""), height=200, disabled=True, label_visibility="collapsed")
 
         st.markdown(f"**📊 총 자막 길이: {len(st.session_state.youtube_merged_transcript):,}자**")
+        if len(st.session_state.youtube_merged_transcript) > DIGEST_MAX_CHARS:
+            st.caption("💡 자막이 길어서 분석/제목/목차에는 전체 내용을 나눠 요약한 뒤 사용해요. (처음 한 번만 시간이 조금 더 걸려요)")
         st.markdown("---")
 
         if not st.session_state.youtube_analysis:
@@ -6013,7 +6290,9 @@ def render_youtube_step3_title_toc():
             if st.button("✨ AI 제목 10개 생성", use_container_width=True, type="primary"):
                 with st.spinner("✨ AI가 제목 생성 중..."):
                     first_video = list(st.session_state.youtube_transcripts.values())[0]
-                    result = generate_titles_from_transcript(st.session_state.youtube_merged_transcript, {'title': first_video.get('title', ''), 'channel': ''})
+                    # '제목 다시 생성' 후에는 저장된 응답 대신 새로 생성
+                    use_cache = not st.session_state.pop("youtube_regenerate_titles", False)
+                    result = generate_titles_from_transcript(st.session_state.youtube_merged_transcript, {'title': first_video.get('title', ''), 'channel': ''}, use_cache=use_cache)
                     if result:
                         st.session_state.generated_titles = result
                         st.rerun()
@@ -6030,6 +6309,7 @@ def render_youtube_step3_title_toc():
                 st.session_state.book_info["title"] = selected
             if st.button("🔄 제목 다시 생성"):
                 st.session_state.generated_titles = ""
+                st.session_state.youtube_regenerate_titles = True
                 st.rerun()
 
         st.markdown("---")
@@ -6039,15 +6319,19 @@ def render_youtube_step3_title_toc():
                 if st.button("📋 목차 생성하기", use_container_width=True, type="primary"):
                     with st.spinner("📋 AI가 목차 생성 중... (약 1분)"):
                         video_count = len(st.session_state.youtube_videos)
-                        result = generate_toc_from_transcript(st.session_state.youtube_merged_transcript, st.session_state.book_info, video_count)
+                        use_cache = not st.session_state.pop("youtube_regenerate_toc", False)
+                        result = generate_toc_from_transcript(st.session_state.youtube_merged_transcript, st.session_state.book_info, video_count, use_cache=use_cache)
                         if result:
                             st.session_state.generated_toc = result
                             st.session_state.parsed_toc = parse_toc(result)
+                            st.session_state.youtube_toc_outdated = False
                             st.rerun()
                         else:
                             st.error("😢 목차를 만들지 못했어. 다시 해볼까?")
 
             if st.session_state.generated_toc:
+                if st.session_state.get("youtube_toc_outdated"):
+                    st.info("🆕 목차를 만든 뒤에 새 영상 자막이 추가됐어요. 목차를 다시 만들면 새 영상 내용도 들어가요.")
                 st.markdown("**📚 생성된 목차:**")
                 if st.session_state.parsed_toc:
                     st.success(f"✅ {len(st.session_state.parsed_toc)}개 장 인식!")
@@ -6060,6 +6344,7 @@ def render_youtube_step3_title_toc():
                 if st.button("🔄 목차 다시 생성"):
                     st.session_state.generated_toc = ""
                     st.session_state.parsed_toc = []
+                    st.session_state.youtube_regenerate_toc = True
                     st.rerun()
         else:
             st.info("💡 먼저 제목을 선택해주세요.")
@@ -6093,8 +6378,11 @@ def render_youtube_step4_drafts():
     render_progress_bar()
 
     parsed_toc = st.session_state.parsed_toc
-    drafts = st.session_state.drafts
+    drafts = ensure_draft_store(st.session_state)
     transcript = st.session_state.youtube_merged_transcript
+    transcript_index = get_transcript_index(st.session_state, transcript)
+    with st.spinner("🎬 목차와 영상 구간을 맞추는 중..."):
+        alignment = get_section_alignment(st.session_state)
 
     if not parsed_toc:
         st.warning("👆 먼저 3단계에서 목차를 만들어줘!")
@@ -6119,6 +6407,10 @@ def render_youtube_step4_drafts():
 
         st.markdown(f'<div class="current-section-box"><h3>✍️ 지금 쓸 장</h3><p><b>Part {current_section["part"]}.</b> {current_section["part_title"]}</p><p style="font-size: 1.3rem;"><b>{current_section["section_num"]}. {current_section["section_title"]}</b></p></div>', unsafe_allow_html=True)
 
+        span = alignment.span_for(section_key) if alignment else None
+        if span:
+            st.caption(f"🎬 참고 영상 구간: [{format_timestamp(span['start'])} ~ {format_timestamp(span['end'])}]({build_timestamp_url(span['video_id'], span['start'])})")
+
         if section_key in drafts:
             st.success("✅ 이미 작성됨!")
             edited_draft = st.text_area("작성된 내용", value=drafts[section_key], height=400)
@@ -6138,9 +6430,9 @@ def render_youtube_step4_drafts():
             if st.button("✨ AI가 글 써줘!", use_container_width=True, type="primary"):
                 section_info = {"part_number": current_section["part"], "part_title": current_section["part_title"], "section_number": current_section["section_num"], "section_title": current_section["section_title"]}
                 with st.spinner("✨ 글을 쓰고 있어요..."):
-                    # Part별 자막 추출 (다중 영상인 경우 해당 Part 자막 사용)
-                    part_transcript = get_part_transcript(transcript, current_section["part"])
-                    result = generate_draft_from_transcript(st.session_state.book_info, section_info, part_transcript)
+                    # 꼭지 영상 구간 자막 (정렬이 없으면 Part 자막에서 검색)
+                    reference, reference_index = get_section_reference(section_info, transcript, transcript_index, alignment)
+                    result = generate_draft_from_transcript(st.session_state.book_info, section_info, reference, reference_index)
                     if result:
                         st.session_state.drafts[section_key] = result
                         st.success("✅ 완료!")
@@ -6150,37 +6442,45 @@ def render_youtube_step4_drafts():
 
     with col2:
         st.markdown("### 📋 진행 현황")
+        toc_index = get_toc_index(st.session_state)
         current_part_num = current_section['part']
-        current_part_sections = [s for s in parsed_toc if s['part'] == current_part_num]
-        part_completed = sum(1 for s in current_part_sections if f"{s['section_num']}_{s['section_title']}" in drafts)
-        st.markdown(f"**Part {current_part_num}** ({part_completed}/{len(current_part_sections)})")
+        current_part_indices = toc_index.part_indices.get(current_part_num, [])
+        part_completed = toc_index.part_completed.get(current_part_num, 0)
+        st.markdown(f"**Part {current_part_num}** ({part_completed}/{len(current_part_indices)})")
 
-        for idx, section in enumerate(parsed_toc):
-            if section['part'] != current_part_num:
-                continue
-            key = f"{section['section_num']}_{section['section_title']}"
-            prefix = "➡️" if idx == current_idx else ("✅" if key in drafts else "⬜")
+        for idx in current_part_indices:
+            section = parsed_toc[idx]
+            prefix = "➡️" if idx == current_idx else ("✅" if toc_index.completed[idx] else "⬜")
             if st.button(f"{prefix} {section['section_num']}. {section['section_title'][:12]}...", key=f"yt_jump_{idx}", use_container_width=True):
                 st.session_state.current_section_index = idx
                 st.rerun()
 
         st.markdown("---")
-        all_unfinished = [s for s in parsed_toc if f"{s['section_num']}_{s['section_title']}" not in drafts]
+        all_unfinished = toc_index.unfinished_sections()
         if all_unfinished:
             st.markdown(f"**남은 장: {len(all_unfinished)}개**")
             if st.button("🚀 전체 자동 생성", use_container_width=True, type="primary"):
                 progress_bar = st.progress(0)
                 status_text = st.empty()
-                for i, section in enumerate(all_unfinished):
+                jobs = []
+                for section in all_unfinished:
                     key = f"{section['section_num']}_{section['section_title']}"
                     section_info = {"part_number": section["part"], "part_title": section["part_title"], "section_number": section["section_num"], "section_title": section["section_title"]}
-                    status_text.text(f"✍️ {section['section_num']}. {section['section_title'][:20]}... 작성 중")
-                    # Part별 자막 추출
-                    part_transcript = get_part_transcript(transcript, section["part"])
-                    result = generate_draft_from_transcript(st.session_state.book_info, section_info, part_transcript)
+                    jobs.append((key, section_info))
+
+                def draft_from_part_transcript(book_info, section_info):
+                    # 꼭지 영상 구간 자막 (정렬이 없으면 Part 자막에서 검색)
+                    reference, reference_index = get_section_reference(section_info, transcript, transcript_index, alignment)
+                    return generate_draft_from_transcript(book_info, section_info, reference, reference_index)
+
+                status_text.text(f"✍️ {len(jobs)}개 장을 동시에 작성 중...")
+                for i, (key, result) in enumerate(
+                    generate_drafts_concurrently(st.session_state.book_info, jobs, draft_fn=draft_from_part_transcript)
+                ):
                     if result:
                         st.session_state.drafts[key] = result
-                    progress_bar.progress((i + 1) / len(all_unfinished))
+                    status_text.text(f"✍️ {i+1}/{len(jobs)} 완료")
+                    progress_bar.progress((i + 1) / len(jobs))
                 status_text.empty()
                 st.balloons()
                 st.success("🎉 모든 첫 번째 글 완성!")
@@ -6487,7 +6787,8 @@ def render_chat_mode():
                                 "experience": "",
                                 "tone": "친절하고 따뜻한",
                             }
-                            result = generate_toc(book_info)
+                            # 다시 만들기면 캐시된 목차 대신 새로 생성
+                            result = generate_toc(book_info, use_cache=not data.pop("regenerate_toc", False))
                             if result:
                                 data["generated_toc"] = result
                                 data["parsed_toc"] = parse_toc(result)
@@ -6527,6 +6828,7 @@ def render_chat_mode():
                             del data["generated_toc"]
                             if "parsed_toc" in data:
                                 del data["parsed_toc"]
+                            data["regenerate_toc"] = True
                             st.rerun()
 
             elif action == "generate_draft":
@@ -6991,7 +7293,7 @@ def render_ux_char_counter(text: str, min_chars: int = 0, max_chars: int = 0, ta
         max_chars: 최대 글자 수 (0이면 체크 안함)
         target_chars: 목표 글자 수 (0이면 표시 안함)
     """
-    char_count = len(text.replace(" ", "").replace("\n", "")) if text else 0
+    char_count = count_chars(text)
 
     # 상태 결정
     status_class = ""
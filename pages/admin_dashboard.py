@@ -15,6 +15,7 @@ from utils.contact_handler import (
     get_pending_messages_count,
     ensure_data_directory,
 )
+from utils.claude_client import get_usage_stats
 
 # 페이지 설정
 st.set_page_config(
@@ -853,6 +854,8 @@ def render_data_analysis():
     """데이터 분석 - 기간별 통계, FAQ 분석"""
     st.markdown("## 데이터 분석")
 
+    render_ai_usage_stats()
+
     messages = load_all_messages_json()
 
     if not messages:
@@ -872,6 +875,27 @@ def render_data_analysis():
         render_step_analysis(messages)
 
 
+def render_ai_usage_stats():
+    """AI 사용량 및 프롬프트 캐시 효과 (서버 시작 이후 누적)"""
+    stats = get_usage_stats()
+
+    st.markdown("### AI 사용량 (서버 시작 이후)")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("API 요청 수", f"{stats['requests']:,}회")
+    with col2:
+        st.metric("캐시 적중률", f"{stats['cache_hit_ratio'] * 100:.1f}%")
+    with col3:
+        st.metric("캐시 읽기 토큰", f"{stats['cache_read_input_tokens']:,}")
+    with col4:
+        st.metric("캐시 저장 토큰", f"{stats['cache_creation_input_tokens']:,}")
+    st.caption(
+        f"일반 입력 토큰 {stats['input_tokens']:,} · 출력 토큰 {stats['output_tokens']:,} "
+        "· 캐시 읽기 토큰은 일반 입력 토큰 가격의 10%로 계산됩니다."
+    )
+    st.markdown("---")
+
+
 def render_period_stats(messages):
     """기간별 통계"""
     st.markdown("### 기간별 질문 통계")
@@ -1,8 +1,14 @@
 """프롬프트 템플릿 모듈"""
 from prompts.templates import (
     TITLE_FORMULAS,
+    TITLE_GENERATION_GUIDE,
+    TITLE_GENERATION_REQUEST,
+    TOC_GENERATION_GUIDE,
+    TOC_GENERATION_REQUEST,
     WRITING_TONES,
+    get_title_book_context,
     get_title_generation_prompt,
+    get_toc_book_context,
     get_toc_generation_prompt,
     get_draft_generation_prompt,
     get_feedback_prompt,
@@ -14,8 +20,14 @@ from prompts.templates import (
 
 __all__ = [
     "TITLE_FORMULAS",
+    "TITLE_GENERATION_GUIDE",
+    "TITLE_GENERATION_REQUEST",
+    "TOC_GENERATION_GUIDE",
+    "TOC_GENERATION_REQUEST",
     "WRITING_TONES",
+    "get_title_book_context",
     "get_title_generation_prompt",
+    "get_toc_book_context",
     "get_toc_generation_prompt",
     "get_draft_generation_prompt",
     "get_feedback_prompt",
@@ -56,16 +56,11 @@ TITLE_FORMULAS = """
 """
 
 
-def get_title_generation_prompt(book_info: dict) -> str:
-    """제목 생성 프롬프트 - 베스트셀러 수준의 제목 생성"""
-    return f"""당신은 20년 경력의 출판 편집자이자 베스트셀러 제목 전문가입니다.
-수백 권의 베스트셀러 제목을 분석하고 직접 기획한 경험이 있습니다.
+# 프롬프트 캐시용 구성: 고정 지침(모든 책 공통) → 책 정보(책마다 고정) → 요청 문장 순서
+# 고정 지침과 책 정보는 API 프롬프트 캐시로 재사용되므로 앞쪽에 둡니다.
 
-## 책 정보
-- **주제**: {book_info.get('topic', '')}
-- **타겟 독자**: {book_info.get('target_reader', '')}
-- **핵심 메시지**: {book_info.get('core_message', '')}
-- **저자 경험/전문성**: {book_info.get('experience', '없음')}
+TITLE_GENERATION_GUIDE = f"""당신은 20년 경력의 출판 편집자이자 베스트셀러 제목 전문가입니다.
+수백 권의 베스트셀러 제목을 분석하고 직접 기획한 경험이 있습니다.
 
 {TITLE_FORMULAS}
 
@@ -96,17 +91,29 @@ def get_title_generation_prompt(book_info: dict) -> str:
 
 10개 모두 작성해주세요."""
 
+TITLE_GENERATION_REQUEST = "위 책 정보로 제목 10개를 작성해주세요."
 
-def get_toc_generation_prompt(book_info: dict) -> str:
-    """목차 생성 프롬프트 (5부 구조, 40꼭지) - 체계적인 책 구조 설계"""
-    return f"""당신은 100권 이상의 책을 기획한 베테랑 출판 기획자입니다.
-독자가 처음부터 끝까지 읽고 싶어지는 목차 구성의 전문가입니다.
 
-## 책 정보
-- **제목**: {book_info.get('title', '')}
+def get_title_book_context(book_info: dict) -> str:
+    """제목 생성용 책 정보 블록"""
+    return f"""## 책 정보
 - **주제**: {book_info.get('topic', '')}
 - **타겟 독자**: {book_info.get('target_reader', '')}
 - **핵심 메시지**: {book_info.get('core_message', '')}
+- **저자 경험/전문성**: {book_info.get('experience', '없음')}"""
+
+
+def get_title_generation_prompt(book_info: dict) -> str:
+    """제목 생성 프롬프트 - 베스트셀러 수준의 제목 생성 (단일 텍스트)"""
+    return f"""{TITLE_GENERATION_GUIDE}
+
+{get_title_book_context(book_info)}
+
+{TITLE_GENERATION_REQUEST}"""
+
+
+TOC_GENERATION_GUIDE = """당신은 100권 이상의 책을 기획한 베테랑 출판 기획자입니다.
+독자가 처음부터 끝까지 읽고 싶어지는 목차 구성의 전문가입니다.
 
 ## 목차 설계 원칙: 5부 구조 (Why-What-How-Do-Future)
 
@@ -198,6 +205,26 @@ Part 5. [매력적인 Part 제목] - FUTURE (미래)
 
 위 형식을 정확히 따라 목차를 생성해주세요."""
 
+TOC_GENERATION_REQUEST = "위 책 정보로 목차를 생성해주세요."
+
+
+def get_toc_book_context(book_info: dict) -> str:
+    """목차 생성용 책 정보 블록"""
+    return f"""## 책 정보
+- **제목**: {book_info.get('title', '')}
+- **주제**: {book_info.get('topic', '')}
+- **타겟 독자**: {book_info.get('target_reader', '')}
+- **핵심 메시지**: {book_info.get('core_message', '')}"""
+
+
+def get_toc_generation_prompt(book_info: dict) -> str:
+    """목차 생성 프롬프트 (5부 구조, 40꼭지) - 체계적인 책 구조 설계 (단일 텍스트)"""
+    return f"""{TOC_GENERATION_GUIDE}
+
+{get_toc_book_context(book_info)}
+
+{TOC_GENERATION_REQUEST}"""
+
 
 def get_draft_generation_prompt(book_info: dict, section_info: dict) -> str:
     """초안 생성 프롬프트 (2000자) - 읽기 쉽고 설득력 있는 글"""
@@ -0,0 +1,35 @@
+"""
+테스트 공용 fixture
+====================
+저장 관련 테스트(세션 저널, 백업 저장소, SQLite 저장소)가 함께 쓰는 세션 상태 생성 함수
+"""
+
+import pytest
+
+
+def build_state(drafts=None, **fields):
+    """
+    저장할 세션 상태 예시 (꼭지 초안 + 긴 자막)
+
+    Args:
+        drafts: 꼭지별 초안 (넣은 순서 유지)
+        **fields: 덮어쓸 항목
+    """
+    state = {
+        "saved_at": "2026-01-01T00:00:00",
+        "student_name": "홍길동",
+        "book_info": {"name": "홍길동", "topic": "글쓰기"},
+        "selected_title": "나의 첫 책",
+        "current_step": 4,
+        "drafts": dict(drafts or {}),
+        "youtube_transcripts": {"abc": {"title": "강의 1", "transcript": "자막 " * 500}},
+        "youtube_merged_transcript": "통합 자막 " * 500,
+    }
+    state.update(fields)
+    return state
+
+
+@pytest.fixture
+def make_state():
+    """세션 상태 생성 함수 (build_state)"""
+    return build_state
@@ -0,0 +1,147 @@
+"""
+백그라운드 자동 저장 테스트
+============================
+스냅샷 합치기, 지연(debounce) 저장, 일괄 저장, 상태 표시 단위 테스트
+
+실행 방법:
+    pytest tests/test_autosave_writer.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.autosave_writer import (
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SAVED,
+    AutosaveWriter,
+    snapshot_session_data,
+)
+
+
+class RecordingSaver:
+    """저장 호출을 기록하는 가짜 저장 함수"""
+
+    def __init__(self, fail=False, delay=0.0):
+        self.calls = []
+        self.fail = fail
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, student_name, data):
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls.append((student_name, data))
+        if self.fail:
+            raise OSError("디스크 가득 참")
+        return f"{student_name}.journal"
+
+
+class TestCoalescing:
+    """스냅샷 합치기/지연 저장 테스트"""
+
+    def test_rapid_submits_write_latest_once(self):
+        """연달아 들어온 스냅샷은 마지막 것 하나만 저장하는지 테스트"""
+        saver = RecordingSaver()
+        writer = AutosaveWriter(saver, debounce_seconds=0.2, max_delay_seconds=5)
+
+        for i in range(5):
+            writer.submit("kim", "kim", {"drafts": {"1장": f"버전 {i}"}})
+
+        assert writer.status("kim")["state"] == STATUS_PENDING
+        assert writer.flush(timeout=5)
+        assert saver.calls == [("kim", {"drafts": {"1장": "버전 4"}})]
+        assert writer.status("kim")["state"] == STATUS_SAVED
+
+    def test_waits_for_debounce(self):
+        """debounce 시간 전에는 저장하지 않는지 테스트"""
+        saver = RecordingSaver()
+        writer = AutosaveWriter(saver, debounce_seconds=0.3, max_delay_seconds=5)
+
+        writer.submit("kim", "kim", {"step": 1})
+        time.sleep(0.1)
+        assert saver.calls == []
+
+        time.sleep(0.5)
+        assert len(saver.calls) == 1
+
+    def test_max_delay_bounds_waiting(self):
+        """요청이 계속 와도 최대 대기 시간 안에 저장하는지 테스트"""
+        saver = RecordingSaver()
+        writer = AutosaveWriter(saver, debounce_seconds=0.2, max_delay_seconds=0.4)
+
+        deadline = time.monotonic() + 1.0
+        i = 0
+        while time.monotonic() < deadline:
+            writer.submit("kim", "kim", {"step": i})
+            i += 1
+            time.sleep(0.05)
+
+        assert len(saver.calls) >= 1
+        writer.flush(timeout=5)
+
+    def test_immediate_skips_debounce(self):
+        """중요 변경은 기다리지 않고 바로 저장하는지 테스트"""
+        saver = RecordingSaver()
+        writer = AutosaveWriter(saver, debounce_seconds=10, max_delay_seconds=10)
+
+        writer.submit("kim", "kim", {"step": 3}, immediate=True)
+        time.sleep(0.3)
+
+        assert saver.calls == [("kim", {"step": 3})]
+
+    def test_students_are_saved_in_one_batch(self):
+        """여러 학생 스냅샷을 한 번에 모두 저장하는지 테스트"""
+        saver = RecordingSaver()
+        writer = AutosaveWriter(saver, debounce_seconds=0.1, max_delay_seconds=5)
+
+        writer.submit("kim", "kim", {"step": 1})
+        writer.submit("lee", "lee", {"step": 2})
+        writer.flush(timeout=5)
+
+        assert sorted(name for name, _ in saver.calls) == ["kim", "lee"]
+
+
+class TestStatus:
+    """저장 상태 테스트"""
+
+    def test_failure_is_reported(self):
+        """저장 실패가 상태에 남는지 테스트"""
+        writer = AutosaveWriter(RecordingSaver(fail=True), debounce_seconds=0, max_delay_seconds=0)
+
+        writer.submit("kim", "kim", {"step": 1})
+        writer.flush(timeout=5)
+
+        status = writer.status("kim")
+        assert status["state"] == STATUS_FAILED
+        assert "디스크" in status["error"]
+
+    def test_submit_does_not_block_on_slow_save(self):
+        """저장이 느려도 요청은 바로 돌아오는지 테스트"""
+        saver = RecordingSaver(delay=0.3)
+        writer = AutosaveWriter(saver, debounce_seconds=0, max_delay_seconds=0)
+
+        writer.submit("kim", "kim", {"step": 1})
+        time.sleep(0.05)
+        started = time.monotonic()
+        writer.submit("kim", "kim", {"step": 2})
+
+        assert time.monotonic() - started < 0.1
+        writer.flush(timeout=5)
+        assert saver.calls[-1] == ("kim", {"step": 2})
+        assert writer.status("kim")["state"] == STATUS_SAVED
+
+    def test_snapshot_is_isolated_from_session(self):
+        """스냅샷을 뜬 뒤 세션을 바꿔도 저장 내용이 바뀌지 않는지 테스트"""
+        session = {"drafts": {"1장": "처음"}, "parsed_toc": [{"title": "1장"}]}
+
+        snapshot = snapshot_session_data(session)
+        session["drafts"]["1장"] = "나중"
+        session["parsed_toc"].append({"title": "2장"})
+
+        assert snapshot == {"drafts": {"1장": "처음"}, "parsed_toc": [{"title": "1장"}]}
@@ -0,0 +1,134 @@
+"""
+백업 목록 인덱스 테스트
+========================
+백업 메타 정보 추가/정리/조회와 처음 한 번 채우기 단위 테스트
+
+실행 방법:
+    pytest tests/test_backup_manifest.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.backup_manifest import BackupManifest, ensure_manifest
+
+
+def make_entry(filename, student_key="홍길동", modified_time=1.0, **fields):
+    entry = {
+        "filename": filename,
+        "student_key": student_key,
+        "student_name": student_key,
+        "saved_at": "2026-01-01T00:00:00",
+        "selected_title": "나의 첫 책",
+        "current_step": 4,
+        "drafts_count": 2,
+        "total_chars": 1200,
+        "file_size": 2048,
+        "modified_time": modified_time,
+        "is_journal": False,
+    }
+    entry.update(fields)
+    return entry
+
+
+class TestManifestQueries:
+    """목록 조회 테스트"""
+
+    def test_list_is_newest_first(self, tmp_path):
+        """최신순으로 돌려주고 limit을 지키는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        for name, mtime in (("a.json", 1.0), ("b.json", 3.0), ("c.json", 2.0)):
+            manifest.upsert(make_entry(name, modified_time=mtime))
+
+        assert [row["filename"] for row in manifest.list()] == ["b.json", "c.json", "a.json"]
+        assert [row["filename"] for row in manifest.list(limit=1)] == ["b.json"]
+        assert manifest.latest()["filename"] == "b.json"
+        assert manifest.count() == 3
+
+    def test_student_filter_is_exact(self, tmp_path):
+        """학생 이름이 앞부분만 같은 다른 학생의 백업은 섞이지 않는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        manifest.upsert(make_entry("kim_1.json", student_key="kim"))
+        manifest.upsert(make_entry("kimchi_1.json", student_key="kimchi"))
+        manifest.upsert(make_entry("kim.journal", student_key="kim", is_journal=True))
+
+        assert {row["filename"] for row in manifest.list(student_key="kim")} == {"kim_1.json", "kim.journal"}
+        assert [row["filename"] for row in manifest.list(student_key="kim", include_journals=False)] == ["kim_1.json"]
+
+    def test_upsert_replaces_row(self, tmp_path):
+        """같은 파일을 다시 저장하면 행 하나만 갱신되는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        manifest.upsert(make_entry("kim.journal", is_journal=True, drafts_count=1))
+        manifest.upsert(make_entry("kim.journal", is_journal=True, drafts_count=5, modified_time=9.0))
+
+        rows = manifest.list()
+        assert len(rows) == 1
+        assert rows[0]["drafts_count"] == 5
+        assert rows[0]["is_journal"] == 1
+
+
+class TestManifestUpdates:
+    """추가/정리 테스트"""
+
+    def test_upsert_removes_cleaned_rows(self, tmp_path):
+        """새 백업 추가와 오래된 백업 행 삭제가 함께 반영되는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        manifest.upsert(make_entry("old.json", modified_time=1.0))
+
+        manifest.upsert(make_entry("new.json", modified_time=2.0), remove=["old.json"])
+
+        assert [row["filename"] for row in manifest.list()] == ["new.json"]
+
+    def test_remove_missing_is_ignored(self, tmp_path):
+        """없는 파일을 지워도 오류가 없는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        manifest.remove(["nothing.json"])
+
+        assert manifest.count() == 0
+
+
+class TestEnsureManifest:
+    """처음 한 번 채우기 테스트"""
+
+    def test_scans_only_once(self, tmp_path):
+        """기존 백업은 처음 한 번만 훑고 이후에는 인덱스만 쓰는지 테스트"""
+        path = tmp_path / "manifest.sqlite3"
+        scans = []
+
+        def scan():
+            scans.append(1)
+            return [make_entry("a.json"), make_entry("b.json", modified_time=2.0)]
+
+        ensure_manifest(BackupManifest(path), scan)
+        manifest = ensure_manifest(BackupManifest(path), scan)
+
+        assert len(scans) == 1
+        assert manifest.latest()["filename"] == "b.json"
+
+    def test_empty_scan_is_still_built(self, tmp_path):
+        """백업이 하나도 없어도 다시 훑지 않는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        ensure_manifest(manifest, lambda: [])
+
+        assert manifest.is_built()
+        assert manifest.list() == []
+
+    def test_catch_up_adds_only_missing_entries(self, tmp_path):
+        """이미 만든 인덱스에는 빠진 백업만 열어서 추가하는지 테스트"""
+        manifest = BackupManifest(tmp_path / "manifest.sqlite3")
+        ensure_manifest(manifest, lambda: [make_entry("a.json")])
+        seen = []
+
+        def catch_up(indexed):
+            seen.append(set(indexed))
+            return [make_entry(name, modified_time=2.0) for name in ("a.json", "b.json") if name not in indexed]
+
+        ensure_manifest(manifest, lambda: [], catch_up)
+        assert seen == []  # 간격 안에서는 다시 찾지 않음
+
+        ensure_manifest(manifest, lambda: [], catch_up, force=True)
+        assert seen == [{"a.json"}]
+        assert [row["filename"] for row in manifest.list()] == ["b.json", "a.json"]
@@ -0,0 +1,149 @@
+"""
+초안 일괄 생성(Message Batches) 테스트
+=======================================
+실제 API 대신 로컬 가짜 배치 엔드포인트로 제출 → 폴링 → 결과 반영 흐름 테스트
+
+실행 방법:
+    pytest tests/test_batch_handler.py -v
+"""
+
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import batch_handler
+from utils.batch_handler import (
+    apply_batch_results,
+    build_draft_requests,
+    check_draft_batch,
+    start_batch_poller,
+    submit_draft_batch,
+)
+
+
+BOOK_INFO = {"name": "홍길동", "topic": "글쓰기", "target_reader": "직장인", "core_message": "매일 쓰기", "title": "쓰는 습관"}
+
+
+def make_sections(count):
+    return [
+        (f"{i}_꼭지 {i}", {
+            "part_number": 1,
+            "part_title": "시작",
+            "section_number": str(i),
+            "section_title": f"꼭지 {i}",
+            "core_message": "",
+            "examples": "",
+        })
+        for i in range(1, count + 1)
+    ]
+
+
+class FakeBatches:
+    """messages.batches 가짜 엔드포인트 (retrieve를 ready_after번 호출하면 완료)"""
+    def __init__(self, ready_after=1, fail_ids=()):
+        self.ready_after = ready_after
+        self.fail_ids = set(fail_ids)
+        self.submitted = None
+        self.retrieve_calls = 0
+
+    def create(self, requests):
+        self.submitted = requests
+        return SimpleNamespace(id="msgbatch_test")
+
+    def retrieve(self, batch_id):
+        self.retrieve_calls += 1
+        done = self.retrieve_calls >= self.ready_after
+        total = len(self.submitted)
+        return SimpleNamespace(
+            id=batch_id,
+            processing_status="ended" if done else "in_progress",
+            request_counts=SimpleNamespace(
+                processing=0 if done else total,
+                succeeded=total - len(self.fail_ids) if done else 0,
+                errored=len(self.fail_ids) if done else 0,
+            ),
+        )
+
+    def results(self, batch_id):
+        for request in self.submitted:
+            custom_id = request["custom_id"]
+            if custom_id in self.fail_ids:
+                result = SimpleNamespace(type="errored")
+            else:
+                message = SimpleNamespace(content=[SimpleNamespace(text=f"초안 {custom_id}")])
+                result = SimpleNamespace(type="succeeded", message=message)
+            yield SimpleNamespace(custom_id=custom_id, result=result)
+
+
+class FakeClient:
+    def __init__(self, **kwargs):
+        self.messages = SimpleNamespace(batches=FakeBatches(**kwargs))
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    batch_handler._batch_results.clear()
+    batch_handler._pollers.clear()
+    yield
+    batch_handler._batch_results.clear()
+
+
+class TestBuildRequests:
+    """배치 요청 생성 테스트"""
+
+    def test_custom_ids_are_ascii_and_mapped(self):
+        requests, id_map = build_draft_requests(BOOK_INFO, make_sections(3))
+
+        assert [r["custom_id"] for r in requests] == ["section-0", "section-1", "section-2"]
+        assert id_map["section-1"] == "2_꼭지 2"
+        assert requests[0]["params"]["model"] == batch_handler.MODELS["haiku"]
+        assert "꼭지 1" in requests[0]["params"]["messages"][0]["content"]
+
+
+class TestBatchFlow:
+    """제출 → 확인 → 반영 흐름 테스트"""
+
+    def test_submit_returns_persistable_job(self):
+        client = FakeClient()
+        job = submit_draft_batch(BOOK_INFO, make_sections(2), client=client)
+
+        assert job["batch_id"] == "msgbatch_test"
+        assert set(job["sections"].values()) == {"1_꼭지 1", "2_꼭지 2"}
+        assert len(client.messages.batches.submitted) == 2
+
+    def test_check_collects_successes_and_failures(self):
+        client = FakeClient(fail_ids={"section-1"})
+        job = submit_draft_batch(BOOK_INFO, make_sections(3), client=client)
+        result = check_draft_batch(job, client)
+
+        assert result["status"] == "ended"
+        assert result["drafts"]["1_꼭지 1"] == "초안 section-0"
+        assert result["failed"] == ["2_꼭지 2"]
+
+    def test_background_poller_fills_drafts(self):
+        client = FakeClient(ready_after=3)
+        job = submit_draft_batch(BOOK_INFO, make_sections(2), client=client)
+        assert start_batch_poller(job, client=client, interval=0.01)
+
+        drafts = {"1_꼭지 1": "이미 쓴 글"}
+        applied = None
+        for _ in range(100):
+            applied = apply_batch_results(job, drafts)
+            if applied is not None:
+                break
+            time.sleep(0.01)
+
+        assert applied == {"added": ["2_꼭지 2"], "failed": []}
+        assert drafts["1_꼭지 1"] == "이미 쓴 글"  # 직접 쓴 글은 덮어쓰지 않음
+        assert drafts["2_꼭지 2"] == "초안 section-1"
+        assert client.messages.batches.retrieve_calls == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
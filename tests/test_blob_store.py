@@ -0,0 +1,161 @@
+"""
+백업 내용 저장소 테스트
+========================
+초안/자막 본문 blob 저장, 참조 복원, 백업 간 공유와 정리 단위 테스트
+
+실행 방법:
+    pytest tests/test_blob_store.py -v
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.autosave_handler as autosave_handler
+import utils.blob_store as blob_store
+from utils.backup_manifest import BackupManifest
+from utils.blob_store import BlobStore, collect_blob_refs, externalize_blobs, is_blob_ref, resolve_blobs
+
+
+def blob_files(directory):
+    return sorted(path for path in Path(directory).rglob("*") if path.is_file())
+
+
+class TestExternalize:
+    """참조로 바꾸기/복원 테스트"""
+
+    def test_round_trip(self, tmp_path, make_state):
+        """참조로 바꾼 데이터를 복원하면 원래와 같은지 테스트"""
+        store = BlobStore(tmp_path / "blobs")
+        state = make_state({"1장": "긴 초안 " * 100, "2장": "짧음"})
+
+        stored, refs = externalize_blobs(state, store)
+
+        assert is_blob_ref(stored["drafts"]["1장"])
+        assert stored["drafts"]["2장"] == "짧음"
+        assert is_blob_ref(stored["youtube_transcripts"]["abc"])
+        assert is_blob_ref(stored["youtube_merged_transcript"])
+        assert collect_blob_refs(stored) == refs and len(refs) == 3
+        assert resolve_blobs(stored, store) == state
+
+    def test_unchanged_sections_are_shared(self, tmp_path, make_state):
+        """안 바뀐 꼭지는 같은 blob을 쓰고 바뀐 꼭지만 새로 저장하는지 테스트"""
+        store = BlobStore(tmp_path / "blobs")
+        drafts = {f"{i}장": f"{i}장 초안 " * 100 for i in range(40)}
+
+        externalize_blobs(make_state(drafts), store)
+        before = len(blob_files(store.directory))
+        drafts["7장"] = "고친 초안 " * 100
+        externalize_blobs(make_state(drafts), store)
+
+        assert len(blob_files(store.directory)) == before + 1
+
+    def test_blobs_are_compressed(self, tmp_path):
+        """blob 파일이 원문보다 작게 저장되는지 테스트"""
+        store = BlobStore(tmp_path / "blobs")
+        text = "같은 문장이 반복되는 긴 초안입니다. " * 200
+
+        digest = store.put(text)
+
+        assert store.path(digest).stat().st_size < len(text.encode("utf-8")) / 5
+        assert store.get(digest) == text
+
+    def test_missing_blob_drops_only_that_section(self, tmp_path, make_state):
+        """blob이 없어진 꼭지만 빠지고 나머지는 복원되는지 테스트"""
+        store = BlobStore(tmp_path / "blobs")
+        stored, _ = externalize_blobs(make_state({"1장": "하나 " * 100, "2장": "둘 " * 100}), store)
+        store.path(stored["drafts"]["1장"]["$blob"]).unlink()
+
+        restored = resolve_blobs(stored, store)
+
+        assert list(restored["drafts"]) == ["2장"]
+
+    def test_delete_skips_recent_blobs(self, tmp_path):
+        """방금 쓰인 blob은 유예 시간 동안 지우지 않는지 테스트"""
+        store = BlobStore(tmp_path / "blobs")
+        digest = store.put("내용 " * 100)
+
+        assert store.delete([digest]) == 0
+        assert store.delete([digest], grace_seconds=0) == 1
+        assert not store.path(digest).exists()
+
+
+class TestAutosaveBlobs:
+    """수동 백업 파일과 blob 정리 테스트"""
+
+    @pytest.fixture
+    def autosave(self, monkeypatch, tmp_path):
+        """임시 디렉토리에 파일 백엔드로 저장"""
+        names = iter(f"홍길동_202601{i:02d}_000000.json" for i in range(1, 32))
+        monkeypatch.setattr(autosave_handler, "AUTOSAVE_DIR", tmp_path)
+        monkeypatch.setattr(autosave_handler, "JOURNAL_DIR", tmp_path / "journal")
+        monkeypatch.setattr(autosave_handler, "_manifest", BackupManifest(tmp_path / "manifest.sqlite3"))
+        monkeypatch.setattr(autosave_handler, "_blob_store", BlobStore(tmp_path / "blobs"))
+        monkeypatch.setattr(autosave_handler, "get_storage", lambda: None)
+        monkeypatch.setattr(autosave_handler, "generate_save_filename", lambda student_name: next(names))
+        monkeypatch.setattr(blob_store, "BLOB_GC_GRACE_SECONDS", 0)
+        return autosave_handler
+
+    def test_backup_references_blobs_and_loads_back(self, autosave, monkeypatch, make_state):
+        """백업 파일에는 참조만 남고 불러오면 본문이 채워지는지 테스트"""
+        state = make_state({"1장": "초안 " * 300})
+        monkeypatch.setattr(autosave, "get_session_data", lambda: dict(state))
+
+        autosave.save_progress("홍길동", is_autosave=False)
+
+        raw = json.loads((autosave.AUTOSAVE_DIR / "홍길동_20260101_000000.json").read_text(encoding="utf-8"))
+        assert is_blob_ref(raw["drafts"]["1장"])
+        loaded = autosave.load_backup("홍길동_20260101_000000.json")
+        assert loaded["drafts"] == state["drafts"]
+        assert loaded["youtube_merged_transcript"] == state["youtube_merged_transcript"]
+
+    def test_rotated_backups_release_unused_blobs(self, autosave, monkeypatch, make_state):
+        """오래된 백업을 정리하면 남은 백업이 안 쓰는 blob만 지워지는지 테스트"""
+        drafts = {"1장": "공통 초안 " * 100}
+        for i in range(autosave.MAX_BACKUPS + 2):
+            drafts["2장"] = f"{i}번째 고친 초안 " * 100
+            snapshot = make_state(dict(drafts))
+            monkeypatch.setattr(autosave, "get_session_data", lambda snapshot=snapshot: dict(snapshot))
+            autosave.save_progress("홍길동", is_autosave=False)
+
+        backups = autosave.get_student_backups("홍길동")
+        assert len(backups) == autosave.MAX_BACKUPS
+        # 공통 초안, 자막 2개 + 남은 백업마다 고친 초안 1개
+        assert len(blob_files(autosave._blob_store.directory)) == 3 + autosave.MAX_BACKUPS
+        for backup in backups:
+            assert autosave.load_backup(backup["filename"])["drafts"]["1장"] == drafts["1장"]
+
+    def test_index_failure_fails_the_save(self, autosave, monkeypatch, make_state):
+        """인덱스에 못 올리면 백업 파일을 남기지 않고 저장 실패로 처리하는지 테스트"""
+        monkeypatch.setattr(autosave, "get_session_data", lambda: make_state({"1장": "초안 " * 300}))
+
+        def locked(*args, **kwargs):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(autosave._manifest, "upsert", locked)
+
+        assert autosave.save_progress("홍길동", is_autosave=False) is None
+        assert list(autosave.AUTOSAVE_DIR.glob("*.json")) == []
+
+    def test_unindexed_backup_keeps_its_blobs(self, autosave, monkeypatch, make_state):
+        """인덱스에 빠진 백업 파일도 정리 전에 참조가 채워져 blob이 지워지지 않는지 테스트"""
+        autosave.get_manifest()  # 인덱스를 만든 뒤에 밖에서 들어온 파일
+        # 가장 먼저 정리될 백업과 같은 초안 blob을 참조
+        orphan = make_state({"1장": "0번째 초안 " * 100})
+        stored, _ = externalize_blobs(orphan, autosave._blob_store)
+        (autosave.AUTOSAVE_DIR / "김철수_20251231_000000.json").write_text(json.dumps(stored, ensure_ascii=False), encoding="utf-8")
+
+        for i in range(autosave.MAX_BACKUPS + 1):
+            snapshot = make_state({"1장": f"{i}번째 초안 " * 100})
+            monkeypatch.setattr(autosave, "get_session_data", lambda snapshot=snapshot: dict(snapshot))
+            autosave.save_progress("홍길동", is_autosave=False)
+
+        loaded = autosave.load_backup("김철수_20251231_000000.json")
+        assert loaded["drafts"] == orphan["drafts"]
+        assert "김철수_20251231_000000.json" in {b["filename"] for b in autosave.get_all_backups()}
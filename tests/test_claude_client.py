@@ -0,0 +1,245 @@
+"""
+Claude 클라이언트 테스트
+=========================
+API 호출 없이 확인할 수 있는 claude_client 기능 단위 테스트
+
+실행 방법:
+    pytest tests/test_claude_client.py -v
+"""
+
+import threading
+import time
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.claude_client as claude_client
+from utils.claude_client import build_transcript_digest, generate_drafts_concurrently
+from utils.disk_cache import DiskCache
+
+
+class FakeStream:
+    """messages.stream() 컨텍스트 매니저 Mock"""
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def text_stream(self):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error:
+            raise self.error
+
+    def get_final_message(self):
+        return None
+
+
+class FakeClient:
+    """Anthropic 클라이언트 Mock (호출마다 준비된 스트림을 순서대로 반환)"""
+    def __init__(self, streams):
+        self.streams = list(streams)
+        self.calls = 0
+        self.messages = self
+
+    def stream(self, **kwargs):
+        self.calls += 1
+        return self.streams.pop(0)
+
+
+class TestConcurrentDraftGeneration:
+    """전체 자동 생성 동시 실행 테스트"""
+
+    def test_respects_max_concurrency(self):
+        """동시 요청 수가 제한을 넘지 않는지 테스트"""
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def fake_draft(book_info, section_info):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.02)
+            with lock:
+                state["in_flight"] -= 1
+            return f"초안 {section_info['section_number']}"
+
+        sections = [(f"{i}_제목", {"section_number": str(i)}) for i in range(12)]
+        results = dict(generate_drafts_concurrently({}, sections, max_concurrency=3, draft_fn=fake_draft))
+
+        assert len(results) == 12
+        assert results["5_제목"] == "초안 5"
+        assert state["peak"] <= 3
+
+    def test_failed_section_yields_none(self):
+        """실패한 꼭지는 None으로 반환되는지 테스트"""
+        def flaky_draft(book_info, section_info):
+            if section_info["section_number"] == "2":
+                raise RuntimeError("server error")
+            return "초안"
+
+        sections = [(f"{i}_제목", {"section_number": str(i)}) for i in range(4)]
+        results = dict(generate_drafts_concurrently({}, sections, max_concurrency=2, draft_fn=flaky_draft))
+
+        assert results["2_제목"] is None
+        assert results["1_제목"] == "초안"
+
+    def test_empty_sections(self):
+        """빈 목록 처리 테스트"""
+        assert list(generate_drafts_concurrently({}, [])) == []
+
+
+class TestStreaming:
+    """스트리밍 응답 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def isolated_cache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(claude_client, "_response_cache", DiskCache(tmp_path / "cache.sqlite3"))
+        monkeypatch.setattr(claude_client, "RETRY_DELAY", 0)
+
+    def test_yields_chunks_and_caches_full_text(self):
+        client = FakeClient([FakeStream(["첫 ", "번째 ", "제목"])])
+        chunks = list(claude_client._stream_message(client, {}, cache_key="key"))
+
+        assert chunks == ["첫 ", "번째 ", "제목"]
+        assert claude_client._response_cache.get("key") == "첫 번째 제목"
+
+    def test_retries_before_first_token(self):
+        client = FakeClient([
+            FakeStream([], error=RuntimeError("connection reset")),
+            FakeStream(["성공"]),
+        ])
+        assert "".join(claude_client._stream_message(client, {}, show_errors=False)) == "성공"
+        assert client.calls == 2
+
+    def test_mid_stream_failure_is_not_cached(self):
+        client = FakeClient([FakeStream(["반쯤 "], error=RuntimeError("server error 500"))])
+        chunks = []
+        with pytest.raises(claude_client.StreamInterruptedError):
+            for chunk in claude_client._stream_message(client, {}, cache_key="key", show_errors=False):
+                chunks.append(chunk)
+
+        assert chunks == ["반쯤 "]
+        assert client.calls == 1
+        assert claude_client._response_cache.get("key") is None
+
+    def test_failure_after_chunks_is_reported(self):
+        """몇 조각을 받은 뒤 끊기면 받은 부분과 함께 예외를 알리는지 테스트"""
+        client = FakeClient([FakeStream(["제목 1\n", "제목 2\n", "제목 3"], error=RuntimeError("connection reset"))])
+
+        with pytest.raises(claude_client.StreamInterruptedError) as excinfo:
+            list(claude_client._stream_message(client, {}, show_errors=False))
+
+        assert excinfo.value.partial_text == "제목 1\n제목 2\n제목 3"
+        assert excinfo.value.error_type == "network"
+
+    def test_write_stream_returns_none_after_interruption(self, monkeypatch):
+        """중간에 끊긴 스트림은 저장할 결과(None)를 돌려주지 않는지 테스트"""
+        monkeypatch.setattr(claude_client.st, "write_stream", lambda stream: "".join(stream))
+        monkeypatch.setattr(claude_client.st, "warning", lambda message: None)
+        broken = FakeClient([FakeStream(["반쯤 ", "쓴 "], error=RuntimeError("server error 500"))])
+        complete = FakeClient([FakeStream(["전체 ", "응답"])])
+
+        assert claude_client.write_stream(claude_client._stream_message(broken, {}, show_errors=False)) is None
+        assert claude_client.write_stream(claude_client._stream_message(complete, {}, show_errors=False)) == "전체 응답"
+        assert claude_client.write_stream(None) is None
+
+
+
+class TestPromptCaching:
+    """프롬프트 캐시 요청 구성 테스트"""
+
+    def test_plain_request_unchanged(self):
+        assert claude_client._build_system("시스템") == "시스템"
+        assert claude_client._build_user_content("질문") == "질문"
+
+    def test_static_then_book_then_request_order(self):
+        system = claude_client._build_system("시스템", static_context="고정 지침")
+        content = claude_client._build_user_content("요청", book_context="책 정보")
+
+        assert [block["text"] for block in system] == ["시스템", "고정 지침"]
+        assert "cache_control" in system[-1] and "cache_control" not in system[0]
+        assert [block["text"] for block in content] == ["책 정보", "요청"]
+        assert "cache_control" in content[0] and "cache_control" not in content[1]
+
+    def test_history_cache_point_does_not_touch_original(self):
+        messages = [
+            {"role": "user", "content": "첫 질문"},
+            {"role": "assistant", "content": "첫 답변"},
+            {"role": "user", "content": "새 질문"},
+        ]
+        marked = claude_client._mark_history_cache_point(messages)
+
+        assert marked[1]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert marked[2]["content"] == "새 질문"
+        assert messages[1]["content"] == "첫 답변"
+
+    def test_usage_stats_include_cache_tokens(self, monkeypatch):
+        monkeypatch.setattr(claude_client, "_usage_stats", {field: 0 for field in claude_client.USAGE_STAT_FIELDS})
+        usage = type("Usage", (), {
+            "input_tokens": 100,
+            "output_tokens": 50,
+            "cache_read_input_tokens": 300,
+            "cache_creation_input_tokens": 0,
+        })()
+        claude_client._settle_usage("unknown-model", 0, usage)
+        stats = claude_client.get_usage_stats()
+
+        assert stats["requests"] == 1
+        assert stats["cache_read_input_tokens"] == 300
+        assert stats["cache_hit_ratio"] == pytest.approx(0.75)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
+
+
+class TestTranscriptDigest:
+    """긴 자막 map-reduce 요약 테스트"""
+
+    def test_short_transcript_unchanged(self):
+        """짧은 자막은 요약 없이 그대로 쓰는지 테스트"""
+        calls = []
+        transcript = "짧은 자막입니다. " * 10
+
+        assert build_transcript_digest(transcript, max_chars=1000, summarize_fn=calls.append) == transcript
+        assert calls == []
+
+    def test_covers_every_part_in_order(self):
+        """모든 Part가 순서대로 요약되고 결과가 한도 안에 들어오는지 테스트"""
+        lock = threading.Lock()
+        seen = []
+
+        def fake_summarize(chunk):
+            with lock:
+                seen.append(chunk)
+            return f"요약({chunk[:4]})"
+
+        transcript = "\n\n".join(
+            f"=== Part {n}: 강의 {n} ===\n\n" + f"{n}부 내용입니다. " * 2000 for n in range(1, 4)
+        )
+        digest = build_transcript_digest(transcript, max_chars=3000, summarize_fn=fake_summarize, max_concurrency=4)
+
+        assert len(digest) <= 3000
+        assert len(seen) > 3
+        assert digest.index("=== Part 1") < digest.index("=== Part 2") < digest.index("=== Part 3")
+        assert "요약(3부 내)" in digest
+
+    def test_failed_chunks_fall_back_to_excerpt(self):
+        """요약에 실패한 조각은 원문 일부로 대신하는지 테스트"""
+        transcript = "가나다라마바사. " * 3000
+        digest = build_transcript_digest(transcript, max_chars=5000, summarize_fn=lambda chunk: None)
+
+        assert digest.startswith("가나다라마바사.")
+        assert len(digest) <= 5000
+
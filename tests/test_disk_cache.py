@@ -0,0 +1,74 @@
+"""
+디스크 캐시 테스트
+===================
+TTL 만료, LRU 용량 정리, 캐시 키 생성 단위 테스트
+
+실행 방법:
+    pytest tests/test_disk_cache.py -v
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.disk_cache import DiskCache, make_cache_key
+
+
+class TestCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_inputs_same_key(self):
+        assert make_cache_key("opus", "시스템", 4096, "프롬프트") == make_cache_key("opus", "시스템", 4096, "프롬프트")
+
+    def test_any_input_change_changes_key(self):
+        base = make_cache_key("opus", "시스템", 4096, "프롬프트")
+        assert make_cache_key("haiku", "시스템", 4096, "프롬프트") != base
+        assert make_cache_key("opus", None, 4096, "프롬프트") != base
+        assert make_cache_key("opus", "시스템", 2048, "프롬프트") != base
+        assert make_cache_key("opus", "시스템", 4096, "프롬프트 ") != base
+
+
+class TestDiskCache:
+    """SQLite 디스크 캐시 테스트"""
+
+    def test_roundtrip(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite3")
+        assert cache.get("missing") is None
+        assert cache.set("k", "한글 응답")
+        assert cache.get("k") == "한글 응답"
+
+    def test_shared_between_instances(self, tmp_path):
+        """다른 인스턴스(다른 세션)에서도 같은 파일을 공유하는지 테스트"""
+        DiskCache(tmp_path / "cache.sqlite3").set("k", {"a": 1})
+        assert DiskCache(tmp_path / "cache.sqlite3").get("k") == {"a": 1}
+
+    def test_ttl_expiry(self, tmp_path):
+        cache = DiskCache(tmp_path / "cache.sqlite3", ttl_seconds=0.05)
+        cache.set("k", "값")
+        time.sleep(0.1)
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        """용량 초과 시 오래 안 쓴 항목부터 삭제되는지 테스트"""
+        import os
+        cache = DiskCache(tmp_path / "cache.sqlite3", max_bytes=3500)
+        # 압축이 거의 안 되는 1KB 값
+        for key in ["a", "b"]:
+            cache.set_bytes(key, os.urandom(1000))
+        time.sleep(0.01)
+        cache.get_bytes("a")  # a를 최근 사용으로 갱신
+        cache.set_bytes("c", os.urandom(1000))
+        cache.set_bytes("d", os.urandom(1000))
+
+        assert cache.get_bytes("b") is None
+        assert cache.get_bytes("a") is not None
+        assert cache.total_bytes() <= 3500
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,83 @@
+"""
+초안 통계 인덱스 테스트
+========================
+DraftStore 증분 글자 수 집계 단위 테스트
+
+실행 방법:
+    pytest tests/test_draft_stats.py -v
+"""
+
+import copy
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.draft_stats import DraftStore, count_chars, ensure_draft_store
+
+
+def full_recount(drafts):
+    return sum(count_chars(d) for d in drafts.values())
+
+
+class TestDraftStore:
+    """증분 집계 테스트"""
+
+    def test_matches_full_recount_after_mutations(self):
+        drafts = DraftStore({"1_a": "가나 다\n라"})
+        drafts["2_b"] = "마바사"
+        drafts["1_a"] = "가나다라마바"
+        drafts.update({"3_c": "아자 차"})
+        drafts.setdefault("4_d", "카타")
+        drafts.pop("2_b")
+        del drafts["3_c"]
+
+        assert drafts.total_chars == full_recount(drafts) == 8
+        assert drafts.section_chars("1_a") == 6
+        assert drafts.section_chars("없는 꼭지") == 0
+
+    def test_unchanged_content_not_recounted(self, monkeypatch):
+        drafts = DraftStore({"1_a": "가" * 2000})
+        calls = []
+        monkeypatch.setattr("utils.draft_stats.count_chars", lambda text: calls.append(text) or 0)
+
+        drafts["1_a"] = drafts["1_a"]
+        assert calls == []
+        assert drafts.total_chars == 2000
+
+    def test_clear_and_copy(self):
+        drafts = DraftStore({"1_a": "가나다"})
+        clone = copy.deepcopy(drafts)
+        drafts.clear()
+
+        assert drafts.total_chars == 0
+        assert clone.total_chars == 3
+        assert drafts.copy().total_chars == 0
+
+    def test_serializes_as_plain_dict(self):
+        drafts = DraftStore({"1_a": "가나다"})
+        assert json.loads(json.dumps(drafts, ensure_ascii=False)) == {"1_a": "가나다"}
+
+
+class TestEnsureDraftStore:
+    """세션 drafts 변환 테스트"""
+
+    def test_converts_plain_dict_once(self):
+        state = {"drafts": {"1_a": "가나다", "2_b": "라마"}}
+        store = ensure_draft_store(state)
+
+        assert isinstance(state["drafts"], DraftStore)
+        assert store.total_chars == 5
+        assert ensure_draft_store(state) is store
+
+    def test_invalid_drafts_replaced(self):
+        state = {"drafts": None}
+        assert ensure_draft_store(state).total_chars == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+"""
+API 클라이언트 공유 테스트
+===========================
+클라이언트 재사용, 스레드 안전성, 연결 풀 설정 단위 테스트
+
+실행 방법:
+    pytest tests/test_http_pool.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import http_pool
+from utils.http_pool import build_http_client, get_shared_client, reset_shared_clients
+
+
+class FakeClient:
+    """close()만 있는 클라이언트 Mock"""
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    reset_shared_clients()
+    yield
+    reset_shared_clients()
+
+
+class TestSharedClient:
+    """공유 클라이언트 레지스트리 테스트"""
+
+    def test_same_key_reuses_client(self):
+        first = get_shared_client("anthropic", "key-1", FakeClient)
+        assert get_shared_client("anthropic", "key-1", FakeClient) is first
+
+    def test_different_key_or_name_creates_new_client(self):
+        base = get_shared_client("anthropic", "key-1", FakeClient)
+        assert get_shared_client("anthropic", "key-2", FakeClient) is not base
+        assert get_shared_client("openai", "key-1", FakeClient) is not base
+
+    def test_concurrent_first_use_creates_once(self):
+        """여러 스레드가 동시에 처음 요청해도 한 번만 생성되는지 테스트"""
+        created = []
+
+        def slow_factory():
+            time.sleep(0.02)
+            client = FakeClient()
+            created.append(client)
+            return client
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_shared_client("anthropic", "k", slow_factory)))
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(client is created[0] for client in results)
+
+    def test_reset_closes_clients(self):
+        client = get_shared_client("anthropic", "k", FakeClient)
+        reset_shared_clients()
+        assert client.closed
+        assert get_shared_client("anthropic", "k", FakeClient) is not client
+
+
+class TestPoolSettings:
+    """연결 풀 설정 테스트"""
+
+    def test_limits_and_timeout_passed_to_http_client(self):
+        captured = {}
+
+        def fake_http_client(**kwargs):
+            captured.update(kwargs)
+            return FakeClient()
+
+        settings = dict(http_pool.DEFAULT_POOL_SETTINGS, API_POOL_MAX_CONNECTIONS=7, API_CONNECT_TIMEOUT=3.0)
+        build_http_client(fake_http_client, settings)
+
+        assert captured["limits"].max_connections == 7
+        assert captured["timeout"].connect == 3.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
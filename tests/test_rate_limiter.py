@@ -0,0 +1,122 @@
+"""
+요청 속도 제한 테스트
+======================
+토큰 버킷, 세션 간 공평 대기열, 백오프 계산 단위 테스트
+
+실행 방법:
+    pytest tests/test_rate_limiter.py -v
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rate_limiter import RequestScheduler, TokenBucket, backoff_delay, get_retry_after
+
+
+class FakeClock:
+    """수동으로 시간을 넘기는 시계"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class FakeAPIError(Exception):
+    def __init__(self, headers):
+        super().__init__("Error code: 429")
+        self.response = FakeResponse(headers)
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트"""
+
+    def test_refills_over_time(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock=clock)  # 초당 1개
+        bucket.consume(60)
+        assert bucket.wait_time(1) == pytest.approx(1.0)
+
+        clock.now = 2.0
+        assert bucket.wait_time(2) == 0
+
+    def test_refund_capped_at_capacity(self):
+        bucket = TokenBucket(100, clock=FakeClock())
+        bucket.consume(10)
+        bucket.refund(50)
+        assert bucket.tokens == 100
+
+
+class TestRequestScheduler:
+    """요청 스케줄러 테스트"""
+
+    def test_token_limit_blocks_until_timeout(self):
+        scheduler = RequestScheduler({"m": {"rpm": 100, "tpm": 1000}})
+        assert scheduler.acquire("m", 1000, "a")
+        assert not scheduler.acquire("m", 1000, "a", timeout=0.05)
+
+    def test_usage_refund_frees_tokens(self):
+        scheduler = RequestScheduler({"m": {"rpm": 100, "tpm": 1000}})
+        assert scheduler.acquire("m", 1000, "a")
+        scheduler.record_usage("m", 1000, 100)
+        assert scheduler.acquire("m", 800, "b", timeout=0.05)
+
+    def test_unknown_model_not_limited(self):
+        scheduler = RequestScheduler({})
+        assert all(scheduler.acquire("other", 10 ** 9, "a") for _ in range(5))
+
+    def test_sessions_served_round_robin(self):
+        """한 세션이 요청을 몰아 보내도 다른 세션이 중간에 끼어드는지 테스트"""
+        scheduler = RequestScheduler({"m": {"rpm": 600, "tpm": 10 ** 6, "burst": 1}})
+        scheduler.pause("m", 0.2)
+        order = []
+
+        def request(session, name):
+            scheduler.acquire("m", 1, session)
+            order.append(name)
+
+        threads = []
+        for session, name in [("a", "a1"), ("a", "a2"), ("a", "a3"), ("b", "b1")]:
+            thread = threading.Thread(target=request, args=(session, name))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.02)  # 대기열에 들어가는 순서 고정
+        for thread in threads:
+            thread.join()
+
+        assert order == ["a1", "b1", "a2", "a3"]
+
+
+class TestBackoff:
+    """재시도 대기 시간 테스트"""
+
+    def test_jitter_within_exponential_bound(self):
+        for attempt in range(4):
+            delay = backoff_delay(attempt, 1.0)
+            assert 0 <= delay <= 2 ** attempt
+
+    def test_retry_after_is_respected(self):
+        assert backoff_delay(0, 1.0, retry_after=7) >= 7
+        assert backoff_delay(0, 1.0, retry_after=1000) <= 60
+
+    def test_parse_retry_after_headers(self):
+        assert get_retry_after(FakeAPIError({"retry-after": "12"})) == 12
+        assert get_retry_after(FakeAPIError({"retry-after-ms": "1500"})) == 1.5
+        assert get_retry_after(FakeAPIError({})) is None
+        assert get_retry_after(RuntimeError("no response")) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,139 @@
+"""
+목차-영상 구간 정렬 테스트
+===========================
+타임스탬프 자막과 목차 꼭지를 맞추는 section_alignment 단위 테스트
+
+실행 방법:
+    pytest tests/test_section_alignment.py -v
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.section_alignment import (
+    SectionAlignment,
+    align_sections,
+    build_windows,
+    get_section_alignment,
+)
+
+
+TOPICS = ["복리 투자", "글쓰기 습관", "시간 관리", "마케팅 전략"]
+
+
+def make_segments(topics=TOPICS, per_topic=40, step=5.0):
+    """주제마다 per_topic개 자막 구간 (세 번에 한 번 주제어 등장)"""
+    segments = []
+    t = 0.0
+    for topic in topics:
+        for j in range(per_topic):
+            text = f"{topic} 이야기 {j}" if j % 3 == 0 else "음 그러니까 말이죠"
+            segments.append({"start": t, "duration": step, "text": text})
+            t += step
+    return segments
+
+
+def make_toc(topics=TOPICS, part=1):
+    return [
+        {"part": part, "part_title": f"Part {part}", "section_num": f"{part}-{i + 1}", "section_title": f"{topic}의 비밀"}
+        for i, topic in enumerate(topics)
+    ]
+
+
+class TestBuildWindows:
+    """시간 창 묶기 테스트"""
+
+    def test_groups_segments_by_time(self):
+        """구간이 시간 창 단위로 묶이고 시작/끝 시각이 유지되는지 테스트"""
+        windows = build_windows(make_segments(per_topic=12), window_seconds=30)
+
+        assert windows[0][0] == 0.0
+        assert windows[0][1] == 30.0
+        assert windows[-1][1] == 4 * 12 * 5.0
+        assert len(windows) == 8
+
+
+class TestAlignSections:
+    """꼭지 순서 정렬 테스트"""
+
+    def test_sections_land_on_their_topics(self):
+        """꼭지가 제목과 같은 주제를 말하는 구간에 배치되는지 테스트"""
+        windows = build_windows(make_segments())
+        ranges = align_sections([f"{topic}의 비밀" for topic in TOPICS], windows)
+
+        for (first, last), topic in zip(ranges, TOPICS):
+            text = " ".join(window[2] for window in windows[first:last])
+            assert topic in text
+
+    def test_ranges_are_ordered_and_cover_video(self):
+        """제목과 무관해도 구간이 순서대로 영상 전체를 덮는지 테스트"""
+        windows = build_windows(make_segments())
+        ranges = align_sections(["가", "나", "다"], windows)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(windows)
+        assert all(ranges[i][1] <= ranges[i + 1][0] + 1 for i in range(len(ranges) - 1))
+
+
+class TestSectionAlignment:
+    """구간 인덱스 테스트"""
+
+    def test_span_and_reverse_lookup(self):
+        """꼭지 → 구간, 시각 → 꼭지 조회 테스트"""
+        toc = make_toc()
+        alignment = SectionAlignment(toc, ["vid1"], {"vid1": make_segments()})
+
+        span = alignment.span_for("1-2_글쓰기 습관의 비밀")
+        assert span["video_id"] == "vid1"
+        assert span["start"] < span["end"]
+        assert "글쓰기 습관" in span["text"]
+        assert alignment.section_at("vid1", span["start"] + 1) == "1-2_글쓰기 습관의 비밀"
+
+    def test_parts_map_to_videos(self):
+        """영상 수와 Part 수가 같으면 Part별 영상에 배정되는지 테스트"""
+        toc = make_toc(TOPICS[:2], part=1) + make_toc(TOPICS[2:], part=2)
+        segments = {"vid1": make_segments(TOPICS[:2]), "vid2": make_segments(TOPICS[2:])}
+        alignment = SectionAlignment(toc, ["vid1", "vid2"], segments, [1, 2])
+
+        assert alignment.span_for("1-1_복리 투자의 비밀")["video_id"] == "vid1"
+        assert alignment.span_for("2-2_마케팅 전략의 비밀")["video_id"] == "vid2"
+
+    def test_missing_timestamps_fall_back(self):
+        """타임스탬프가 없는 영상의 꼭지는 구간이 없는지 테스트"""
+        toc = make_toc(TOPICS[:2], part=1) + make_toc(TOPICS[2:], part=2)
+        alignment = SectionAlignment(toc, ["vid1", "vid2"], {"vid1": make_segments(TOPICS[:2])}, [1, 2])
+
+        assert alignment.span_for("1-1_복리 투자의 비밀") is not None
+        assert alignment.span_for("2-1_시간 관리의 비밀") is None
+
+
+class TestGetSectionAlignment:
+    """세션 보관 정렬 재사용 테스트"""
+
+    def test_built_once_per_toc(self):
+        """같은 목차/영상이면 타임스탬프를 다시 읽지 않는지 테스트"""
+        calls = []
+
+        def segments_fn(video_id):
+            calls.append(video_id)
+            return make_segments(), "한국어"
+
+        state = {"parsed_toc": make_toc(), "youtube_transcripts": {"vid1": {"part_number": 1}}}
+        first = get_section_alignment(state, segments_fn)
+        second = get_section_alignment(state, segments_fn)
+
+        assert first is second
+        assert calls == ["vid1"]
+
+        state["parsed_toc"] = make_toc()
+        get_section_alignment(state, segments_fn)
+        assert len(calls) == 2
+
+    def test_none_without_timestamps(self):
+        """타임스탬프를 못 가져오면 None을 돌려주는지 테스트"""
+        state = {"parsed_toc": make_toc(), "youtube_transcripts": {"vid1": {"part_number": 1}}}
+
+        assert get_section_alignment(state, lambda video_id: (None, "자막 없음")) is None
@@ -0,0 +1,150 @@
+"""
+한국어 문장 분리 테스트
+========================
+sentence_segmenter 단위 테스트 + 20만 자 자막 성능 비교
+
+실행 방법:
+    pytest tests/test_sentence_segmenter.py -v
+    python tests/test_sentence_segmenter.py   # 성능 비교 결과 출력
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.sentence_segmenter import chunk_text, iter_sentence_spans, split_sentences
+from utils.youtube_handler import chunk_transcript
+
+
+ASR_SAMPLE = (
+    "오늘은 복리에 대해 이야기할게요 그러니까 중요한 건 시간이에요 [00:12] "
+    "필요 없는 지출은 줄여야 합니다. 다 같이 해볼까요? 정말 그렇죠 "
+    "다음 시간에는 투자 이야기를 했다 "
+)
+
+
+def make_long_transcript(length: int = 200_000) -> str:
+    """길이 length의 자동 자막 형식 텍스트"""
+    repeat = length // len(ASR_SAMPLE) + 1
+    return (ASR_SAMPLE * repeat)[:length]
+
+
+def legacy_chunk(transcript: str, max_chars: int) -> list:
+    """이전 chunk_transcript 방식 (str.replace 3번 + split, += 누적) - 성능 비교용"""
+    chunks = []
+    sentences = transcript.replace('. ', '.|').replace('? ', '?|').replace('! ', '!|').split('|')
+    current_chunk = ""
+    for sentence in sentences:
+        if len(current_chunk) + len(sentence) <= max_chars:
+            current_chunk += sentence + " "
+        else:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            current_chunk = sentence + " "
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+def benchmark(length: int = 200_000, max_chars: int = 4000, rounds: int = 5) -> dict:
+    """20만 자 자막에서 문장 분리/청크 만들기 시간 측정 (초, 최솟값)"""
+    transcript = make_long_transcript(length)
+
+    def best_of(fn):
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+        return min(timings)
+
+    return {
+        "sentences": sum(1 for _ in iter_sentence_spans(transcript)),
+        "segment_seconds": best_of(lambda: sum(1 for _ in iter_sentence_spans(transcript))),
+        "chunk_seconds": best_of(lambda: chunk_text(transcript, max_chars)),
+        "chunk_overlap_seconds": best_of(lambda: chunk_text(transcript, max_chars, overlap=300)),
+        "legacy_chunk_seconds": best_of(lambda: legacy_chunk(transcript, max_chars)),
+    }
+
+
+class TestSentenceSpans:
+    """문장 위치 분리 테스트"""
+
+    def test_korean_endings_without_punctuation(self):
+        """마침표 없는 ~요/~죠/~다 어미에서 문장이 나뉘는지 테스트"""
+        sentences = split_sentences(ASR_SAMPLE)
+
+        assert sentences == [
+            "오늘은 복리에 대해 이야기할게요",
+            "그러니까 중요한 건 시간이에요",
+            "필요 없는 지출은 줄여야 합니다.",
+            "다 같이 해볼까요?",
+            "정말 그렇죠",
+            "다음 시간에는 투자 이야기를 했다",
+        ]
+
+    def test_spans_are_offsets_into_text(self):
+        """반환값이 원문 위치이고 타임스탬프는 문장에서 빠지는지 테스트"""
+        text = "(01:02:03) 첫 문장입니다\n[00:15] 두 번째예요"
+        spans = list(iter_sentence_spans(text))
+
+        assert [text[s:e] for s, e in spans] == ["첫 문장입니다", "두 번째예요"]
+        assert spans[0][0] == text.index("첫")
+
+    def test_long_sentence_split_on_whitespace(self):
+        """max_chars보다 긴 문장은 공백에서 나뉘는지 테스트"""
+        text = " ".join(["가나다라마"] * 50)
+        pieces = split_sentences(text, max_chars=40)
+
+        assert all(len(piece) <= 40 for piece in pieces)
+        assert " ".join(pieces) == text
+
+
+class TestChunkText:
+    """청크 만들기 테스트"""
+
+    def test_chunks_respect_limit_and_keep_text(self):
+        """청크가 한도를 넘지 않고 모든 문장을 순서대로 담는지 테스트"""
+        transcript = make_long_transcript(20_000)
+        chunks = chunk_text(transcript, 1000)
+
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert " ".join(chunks) == " ".join(split_sentences(transcript))
+
+    def test_overlap_repeats_previous_sentences(self):
+        """overlap을 주면 앞 청크 끝 문장이 다음 청크 앞에 다시 들어가는지 테스트"""
+        transcript = make_long_transcript(5_000)
+        chunks = chunk_text(transcript, 500, overlap=100)
+
+        for previous, current in zip(chunks, chunks[1:]):
+            assert len(current) <= 500
+            # 다음 청크는 앞 청크 끝 100자 안쪽의 문장들로 시작
+            first_sentence = split_sentences(current)[0]
+            assert first_sentence in previous[-(100 + len(first_sentence)):]
+
+    def test_chunk_transcript_uses_segmenter(self):
+        """chunk_transcript가 어미 기준으로 나누는지 테스트"""
+        chunks = chunk_transcript(make_long_transcript(3_000), max_chars=200)
+
+        assert all(len(chunk) <= 200 for chunk in chunks)
+        assert chunks[0].startswith("오늘은 복리에 대해 이야기할게요")
+
+
+class TestBenchmark:
+    """20만 자 자막 성능 테스트"""
+
+    def test_200k_transcript_is_fast(self):
+        """20만 자 자막 분리/청크가 충분히 빠른지 테스트 (선형 시간)"""
+        result = benchmark(rounds=1)
+
+        assert result["sentences"] > 10_000
+        assert result["segment_seconds"] < 1.0
+        assert result["chunk_seconds"] < 1.0
+
+
+if __name__ == "__main__":
+    for name, value in benchmark().items():
+        print(f"{name}: {value:.4f}" if isinstance(value, float) else f"{name}: {value}")
@@ -0,0 +1,120 @@
+"""
+세션 저널 테스트
+=================
+바뀐 항목만 덧붙이기, 압축(스냅샷), 복구(replay) 단위 테스트
+
+실행 방법:
+    pytest tests/test_session_journal.py -v
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.session_journal as session_journal
+from utils.session_journal import SessionJournal
+
+
+def read_records(journal):
+    return [json.loads(line) for line in journal.journal_path.read_text(encoding="utf-8").splitlines()]
+
+
+class TestJournalAppend:
+    """바뀐 항목만 기록하는지 테스트"""
+
+    def test_only_changed_sections_are_written(self, tmp_path, make_state):
+        """꼭지 하나를 고치면 그 꼭지만 기록되는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        drafts = {f"1-{i}_꼭지": "내용 " * 500 for i in range(10)}
+        journal.append(make_state(drafts))
+
+        drafts["1-3_꼭지"] = "고친 내용"
+        assert journal.append(make_state(drafts, saved_at="2026-01-01T00:05:00")) is True
+
+        last = read_records(journal)[-1]
+        assert last["sections"] == {"drafts": {"1-3_꼭지": "고친 내용"}}
+        assert "set" not in last
+        assert last["saved_at"] == "2026-01-01T00:05:00"
+
+    def test_unchanged_state_writes_nothing(self, tmp_path, make_state):
+        """저장 시각만 다르면 아무것도 쓰지 않는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        journal.append(make_state({"a": "가"}))
+        size = journal.journal_path.stat().st_size
+
+        assert journal.append(make_state({"a": "가"}, saved_at="2026-01-02T00:00:00")) is False
+        assert journal.journal_path.stat().st_size == size
+
+    def test_removed_sections_are_recorded(self, tmp_path, make_state):
+        """지운 꼭지가 복구에서도 빠지는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        journal.append(make_state({"a": "가", "b": "나"}))
+        journal.append(make_state({"a": "가"}))
+
+        restored = SessionJournal(tmp_path / "kim").load()
+
+        assert restored["drafts"] == {"a": "가"}
+
+
+class TestJournalReplay:
+    """스냅샷 + 저널 복구 테스트"""
+
+    def test_replay_matches_latest_state(self, tmp_path, monkeypatch, make_state):
+        """압축 전후로 여러 번 저장해도 최신 상태가 복구되는지 테스트"""
+        monkeypatch.setattr(session_journal, "COMPACT_MAX_RECORDS", 3)
+        journal = SessionJournal(tmp_path / "kim")
+        drafts = {}
+        for i in range(7):
+            drafts[f"꼭지{i}"] = f"내용 {i}"
+            journal.append(make_state(drafts, current_step=i + 1, saved_at=f"2026-01-01T00:0{i}:00"))
+
+        restored = SessionJournal(tmp_path / "kim").load()
+
+        assert restored["drafts"] == drafts
+        assert restored["current_step"] == 7
+        assert restored["saved_at"] == "2026-01-01T00:06:00"
+        assert journal.snapshot_path.exists()
+        assert len(read_records(journal)) == 1
+
+    def test_torn_last_line_is_ignored(self, tmp_path, make_state):
+        """쓰다 만 마지막 줄은 무시하고 잘라내는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        journal.append(make_state({"a": "가"}))
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 2, "set": {"selected_')
+
+        reopened = SessionJournal(tmp_path / "kim")
+        assert reopened.load()["drafts"] == {"a": "가"}
+
+        reopened.append(make_state({"a": "가", "b": "나"}))
+        assert SessionJournal(tmp_path / "kim").load()["drafts"] == {"a": "가", "b": "나"}
+
+    def test_records_already_in_snapshot_are_skipped(self, tmp_path, make_state):
+        """스냅샷을 쓰고 저널을 비우기 전에 멈춰도 중복 적용하지 않는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        journal.append(make_state({"a": "가"}))
+        journal.append(make_state({"a": "가", "b": "나"}))
+        leftover = journal.journal_path.read_bytes()
+        journal.compact()
+        journal.journal_path.write_bytes(leftover)
+
+        restored = SessionJournal(tmp_path / "kim").load()
+
+        assert restored["drafts"] == {"a": "가", "b": "나"}
+
+    def test_journal_is_much_smaller_than_full_rewrites(self, tmp_path, make_state):
+        """꼭지마다 저장할 때 전체 다시 쓰기보다 훨씬 적게 쓰는지 테스트"""
+        journal = SessionJournal(tmp_path / "kim")
+        drafts = {}
+        full_rewrite_bytes = 0
+        for i in range(40):
+            drafts[f"꼭지{i:02d}"] = "가나다라마바사 " * 190
+            state = make_state(drafts)
+            journal.append(state)
+            full_rewrite_bytes += len(json.dumps(state, ensure_ascii=False, indent=2).encode("utf-8"))
+
+        assert journal.disk_bytes() * 5 < full_rewrite_bytes
+        assert SessionJournal(tmp_path / "kim").load()["drafts"] == drafts
@@ -0,0 +1,238 @@
+"""
+SQLite 저장소 테스트
+=====================
+백업/초안/메시지 저장과 기존 파일 가져오기 단위 테스트
+
+실행 방법:
+    pytest tests/test_storage.py -v
+"""
+
+import csv
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.blob_store import BlobStore, externalize_blobs, is_blob_ref
+from utils.session_journal import SessionJournal
+import utils.storage as storage_module
+from utils.storage import SqliteStorage, main, migrate_files
+
+
+def make_message(student_name="홍길동", message="목차 구성이 궁금합니다", **fields):
+    message = {
+        "student_name": student_name,
+        "timestamp": "2026-01-01T10:00:00",
+        "message": message,
+        "current_step": 3,
+        "step_name": "3단계_목차생성",
+        "status": "pending",
+        "admin_reply": "",
+        "reply_timestamp": "",
+    }
+    message.update(fields)
+    return message
+
+
+class TestBackups:
+    """백업 저장/불러오기 테스트"""
+
+    def test_round_trip_keeps_draft_order(self, tmp_path, make_state):
+        """불러온 백업이 저장한 내용, 꼭지 순서와 같은지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        state = make_state({"3장": "셋", "1장": "하나", "2장": "둘"})
+
+        storage.save_backup("홍길동_20260101_100000.json", "홍길동", state)
+
+        loaded = storage.load_backup("홍길동_20260101_100000.json")
+        assert loaded == state
+        assert list(loaded["drafts"]) == ["3장", "1장", "2장"]
+        assert storage.load_backup("없는백업.json") is None
+
+    def test_unchanged_autosave_is_skipped(self, tmp_path, make_state):
+        """바뀐 게 없으면 기록하지 않고, 꼭지 하나만 바뀌어도 기록하는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        drafts = {f"{i}장": f"초안 {i}" for i in range(10)}
+
+        assert storage.save_backup("홍길동.journal", "홍길동", make_state(drafts), is_journal=True)
+        assert not storage.save_backup("홍길동.journal", "홍길동", make_state(drafts, saved_at="2026-01-01T00:05:00"), is_journal=True)
+
+        drafts["3장"] = "고친 초안"
+        del drafts["9장"]
+        assert storage.save_backup("홍길동.journal", "홍길동", make_state(drafts), is_journal=True)
+
+        loaded = storage.load_backup("홍길동.journal")
+        assert loaded["drafts"] == drafts
+        rows = storage.list_backups()
+        assert len(rows) == 1 and rows[0]["drafts_count"] == 9 and rows[0]["is_journal"] == 1
+
+    def test_keep_removes_oldest_backups(self, tmp_path, make_state):
+        """keep개를 넘는 오래된 일반 백업만 초안과 함께 지우는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        storage.save_backup("홍길동.journal", "홍길동", make_state({"1장": "자동"}), is_journal=True)
+        storage.save_backup("김철수_20260101_000000.json", "김철수", make_state(student_name="김철수"))
+        for i in range(4):
+            storage.save_backup(f"홍길동_2026010{i + 1}_000000.json", "홍길동", make_state({"1장": str(i)}), keep=2)
+
+        names = [row["filename"] for row in storage.list_backups(student_key="홍길동", include_journals=False)]
+        assert names == ["홍길동_20260104_000000.json", "홍길동_20260103_000000.json"]
+        assert storage.load_backup("홍길동_20260101_000000.json") is None
+        assert storage.load_backup("홍길동.journal")["drafts"] == {"1장": "자동"}
+        assert storage.count_backups() == 4
+
+    def test_delete_backup(self, tmp_path, make_state):
+        """백업 삭제 후 목록/불러오기에서 사라지는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        storage.save_backup("홍길동_20260101_000000.json", "홍길동", make_state({"1장": "하나"}))
+
+        assert storage.delete_backup("홍길동_20260101_000000.json")
+        assert not storage.delete_backup("홍길동_20260101_000000.json")
+        assert storage.list_backups() == []
+
+
+class TestMessages:
+    """메시지 저장/조회 테스트"""
+
+    def test_add_update_and_count(self, tmp_path):
+        """추가, 답변, 대기 수 집계가 맞는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        first = storage.add_message(make_message())
+        second = storage.add_message(make_message("Kim", "제목이 어울리는지 봐주세요"))
+
+        assert storage.count_messages("pending") == 2
+        assert storage.update_message(first, "answered", "좋습니다", "2026-01-02T09:00:00")
+        assert not storage.update_message(999, "answered")
+
+        messages = storage.list_messages()
+        assert [m["id"] for m in messages] == [first, second]
+        assert messages[0]["admin_reply"] == "좋습니다"
+        assert storage.count_messages("pending") == 1
+
+    def test_student_lookup_ignores_case(self, tmp_path):
+        """학생 이름 대소문자 구분 없이 조회하는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        storage.add_message(make_message("Kim"))
+        storage.add_message(make_message("Lee"))
+
+        assert [m["student_name"] for m in storage.list_messages(" kim ")] == ["Kim"]
+
+    def test_concurrent_writers_get_unique_ids(self, tmp_path):
+        """여러 세션이 동시에 메시지를 남겨도 번호가 겹치지 않는지 테스트"""
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        ids = []
+        lock = threading.Lock()
+
+        def writer(n):
+            for i in range(10):
+                message_id = storage.add_message(make_message(f"학생{n}", f"질문 {i}"))
+                with lock:
+                    ids.append(message_id)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == 40
+        assert len(storage.list_messages()) == 40
+
+
+class TestMigration:
+    """기존 파일 가져오기 테스트"""
+
+    def test_imports_backups_journals_and_messages(self, tmp_path, make_state):
+        """백업 파일, 저널, messages.json을 가져오고 다시 실행해도 중복되지 않는지 테스트"""
+        data_dir = tmp_path / "data"
+        autosave_dir = data_dir / "autosave"
+        autosave_dir.mkdir(parents=True)
+        backup = make_state({"1장": "하나"})
+        (autosave_dir / "홍길동_20260101_100000.json").write_text(json.dumps(backup, ensure_ascii=False), encoding="utf-8")
+        journal_state = make_state({"1장": "저널"}, student_name="김철수")
+        SessionJournal(autosave_dir / "journal" / "김철수").append(journal_state)
+        messages = [dict(make_message(), id=7), dict(make_message("Lee", "다른 질문"), id=9)]
+        (data_dir / "messages.json").write_text(json.dumps(messages, ensure_ascii=False), encoding="utf-8")
+
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        counts = migrate_files(storage, autosave_dir, data_dir / "messages.json", data_dir / "messages.csv")
+        again = migrate_files(storage, autosave_dir, data_dir / "messages.json", data_dir / "messages.csv")
+
+        assert counts == {"backups": 2, "messages": 2}
+        assert again["messages"] == 0
+        assert storage.count_backups() == 2
+        assert storage.load_backup("홍길동_20260101_100000.json") == backup
+        assert storage.load_backup("김철수.journal")["drafts"] == {"1장": "저널"}
+        assert [m["id"] for m in storage.list_messages()] == [7, 9]
+        assert storage.add_message(make_message("Park", "새 질문")) == 10
+
+    def test_original_file_times_keep_order(self, tmp_path, make_state):
+        """가져온 순서가 아니라 원래 파일 수정 시각 순서로 목록이 정렬되는지 테스트"""
+        autosave_dir = tmp_path / "autosave"
+        autosave_dir.mkdir()
+        old = autosave_dir / "zed_20240101_000000.json"
+        new = autosave_dir / "amy_20260101_000000.json"
+        for path in (old, new):
+            path.write_text(json.dumps(make_state({"1장": path.name}), ensure_ascii=False), encoding="utf-8")
+        os.utime(old, (1704067200, 1704067200))  # 2024-01-01
+        os.utime(new, (1767225600, 1767225600))  # 2026-01-01
+        journal = SessionJournal(autosave_dir / "journal" / "kim")
+        journal.append(make_state({"1장": "저널"}))
+        for path in (journal.snapshot_path, journal.journal_path):
+            if path.exists():
+                os.utime(path, (1735689600, 1735689600))  # 2025-01-01
+
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        migrate_files(storage, autosave_dir, tmp_path / "messages.json", tmp_path / "messages.csv")
+
+        rows = storage.list_backups()
+        assert [row["filename"] for row in rows] == [new.name, "kim.journal", old.name]
+        assert rows[0]["modified_time"] == 1767225600
+        assert storage.list_backups(limit=1)[0]["filename"] == new.name
+
+    def test_csv_is_used_without_json(self, tmp_path):
+        """messages.json이 없으면 messages.csv에서 가져오는지 테스트"""
+        csv_path = tmp_path / "messages.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["student_name", "timestamp", "message", "current_step", "status", "admin_reply", "reply_timestamp"])
+            writer.writerow(["홍길동", "2026-01-01 10:00:00", "질문입니다", "3단계_목차생성", "pending", "", ""])
+
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        counts = migrate_files(storage, tmp_path / "autosave", tmp_path / "messages.json", csv_path)
+
+        assert counts == {"backups": 0, "messages": 1}
+        message = storage.list_messages()[0]
+        assert message["step_name"] == "3단계_목차생성"
+        assert message["status"] == "pending"
+
+    def test_blob_references_are_resolved(self, tmp_path, make_state):
+        """blob 참조로 저장된 백업을 가져오면 본문이 채워지는지 테스트"""
+        autosave_dir = tmp_path / "autosave"
+        autosave_dir.mkdir()
+        backup = make_state({"1장": "긴 초안 " * 100}, youtube_merged_transcript="통합 자막 " * 100)
+        stored, _ = externalize_blobs(backup, BlobStore(autosave_dir / "blobs"))
+        assert is_blob_ref(stored["drafts"]["1장"])
+        (autosave_dir / "홍길동_20260101_100000.json").write_text(json.dumps(stored, ensure_ascii=False), encoding="utf-8")
+
+        storage = SqliteStorage(tmp_path / "store.sqlite3")
+        migrate_files(storage, autosave_dir, tmp_path / "messages.json", tmp_path / "messages.csv")
+
+        loaded = storage.load_backup("홍길동_20260101_100000.json")
+        assert loaded["drafts"]["1장"] == "긴 초안 " * 100
+        assert loaded["youtube_merged_transcript"] == "통합 자막 " * 100
+
+    def test_cli_uses_app_db_path(self, tmp_path, monkeypatch):
+        """--db 없이 실행하면 앱과 같은 DB 경로(STORAGE_DB_PATH)로 가져오는지 테스트"""
+        db_path = tmp_path / "configured.sqlite3"
+        monkeypatch.setattr(storage_module, "get_db_path", lambda: db_path)
+        data_dir = tmp_path / "data"
+        data_dir.mkdir()
+        (data_dir / "messages.json").write_text(json.dumps([make_message()], ensure_ascii=False), encoding="utf-8")
+
+        main(["migrate", "--data-dir", str(data_dir)])
+
+        assert SqliteStorage(db_path).count_messages("pending") == 1
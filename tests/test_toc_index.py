@@ -0,0 +1,92 @@
+"""
+목차 인덱스 테스트
+===================
+섹션 키/Part 조회와 완료 상태 증분 동기화 단위 테스트
+
+실행 방법:
+    pytest tests/test_toc_index.py -v
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.draft_stats import DraftStore
+from utils.toc_index import TocIndex, get_toc_index, section_key
+
+
+def make_toc(parts=5, per_part=8):
+    return [
+        {"part": p, "part_title": f"Part {p}", "section_num": f"{p}-{i}", "section_title": f"꼭지 {p}-{i}"}
+        for p in range(1, parts + 1)
+        for i in range(1, per_part + 1)
+    ]
+
+
+class TestTocIndex:
+    """목차 조회 테스트"""
+
+    def test_key_and_part_lookup(self):
+        toc = make_toc()
+        index = TocIndex(toc)
+
+        assert index.index_of("2-3_꼭지 2-3") == 10
+        assert index.index_of("없는 키") is None
+        assert index.first_index_of_part(3) == 16
+        assert [s["section_num"] for s in index.sections_in_part(5)][:2] == ["5-1", "5-2"]
+        assert index.parts == [1, 2, 3, 4, 5]
+
+    def test_completion_counts(self):
+        toc = make_toc(parts=2, per_part=2)
+        index = TocIndex(toc)
+        index.sync({section_key(toc[0]): "글", section_key(toc[1]): "글"})
+
+        assert index.is_part_completed(1)
+        assert not index.is_part_completed(2)
+        assert index.part_completed == {1: 2, 2: 0}
+        assert [s["section_num"] for s in index.unfinished_sections()] == ["2-1", "2-2"]
+
+
+class TestGetTocIndex:
+    """세션 인덱스 캐시/동기화 테스트"""
+
+    def test_reused_until_toc_replaced(self):
+        state = {"parsed_toc": make_toc(), "drafts": {}}
+        first = get_toc_index(state)
+        assert get_toc_index(state) is first
+
+        state["parsed_toc"] = make_toc(parts=1)
+        assert get_toc_index(state) is not first
+
+    def test_sync_follows_draft_saves(self):
+        toc = make_toc()
+        state = {"parsed_toc": toc, "drafts": DraftStore()}
+        index = get_toc_index(state)
+
+        state["drafts"][section_key(toc[0])] = "첫 글"
+        assert get_toc_index(state).completed_count == 1
+
+        del state["drafts"][section_key(toc[0])]
+        assert get_toc_index(state).completed_count == 0
+        assert index.part_completed[1] == 0
+
+    def test_content_edit_skips_resync(self, monkeypatch):
+        """내용만 고친 경우에는 완료 상태를 다시 훑지 않는지 테스트"""
+        toc = make_toc()
+        state = {"parsed_toc": toc, "drafts": DraftStore({section_key(toc[0]): "첫 글"})}
+        index = get_toc_index(state)
+
+        calls = []
+        monkeypatch.setattr(index, "set_completed", lambda *args: calls.append(args))
+        state["drafts"][section_key(toc[0])] = "고친 글"
+        get_toc_index(state)
+
+        assert calls == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
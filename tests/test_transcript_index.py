@@ -0,0 +1,106 @@
+"""
+자막 검색 인덱스 테스트
+========================
+BM25 구간 검색(TranscriptIndex) 단위 테스트
+
+실행 방법:
+    pytest tests/test_transcript_index.py -v
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.claude_client import find_relevant_transcript_chunk
+from utils.transcript_index import TranscriptIndex, get_transcript_index, tokenize
+
+
+FILLER = "오늘 강의도 끝까지 함께 해주셔서 감사합니다. 잠깐 쉬었다가 다음 이야기로 넘어가 볼게요. "
+
+
+def make_transcript():
+    part1 = FILLER * 20 + "복리의 힘은 시간이 지날수록 커집니다. 적금보다 투자를 먼저 배우세요. " + FILLER * 20
+    part2 = FILLER * 10 + "글쓰기 습관은 매일 아침 십 분으로 시작합니다. 책쓰기는 목차부터 잡으세요. " + FILLER * 10
+    return f"=== Part 1: 돈 공부 ===\n\n{part1}\n\n=== Part 2: 글쓰기 ===\n\n{part2}"
+
+
+class TestTokenize:
+    """토큰화 테스트"""
+
+    def test_korean_bigrams_and_english_words(self):
+        """한글은 2-gram, 영문은 소문자 단어로 나뉘는지 테스트"""
+        assert tokenize("복리투자") == ["복리", "리투", "투자"]
+        assert tokenize("ETF") == ["etf"]
+        assert tokenize("책") == ["책"]
+
+    def test_particles_still_match(self):
+        """조사가 붙어도 같은 2-gram을 공유하는지 테스트"""
+        assert set(tokenize("투자")) <= set(tokenize("투자를"))
+
+
+class TestTranscriptIndex:
+    """BM25 구간 검색 테스트"""
+
+    def test_finds_relevant_passage(self):
+        """꼭지 제목과 관련된 문장이 포함된 구간을 찾는지 테스트"""
+        index = TranscriptIndex(make_transcript())
+        context = index.build_context("복리 투자로 돈 불리기", max_chars=500)
+
+        assert "복리의 힘" in context
+        assert len(context) <= 500
+
+    def test_part_filter(self):
+        """Part를 지정하면 해당 Part 구간에서만 찾는지 테스트"""
+        index = TranscriptIndex(make_transcript())
+
+        hits = index.search("복리 투자", part=2)
+        assert all(index.spans[idx][0] == 2 for idx, _ in hits)
+
+        # 없는 Part면 전체에서 검색
+        assert "복리의 힘" in index.build_context("복리 투자", max_chars=500, part=9)
+
+    def test_no_duplicate_sentences_from_overlapping_passages(self):
+        """겹치는 구간이 함께 선택돼도 문장이 중복되지 않는지 테스트"""
+        transcript = " ".join(f"문장 {i:02d}번은 복리 이야기입니다." for i in range(30))
+        context = TranscriptIndex(transcript).build_context("복리", max_chars=10000, top_k=10)
+
+        assert context.count("문장 05번") == 1
+
+    def test_fallback_without_hits(self):
+        """검색어와 겹치는 토큰이 없으면 앞부분을 돌려주는지 테스트"""
+        context = TranscriptIndex(make_transcript()).build_context("zzz", max_chars=100, part=2)
+
+        assert context
+        assert len(context) <= 100
+
+    def test_search_is_fast_on_long_transcript(self):
+        """2시간 분량(약 10만 자) 자막에서도 검색이 빠른지 테스트"""
+        index = TranscriptIndex(make_transcript() * 20)
+        started = time.perf_counter()
+        for _ in range(40):
+            index.search("글쓰기 습관 만들기", top_k=5)
+        assert (time.perf_counter() - started) / 40 < 0.05
+
+
+class TestIndexReuse:
+    """세션 보관 인덱스 재사용 테스트"""
+
+    def test_rebuilds_only_when_transcript_changes(self):
+        """같은 자막이면 같은 인덱스를, 바뀌면 새 인덱스를 돌려주는지 테스트"""
+        state = {}
+        transcript = make_transcript()
+
+        first = get_transcript_index(state, transcript)
+        assert get_transcript_index(state, transcript) is first
+        assert get_transcript_index(state, transcript + " 추가") is not first
+
+    def test_find_relevant_chunk_uses_index(self):
+        """find_relevant_transcript_chunk가 인덱스로 관련 구간을 찾는지 테스트"""
+        transcript = make_transcript()
+        index = TranscriptIndex(transcript)
+
+        assert "목차부터" in find_relevant_transcript_chunk("", "책쓰기 목차 잡기", 500, index=index, part=2)
+        assert "목차부터" in find_relevant_transcript_chunk(transcript, "책쓰기 목차 잡기", 500)
@@ -0,0 +1,306 @@
+"""
+음성 핸들러 테스트
+===================
+Whisper API 대신 가짜 함수를 넣어 확인하는 긴 녹음 분할/동시 변환 단위 테스트
+
+실행 방법:
+    pytest tests/test_voice_handler.py -v
+"""
+
+import sys
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pydub = pytest.importorskip("pydub")
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+import utils.voice_handler as voice_handler
+from utils.disk_cache import DiskCache
+from utils.voice_handler import (
+    find_split_points,
+    stitch_segments,
+    transcribe_long_audio,
+    transcribe_segments,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    """테스트마다 빈 변환 캐시 사용"""
+    cache = DiskCache(tmp_path / "transcriptions.sqlite3")
+    monkeypatch.setattr(voice_handler, "_transcription_cache", cache)
+    return cache
+
+
+def make_speech(pattern):
+    """(소리 ms, 무음 ms) 목록으로 말소리 흉내 오디오 생성"""
+    audio = AudioSegment.silent(duration=0, frame_rate=16000)
+    for tone_ms, silence_ms in pattern:
+        audio += Sine(440).to_audio_segment(duration=tone_ms).set_frame_rate(16000) - 6
+        audio += AudioSegment.silent(duration=silence_ms, frame_rate=16000)
+    return audio.set_channels(1)
+
+
+def to_wav(audio):
+    return audio.export(format="wav").read()
+
+
+class TestFindSplitPoints:
+    """무음 위치 분할 테스트"""
+
+    def test_cuts_inside_silence(self):
+        """자르는 위치 앞 무음 가운데에서 잘리는지 테스트"""
+        audio = make_speech([(7000, 1000), (7000, 1000), (7000, 0)])
+
+        ranges = find_split_points(audio, max_segment_ms=10000, search_ms=4000, min_silence_ms=500)
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(audio)
+        assert all(end - start <= 10000 for start, end in ranges)
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        # 첫 무음은 7000~8000ms
+        assert 7000 <= ranges[0][1] <= 8000
+
+    def test_cuts_at_limit_without_silence(self):
+        """무음이 없으면 최대 길이에서 자르는지 테스트"""
+        audio = make_speech([(25000, 0)])
+
+        ranges = find_split_points(audio, max_segment_ms=10000, search_ms=2000)
+
+        assert ranges == [(0, 10000), (10000, 20000), (20000, 25000)]
+
+    def test_short_audio_is_one_segment(self):
+        """최대 길이 이하면 구간 하나인지 테스트"""
+        audio = make_speech([(3000, 0)])
+
+        assert find_split_points(audio, max_segment_ms=10000) == [(0, 3000)]
+
+
+class TestTranscribeSegments:
+    """구간 동시 변환/재시도 테스트"""
+
+    def test_retries_only_failed_segments(self, monkeypatch):
+        """실패한 구간만 다시 요청하는지 테스트"""
+        monkeypatch.setattr(voice_handler, "RETRY_DELAY", 0)
+        calls = []
+        lock = threading.Lock()
+
+        def fake_transcribe(segment):
+            with lock:
+                calls.append(segment["index"])
+                first_try = calls.count(segment["index"]) == 1
+            if segment["index"] == 2 and first_try:
+                raise ConnectionError("connection reset")
+            return f"구간 {segment['index']}"
+
+        segments = [{"index": i, "start": i * 10.0, "end": (i + 1) * 10.0} for i in range(4)]
+        progress = []
+        texts, errors = transcribe_segments(
+            segments, fake_transcribe, max_workers=4,
+            on_progress=lambda done, total, segment: progress.append((done, total)),
+        )
+
+        assert errors == {}
+        assert texts == {i: f"구간 {i}" for i in range(4)}
+        assert sorted(calls) == [0, 1, 2, 2, 3]
+        assert progress[-1] == (4, 4)
+
+    def test_runs_concurrently_within_limit(self):
+        """동시 변환 수가 max_workers를 넘지 않는지 테스트"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_transcribe(segment):
+            with lock:
+                active.append(1)
+                peak.append(len(active))
+            time.sleep(0.03)
+            with lock:
+                active.pop()
+            return "텍스트"
+
+        segments = [{"index": i, "start": 0, "end": 0} for i in range(6)]
+        texts, _ = transcribe_segments(segments, slow_transcribe, max_workers=3)
+
+        assert len(texts) == 6
+        assert 1 < max(peak) <= 3
+
+    def test_non_retryable_error_stops(self, monkeypatch):
+        """API 키 오류는 다시 시도하지 않는지 테스트"""
+        monkeypatch.setattr(voice_handler, "RETRY_DELAY", 0)
+        calls = []
+
+        def unauthorized(segment):
+            calls.append(segment["index"])
+            raise RuntimeError("401 Unauthorized")
+
+        texts, errors = transcribe_segments([{"index": 0, "start": 0, "end": 0}], unauthorized)
+
+        assert calls == [0]
+        assert errors == {0: "api_key"}
+
+
+class TestTranscribeLongAudio:
+    """긴 녹음 변환 흐름 테스트"""
+
+    def test_segments_are_stitched_in_order(self, monkeypatch):
+        """늦게 끝난 구간이 있어도 원래 순서로 이어 붙고 타임스탬프가 남는지 테스트"""
+        monkeypatch.setattr(voice_handler, "MAX_FILE_SIZE_MB", 0)
+        monkeypatch.setattr(
+            voice_handler, "find_split_points",
+            lambda audio: [(0, 4000), (4000, 8000), (8000, len(audio))],
+        )
+        audio = make_speech([(3500, 500), (3500, 500), (3000, 0)])
+        calls = []
+
+        def fake_transcribe(segment_bytes, extension):
+            duration = len(AudioSegment.from_file(BytesIO(segment_bytes), format=extension))
+            calls.append(duration)
+            time.sleep(0.05 if len(calls) == 1 else 0)
+            return f"{duration // 1000}초 구간"
+
+        result, error = transcribe_long_audio(to_wav(audio), "wav", transcribe_fn=fake_transcribe)
+
+        assert error is None
+        assert result["text"] == "4초 구간\n\n4초 구간\n\n3초 구간"
+        assert [(s["start"], s["end"]) for s in result["segments"]] == [(0.0, 4.0), (4.0, 8.0), (8.0, 11.0)]
+
+    def test_audio_within_limit_is_not_split(self, monkeypatch):
+        """압축한 전체가 요청 한도 안이면 나누지 않고 한 번에 보내는지 테스트"""
+        split_calls = []
+        monkeypatch.setattr(voice_handler, "find_split_points", lambda audio: split_calls.append(len(audio)))
+        audio = make_speech([(3500, 500), (3500, 500), (3000, 0)])
+        sent = []
+
+        def fake_transcribe(segment_bytes, extension):
+            sent.append(len(AudioSegment.from_file(BytesIO(segment_bytes), format=extension)))
+            return "전체"
+
+        result, error = transcribe_long_audio(to_wav(audio), "wav", transcribe_fn=fake_transcribe)
+
+        assert error is None
+        assert split_calls == []
+        assert len(sent) == 1 and abs(sent[0] - len(audio)) < 100
+        assert result["compression"]["segments"] == 1
+
+    def test_short_audio_sends_original(self):
+        """짧은 녹음은 원본 바이트를 그대로 한 번 보내는지 테스트"""
+        wav = to_wav(make_speech([(2000, 0)]))
+        sent = []
+
+        def fake_transcribe(segment_bytes, extension):
+            sent.append((segment_bytes, extension))
+            return "안녕하세요"
+
+        result, error = transcribe_long_audio(wav, "wav", transcribe_fn=fake_transcribe)
+
+        assert error is None
+        assert sent == [(wav, "wav")]
+        assert result["segments"][0]["end"] == 2.0
+
+    def test_upload_is_downmixed_and_compressed(self):
+        """스테레오 44.1kHz 녹음은 16kHz 모노로 줄여서 보내고 용량을 기록하는지 테스트"""
+        stereo = make_speech([(3000, 0)]).set_frame_rate(44100).set_channels(2)
+        original = to_wav(stereo)
+        sent = []
+
+        def fake_transcribe(segment_bytes, extension):
+            sent.append((len(segment_bytes), extension))
+            return "안녕하세요"
+
+        result, error = transcribe_long_audio(original, "wav", transcribe_fn=fake_transcribe)
+
+        assert error is None
+        assert sent[0][1] in ("mp3", "wav")
+        assert sent[0][0] < len(original) / 4
+        compression = result["compression"]
+        assert compression["original_bytes"] == len(original)
+        assert compression["sent_bytes"] == sent[0][0]
+
+    def test_empty_text_is_no_speech(self):
+        """모든 구간이 빈 텍스트면 no_speech 에러인지 테스트"""
+        wav = to_wav(make_speech([(2000, 0)]))
+
+        result, error = transcribe_long_audio(wav, "wav", transcribe_fn=lambda b, e: "")
+
+        assert result is None
+        assert error == "no_speech"
+
+    def test_stitch_skips_empty_segments(self):
+        """빈 구간은 건너뛰고 순서대로 잇는지 테스트"""
+        segments = [{"index": 1, "text": "둘"}, {"index": 0, "text": "하나"}, {"index": 2, "text": ""}]
+
+        assert stitch_segments(segments) == "하나\n\n둘"
+
+
+class TestTranscriptionCache:
+    """음성 변환 캐시 테스트"""
+
+    def test_same_audio_is_transcribed_once(self):
+        """같은 음성을 다시 보내면 캐시에서 바로 반환하는지 테스트"""
+        wav = to_wav(make_speech([(2000, 0)]))
+        calls = []
+
+        def fake_transcribe(segment_bytes, extension):
+            calls.append(extension)
+            return "안녕하세요"
+
+        first, _ = transcribe_long_audio(wav, "wav", transcribe_fn=fake_transcribe)
+        second, _ = transcribe_long_audio(wav, "wav", transcribe_fn=fake_transcribe)
+
+        assert len(calls) == 1
+        assert second["text"] == first["text"]
+        assert second["segments"] == first["segments"]
+        assert second["cached"] is True
+
+    def test_different_audio_is_not_shared(self):
+        """다른 음성은 캐시를 함께 쓰지 않는지 테스트"""
+        calls = []
+
+        def fake_transcribe(segment_bytes, extension):
+            calls.append(extension)
+            return f"텍스트 {len(calls)}"
+
+        first, _ = transcribe_long_audio(to_wav(make_speech([(2000, 0)])), "wav", transcribe_fn=fake_transcribe)
+        second, _ = transcribe_long_audio(to_wav(make_speech([(2500, 0)])), "wav", transcribe_fn=fake_transcribe)
+
+        assert len(calls) == 2
+        assert first["text"] != second["text"]
+
+    def test_retry_after_failure_resends_only_missing_segments(self, monkeypatch):
+        """일부 구간이 끝내 실패한 뒤 다시 시도하면 실패한 구간만 요청하는지 테스트"""
+        monkeypatch.setattr(voice_handler, "RETRY_DELAY", 0)
+        monkeypatch.setattr(voice_handler, "MAX_FILE_SIZE_MB", 0)
+        monkeypatch.setattr(
+            voice_handler, "find_split_points",
+            lambda audio: [(0, 2000), (2000, 4000), (4000, len(audio))],
+        )
+        wav = to_wav(make_speech([(6000, 0)]))
+        calls = []
+        broken = {"on": True}
+
+        def flaky_transcribe(segment_bytes, extension):
+            duration = len(AudioSegment.from_file(BytesIO(segment_bytes), format=extension))
+            calls.append(duration)
+            if broken["on"] and len(calls) > 1:
+                raise ConnectionError("connection reset")
+            return "구간"
+
+        result, error = transcribe_long_audio(wav, "wav", transcribe_fn=flaky_transcribe, max_workers=1)
+        assert result is None and error == "network"
+
+        calls.clear()
+        broken["on"] = False
+        result, error = transcribe_long_audio(wav, "wav", transcribe_fn=flaky_transcribe, max_workers=1)
+
+        assert error is None
+        assert len(calls) == 2
+        assert result["text"] == "구간\n\n구간\n\n구간"
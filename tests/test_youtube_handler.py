@@ -0,0 +1,325 @@
+"""
+유튜브 핸들러 테스트
+=====================
+yt-dlp / 자막 API 대신 가짜 함수를 넣어 확인하는 youtube_handler 단위 테스트
+
+실행 방법:
+    pytest tests/test_youtube_handler.py -v
+"""
+
+import threading
+import time
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import utils.youtube_handler as youtube_handler
+from utils.disk_cache import DiskCache
+from utils.youtube_handler import (
+    chunk_transcript,
+    get_transcript,
+    get_transcript_with_timestamps,
+    get_video_info,
+    iter_fetch_transcripts,
+    iter_process_videos,
+    list_collection_videos,
+    merge_transcripts_for_book,
+    parse_collection_url,
+    pending_collection_entries,
+    process_multiple_videos,
+    record_collection_sync,
+    synced_video_ids,
+)
+
+
+VIDEO_IDS = ["aaaaaaaaaaa", "bbbbbbbbbbb", "ccccccccccc", "ddddddddddd"]
+
+
+def make_url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def fake_info(url):
+    video_id = url[-11:]
+    return {"video_id": video_id, "title": f"강의 {video_id[0]}"}
+
+
+class TestParallelVideoProcessing:
+    """여러 영상 동시 처리 테스트"""
+
+    def test_keeps_part_order(self):
+        """늦게 끝난 영상이 있어도 part_number 순서로 반환되는지 테스트"""
+        delays = {"aaaaaaaaaaa": 0.08, "bbbbbbbbbbb": 0.0, "ccccccccccc": 0.04, "ddddddddddd": 0.0}
+
+        def fake_transcript(video_id):
+            time.sleep(delays[video_id])
+            return f"자막 {video_id[0]}", "한국어"
+
+        urls = [make_url(video_id) for video_id in VIDEO_IDS]
+        progress = []
+        results = process_multiple_videos(
+            urls,
+            max_workers=4,
+            info_fn=fake_info,
+            transcript_fn=fake_transcript,
+            on_progress=lambda done, total, result: progress.append((done, total, result["part_number"])),
+        )
+
+        assert [r["part_number"] for r in results] == [1, 2, 3, 4]
+        assert [done for done, _, _ in progress] == [1, 2, 3, 4]
+        assert progress[-1][1] == 4
+        # 가장 오래 걸린 Part 1이 마지막에 보고됨
+        assert progress[-1][2] == 1
+
+        merged = merge_transcripts_for_book(results)
+        assert merged.index("Part 1") < merged.index("Part 2") < merged.index("Part 4")
+
+    def test_runs_concurrently_within_limit(self):
+        """동시 처리 수가 max_workers를 넘지 않는지 테스트"""
+        lock = threading.Lock()
+        state = {"in_flight": 0, "peak": 0}
+
+        def fake_transcript(video_id):
+            with lock:
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+            time.sleep(0.03)
+            with lock:
+                state["in_flight"] -= 1
+            return "자막", "한국어"
+
+        urls = [make_url(video_id) for video_id in VIDEO_IDS] * 2
+        results = process_multiple_videos(urls, max_workers=2, info_fn=fake_info, transcript_fn=fake_transcript)
+
+        assert len(results) == 8
+        assert state["peak"] == 2
+
+    def test_errors_are_reported_per_video(self):
+        """잘못된 URL, 정보 실패, 자막 없음이 각각 해당 Part의 오류로 남는지 테스트"""
+        def info_fn(url):
+            if "bbbbbbbbbbb" in url:
+                return {"error": "비공개 영상"}
+            return fake_info(url)
+
+        def transcript_fn(video_id):
+            if video_id == "ccccccccccc":
+                raise RuntimeError("boom")
+            return "자막", "한국어"
+
+        urls = ["https://example.com/nope", "", make_url("bbbbbbbbbbb"), make_url("ccccccccccc"), make_url("ddddddddddd")]
+        results = process_multiple_videos(urls, info_fn=info_fn, transcript_fn=transcript_fn)
+
+        # 빈 줄은 건너뛰지만 part_number는 입력 위치 기준
+        assert [r["part_number"] for r in results] == [1, 3, 4, 5]
+        assert [r["has_error"] for r in results] == [True, True, True, False]
+        assert results[1]["error"] == "비공개 영상"
+        assert "boom" in results[2]["error"]
+
+
+class TestFetchTranscripts:
+    """확인된 영상 자막 동시 추출 테스트"""
+
+    def test_yields_every_video(self):
+        """모든 영상 결과가 원래 영상 정보와 함께 반환되는지 테스트"""
+        videos = [{"video_id": video_id, "part_number": i + 1} for i, video_id in enumerate(VIDEO_IDS)]
+
+        def transcript_fn(video_id):
+            if video_id == "ddddddddddd":
+                return None, "NO_TRANSCRIPT:자막 없음"
+            return f"자막 {video_id[0]}", "한국어"
+
+        results = {video["part_number"]: (text, lang) for video, text, lang in iter_fetch_transcripts(videos, transcript_fn=transcript_fn)}
+
+        assert sorted(results) == [1, 2, 3, 4]
+        assert results[1] == ("자막 a", "한국어")
+        assert results[4] == (None, "NO_TRANSCRIPT:자막 없음")
+
+
+class TestYouTubeCache:
+    """자막/영상 정보 디스크 캐시 테스트"""
+
+    def setup_caches(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(youtube_handler, "_transcript_cache", DiskCache(tmp_path / "transcripts.sqlite3"))
+        monkeypatch.setattr(youtube_handler, "_video_info_cache", DiskCache(tmp_path / "info.sqlite3", ttl_seconds=3600))
+
+    def test_transcript_fetched_once_per_video_and_language(self, monkeypatch, tmp_path):
+        """같은 영상/언어 자막은 두 번째부터 캐시에서 가져오는지 테스트"""
+        self.setup_caches(monkeypatch, tmp_path)
+        calls = []
+
+        def fake_fetch(video_id, languages):
+            calls.append((video_id, tuple(languages)))
+            return [{"start": 0.0, "duration": 2.0, "text": "자막"}, {"start": 2.0, "duration": 2.0, "text": video_id}], "한국어"
+
+        monkeypatch.setattr(youtube_handler, "_fetch_transcript_segments", fake_fetch)
+
+        assert get_transcript("aaaaaaaaaaa") == ("자막 aaaaaaaaaaa", "한국어")
+        assert get_transcript("aaaaaaaaaaa") == ("자막 aaaaaaaaaaa", "한국어")
+        get_transcript("aaaaaaaaaaa", languages=["en"])
+        get_transcript("aaaaaaaaaaa", use_cache=False)
+
+        assert len(calls) == 3
+
+    def test_timestamps_reuse_transcript_cache(self, monkeypatch, tmp_path):
+        """자막을 추출한 영상은 타임스탬프 자막도 다시 요청하지 않는지 테스트"""
+        self.setup_caches(monkeypatch, tmp_path)
+        calls = []
+        segments = [{"start": 0.0, "duration": 3.0, "text": "안녕하세요"}, {"start": 3.0, "duration": 4.0, "text": "오늘은 복리 이야기"}]
+
+        def fake_fetch(video_id, languages):
+            calls.append(video_id)
+            return segments, "한국어"
+
+        monkeypatch.setattr(youtube_handler, "_fetch_transcript_segments", fake_fetch)
+
+        assert get_transcript("eeeeeeeeeee") == ("안녕하세요 오늘은 복리 이야기", "한국어")
+        assert get_transcript_with_timestamps("eeeeeeeeeee") == (segments, "한국어")
+        assert len(calls) == 1
+
+    def test_failures_are_not_cached(self, monkeypatch, tmp_path):
+        """자막 없음 결과는 저장하지 않고 다음에 다시 시도하는지 테스트"""
+        self.setup_caches(monkeypatch, tmp_path)
+        calls = []
+
+        def fake_fetch(video_id, languages):
+            calls.append(video_id)
+            return None, "NO_TRANSCRIPT:자막 없음"
+
+        monkeypatch.setattr(youtube_handler, "_fetch_transcript_segments", fake_fetch)
+
+        get_transcript("bbbbbbbbbbb")
+        get_transcript("bbbbbbbbbbb")
+
+        assert len(calls) == 2
+
+    def test_video_info_shared_across_url_formats(self, monkeypatch, tmp_path):
+        """URL 형식이 달라도 같은 영상이면 캐시를 쓰고, url은 입력값을 돌려주는지 테스트"""
+        self.setup_caches(monkeypatch, tmp_path)
+        calls = []
+
+        def fake_fetch(url, timeout):
+            calls.append(url)
+            return {"video_id": "ccccccccccc", "title": "강의", "url": url}
+
+        monkeypatch.setattr(youtube_handler, "_fetch_video_info", fake_fetch)
+
+        first = get_video_info("https://www.youtube.com/watch?v=ccccccccccc")
+        second = get_video_info("https://youtu.be/ccccccccccc")
+
+        assert len(calls) == 1
+        assert second["title"] == first["title"]
+        assert second["url"] == "https://youtu.be/ccccccccccc"
+
+
+class TestChunkTranscript:
+    """자막 청크 분할 테스트"""
+
+    def test_long_unpunctuated_text_is_split(self):
+        """문장 부호가 없는 긴 자막도 max_chars 이하로 나뉘는지 테스트"""
+        chunks = chunk_transcript("가" * 2500, max_chars=1000)
+
+        assert [len(c) for c in chunks] == [1000, 1000, 500]
+
+
+def fake_playlist(video_ids, title="강의 재생목록"):
+    """yt-dlp 평면 추출 결과 흉내"""
+    def fetch(url, timeout):
+        return {
+            "title": title,
+            "channel": "작가의집",
+            "entries": [{"id": video_id, "title": f"강의 {video_id[0]}", "duration": 125} for video_id in video_ids],
+        }
+    return fetch
+
+
+class TestCollectionUrls:
+    """재생목록/채널 URL 해석 테스트"""
+
+    def test_playlist_url(self):
+        """재생목록 URL은 재생목록 ID로 해석되는지 테스트"""
+        collection = parse_collection_url("https://www.youtube.com/playlist?list=PLabc_123-x")
+
+        assert collection["kind"] == "playlist"
+        assert collection["collection_id"] == "playlist:PLabc_123-x"
+        assert collection["url"] == "https://www.youtube.com/playlist?list=PLabc_123-x"
+
+    def test_channel_urls(self):
+        """채널 주소는 영상 탭 기준으로 해석되는지 테스트"""
+        assert parse_collection_url("https://www.youtube.com/@jakkashouse")["url"] == "https://www.youtube.com/@jakkashouse/videos"
+        assert parse_collection_url("youtube.com/@jakkashouse/streams")["collection_id"] == "channel:@jakkashouse/streams"
+        assert parse_collection_url("https://www.youtube.com/@jakkashouse/community") is None
+
+    def test_video_urls_are_not_collections(self):
+        """영상 URL(재생목록 파라미터 포함)은 영상 하나로 처리되는지 테스트"""
+        assert parse_collection_url(make_url("aaaaaaaaaaa")) is None
+        assert parse_collection_url(make_url("aaaaaaaaaaa") + "&list=PLabc") is None
+
+
+class TestCollectionIngestion:
+    """재생목록 영상 목록/증분 동기화 테스트"""
+
+    def test_flat_entries_become_video_infos(self):
+        """평면 추출 항목이 영상 정보 형식으로 바뀌고 볼 수 없는 영상은 빠지는지 테스트"""
+        def fetch(url, timeout):
+            return {
+                "title": "채널",
+                "entries": [
+                    {"title": "Videos", "entries": [
+                        {"id": "aaaaaaaaaaa", "title": "1강", "duration": 65},
+                        {"id": "bbbbbbbbbbb", "title": "[Private video]"},
+                        None,
+                    ]},
+                    {"title": "Live", "entries": [{"id": "aaaaaaaaaaa", "title": "1강"}]},
+                ],
+            }
+
+        collection, error = list_collection_videos("https://www.youtube.com/@jakkashouse", fetch_fn=fetch)
+
+        assert error is None
+        assert [entry["video_id"] for entry in collection["entries"]] == ["aaaaaaaaaaa"]
+        info = collection["entries"][0]["info"]
+        assert info["title"] == "1강"
+        assert info["duration_str"] == "1분 5초"
+        assert info["thumbnail"].endswith("/aaaaaaaaaaa/hqdefault.jpg")
+
+    def test_known_info_skips_video_info_requests(self):
+        """목록에서 받은 정보가 있으면 영상별 정보 요청을 하지 않는지 테스트"""
+        collection, _ = list_collection_videos("https://www.youtube.com/playlist?list=PL1", fetch_fn=fake_playlist(VIDEO_IDS[:2]))
+        entries = collection["entries"]
+
+        def fail_info(url):
+            raise AssertionError("영상 정보를 다시 요청함")
+
+        results = list(iter_process_videos(
+            [entry["url"] for entry in entries],
+            info_fn=fail_info,
+            fetch_transcript=False,
+            start_part=3,
+            known_info={entry["video_id"]: entry["info"] for entry in entries},
+        ))
+
+        assert sorted(r["part_number"] for r in results) == [3, 4]
+        assert not any(r["has_error"] for r in results)
+
+    def test_resync_returns_only_new_videos(self):
+        """다시 동기화하면 새로 올라온 영상만 남는지 테스트"""
+        registry = {}
+        first, _ = list_collection_videos("https://www.youtube.com/playlist?list=PL1", fetch_fn=fake_playlist(VIDEO_IDS[:2]))
+        record_collection_sync(registry, first, [entry["video_id"] for entry in first["entries"]])
+
+        second, _ = list_collection_videos("https://www.youtube.com/playlist?list=PL1", fetch_fn=fake_playlist(VIDEO_IDS))
+        new_entries = pending_collection_entries(second, synced_video_ids(registry))
+
+        assert [entry["video_id"] for entry in new_entries] == VIDEO_IDS[2:]
+
+        record_collection_sync(registry, second, [new_entries[0]["video_id"]])
+        assert registry["playlist:PL1"]["video_ids"] == VIDEO_IDS[:3]
+
+    def test_empty_playlist_is_error(self):
+        """영상이 없는 목록은 에러 메시지를 반환하는지 테스트"""
+        collection, error = list_collection_videos("https://www.youtube.com/playlist?list=PL1", fetch_fn=fake_playlist([]))
+
+        assert collection is None
+        assert error
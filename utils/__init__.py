@@ -16,10 +16,15 @@ from utils.claude_client import (
     generate_titles_from_transcript,
     generate_toc_from_transcript,
     generate_draft_from_transcript,
+    generate_drafts_concurrently,
+    write_stream,
+    StreamInterruptedError,
 )
 
 from utils.voice_handler import (
     transcribe_audio,
+    transcribe_audio_with_segments,
+    transcribe_long_audio,
     validate_audio_file,
     get_file_extension,
     render_voice_mode_ui,
@@ -34,10 +39,18 @@ from utils.youtube_handler import (
     get_video_info,
     get_transcript,
     get_transcript_with_timestamps,
+    build_timestamp_url,
     format_timestamp,
     chunk_transcript,
     process_multiple_videos,
+    iter_process_videos,
+    iter_fetch_transcripts,
     merge_transcripts_for_book,
+    parse_collection_url,
+    list_collection_videos,
+    pending_collection_entries,
+    record_collection_sync,
+    synced_video_ids,
 )
 
 from utils.contact_handler import (
@@ -87,6 +100,15 @@ from utils.autosave_handler import (
     perform_autosave_if_needed,
     trigger_important_save,
     init_autosave_state,
+    queue_autosave,
+    get_autosave_status,
+)
+
+from utils.batch_handler import (
+    submit_draft_batch,
+    start_batch_poller,
+    get_batch_status,
+    apply_batch_results,
 )
 
 from utils.mode_transition import (
@@ -118,8 +140,13 @@ __all__ = [
     "generate_titles_from_transcript",
     "generate_toc_from_transcript",
     "generate_draft_from_transcript",
+    "generate_drafts_concurrently",
+    "write_stream",
+    "StreamInterruptedError",
     # voice_handler
     "transcribe_audio",
+    "transcribe_audio_with_segments",
+    "transcribe_long_audio",
     "validate_audio_file",
     "get_file_extension",
     "render_voice_mode_ui",
@@ -132,10 +159,18 @@ __all__ = [
     "get_video_info",
     "get_transcript",
     "get_transcript_with_timestamps",
+    "build_timestamp_url",
     "format_timestamp",
     "chunk_transcript",
     "process_multiple_videos",
+    "iter_process_videos",
+    "iter_fetch_transcripts",
     "merge_transcripts_for_book",
+    "parse_collection_url",
+    "list_collection_videos",
+    "pending_collection_entries",
+    "record_collection_sync",
+    "synced_video_ids",
     # contact_handler
     "get_admin_settings",
     "ensure_data_directory",
@@ -179,6 +214,13 @@ __all__ = [
     "perform_autosave_if_needed",
     "trigger_important_save",
     "init_autosave_state",
+    "queue_autosave",
+    "get_autosave_status",
+    # batch_handler
+    "submit_draft_batch",
+    "start_batch_poller",
+    "get_batch_status",
+    "apply_batch_results",
     # mode_transition
     "transfer_chat_mode_to_normal",
     "transfer_voice_mode_to_normal",
@@ -7,6 +7,7 @@ import streamlit as st
 from datetime import datetime, timedelta
 import random
 import json
+from utils.draft_stats import ensure_draft_store
 
 # ============================================
 # 뱃지 시스템 정의
@@ -267,12 +268,8 @@ def get_completed_chapters():
 
 
 def get_total_chars():
-    """총 작성 글자 수"""
-    drafts = st.session_state.get("drafts", {})
-    return sum(
-        len(d.replace(" ", "").replace("\n", ""))
-        for d in drafts.values()
-    )
+    """총 작성 글자 수 (초안 통계 인덱스에서 O(1) 조회)"""
+    return ensure_draft_store(st.session_state).total_chars
 
 
 def check_and_award_badges():
@@ -3,24 +3,56 @@
 ==========================
 - 5분마다 자동 저장
 - 중요 변경 시 즉시 저장
-- 여러 버전 백업 (최대 5개)
+- 자동 저장은 학생별 저널에 바뀐 항목만 덧붙임 (스냅샷 + 저널)
+- 직접 저장은 전체 파일로 여러 버전 백업 (최대 5개)
 - 이전 작업 복구 기능
 """
 
 import json
 import os
 import re
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterable, List, Any
 import streamlit as st
 
+from utils.backup_manifest import BACKUP_FILENAME_PATTERN, JOURNAL_SUFFIX, BackupManifest, ensure_manifest
+from utils.blob_store import BlobStore, collect_blob_refs, externalize_blobs, resolve_blobs
+from utils.disk_cache import dumps_compact
+from utils.session_journal import SessionJournal
+from utils.autosave_writer import (
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SAVING,
+    get_autosave_writer,
+    snapshot_session_data,
+)
+from utils.storage import get_storage
+
 
 # 기본 설정
 AUTOSAVE_DIR = Path(__file__).parent.parent / "data" / "autosave"
 MAX_BACKUPS = 5
 AUTOSAVE_INTERVAL_SECONDS = 300  # 5분
 
+# 자동 저장 저널 (학생별 디렉토리, 목록에는 "이름.journal"로 표시)
+JOURNAL_DIR = AUTOSAVE_DIR / "journal"
+
+_journals: Dict[str, SessionJournal] = {}
+_journals_lock = threading.Lock()
+
+# 백업 목록 인덱스 (목록/최근 작업 조회 때 백업 파일을 열지 않음)
+MANIFEST_PATH = AUTOSAVE_DIR / "manifest.sqlite3"
+
+_manifest = BackupManifest(MANIFEST_PATH)
+
+# 백업 본문 저장소 (초안/자막을 내용 해시로 한 번만 압축 저장, 백업 파일에는 참조만)
+BLOB_DIR = AUTOSAVE_DIR / "blobs"
+
+_blob_store = BlobStore(BLOB_DIR)
+
 
 def ensure_autosave_directory() -> Path:
     """자동 저장 디렉토리 생성 - 예외 처리 강화"""
@@ -64,6 +96,22 @@ def generate_save_filename(student_name: str, timestamp: datetime = None) -> str
     return f"{safe_name}_{time_str}.json"
 
 
+def get_journal(student_name: str) -> SessionJournal:
+    """학생 저널 (프로세스 안에서 하나만 만들어 재사용 - 마지막 저장 상태를 기억)"""
+    safe_name = sanitize_filename(student_name)
+    with _journals_lock:
+        journal = _journals.get(safe_name)
+        if journal is None:
+            journal = SessionJournal(JOURNAL_DIR / safe_name)
+            _journals[safe_name] = journal
+        return journal
+
+
+def is_journal_backup(filename: str) -> bool:
+    """백업 목록 항목이 저널인지 확인"""
+    return isinstance(filename, str) and filename.endswith(JOURNAL_SUFFIX)
+
+
 def get_session_data() -> Dict[str, Any]:
     """현재 세션 데이터 수집"""
     return {
@@ -75,6 +123,7 @@ def get_session_data() -> Dict[str, Any]:
         "generated_toc": st.session_state.get("generated_toc", ""),
         "parsed_toc": st.session_state.get("parsed_toc", []),
         "drafts": st.session_state.get("drafts", {}),
+        "draft_batch_job": st.session_state.get("draft_batch_job"),
         "current_section_index": st.session_state.get("current_section_index", 0),
         "current_step": st.session_state.get("current_step", 1),
         "author_info": st.session_state.get("author_info", {}),
@@ -83,6 +132,7 @@ def get_session_data() -> Dict[str, Any]:
         "chat_mode_data": st.session_state.get("chat_mode_data", {}),
         "youtube_transcripts": st.session_state.get("youtube_transcripts", {}),
         "youtube_merged_transcript": st.session_state.get("youtube_merged_transcript", ""),
+        "youtube_collections": st.session_state.get("youtube_collections", {}),
     }
 
 
@@ -112,6 +162,10 @@ def restore_session_data(data: Dict[str, Any]) -> bool:
         drafts = data.get("drafts", {})
         st.session_state.drafts = drafts if isinstance(drafts, dict) else {}
 
+        # 진행 중인 초안 일괄 생성 작업 (배치 ID)
+        draft_batch_job = data.get("draft_batch_job")
+        st.session_state.draft_batch_job = draft_batch_job if isinstance(draft_batch_job, dict) and draft_batch_job.get("batch_id") else None
+
         current_section_index = data.get("current_section_index", 0)
         st.session_state.current_section_index = current_section_index if isinstance(current_section_index, int) else 0
 
@@ -136,6 +190,9 @@ def restore_session_data(data: Dict[str, Any]) -> bool:
         youtube_merged_transcript = data.get("youtube_merged_transcript", "")
         st.session_state.youtube_merged_transcript = youtube_merged_transcript if isinstance(youtube_merged_transcript, str) else ""
 
+        youtube_collections = data.get("youtube_collections", {})
+        st.session_state.youtube_collections = youtube_collections if isinstance(youtube_collections, dict) else {}
+
         return True
     except Exception as e:
         print(f"세션 데이터 복원 실패: {e}")
@@ -153,48 +210,92 @@ def save_progress(student_name: str = None, is_autosave: bool = True) -> Optiona
     Returns:
         저장된 파일 경로 또는 None (실패 시)
     """
+    student_name = get_student_name(student_name)
+
+    # 세션 데이터 수집
+    data = get_session_data()
+    data["student_name"] = student_name
+    data["is_autosave"] = is_autosave
+
+    result = write_backup(student_name, data, is_autosave)
+    if result:
+        # 마지막 저장 시간 업데이트
+        st.session_state.last_save_time = datetime.now().isoformat()
+        st.session_state.last_save_filename = sanitize_filename(student_name) + JOURNAL_SUFFIX if is_autosave else Path(result).name
+    return result
+
+
+def get_student_name(student_name: str = None) -> str:
+    """저장에 쓸 학생 이름 (None이면 세션에서 가져옴) - 타입 검증 추가"""
+    if student_name is None:
+        book_info = st.session_state.get("book_info", {})
+        if isinstance(book_info, dict):
+            student_name = book_info.get("name", "")
+        else:
+            student_name = ""
+
+    if not student_name or not isinstance(student_name, str):
+        student_name = "unknown"
+    return student_name
+
+
+def write_backup(student_name: str, data: Dict[str, Any], is_autosave: bool = True) -> Optional[str]:
+    """
+    세션 데이터를 백업으로 쓰기 (세션 상태를 건드리지 않아 백그라운드 스레드에서도 사용)
+
+    Returns:
+        저장된 파일 경로(SQLite 저장소면 백업 이름) 또는 None (실패 시)
+    """
     try:
         save_dir = ensure_autosave_directory()
 
-        # 학생 이름 가져오기 - 타입 검증 추가
-        if student_name is None:
-            book_info = st.session_state.get("book_info", {})
-            if isinstance(book_info, dict):
-                student_name = book_info.get("name", "")
-            else:
-                student_name = ""
-
-        if not student_name or not isinstance(student_name, str):
-            student_name = "unknown"
+        storage = get_storage()
+        if storage is not None:
+            # SQLite 저장소: 자동 저장은 학생별 한 행을 갱신, 수동 저장은 새 행 추가와 오래된 백업 정리를 한 트랜잭션으로
+            safe_name = sanitize_filename(student_name)
+            filename = safe_name + JOURNAL_SUFFIX if is_autosave else generate_save_filename(student_name)
+            storage.save_backup(filename, safe_name, data, is_journal=is_autosave, keep=None if is_autosave else MAX_BACKUPS)
+            return filename
 
-        # 세션 데이터 수집
-        data = get_session_data()
-        data["student_name"] = student_name
-        data["is_autosave"] = is_autosave
+        if is_autosave:
+            # 자동 저장: 바뀐 항목만 저널에 덧붙임 (바뀐 게 없으면 쓰지 않음)
+            journal = get_journal(student_name)
+            if journal.append(data):
+                _index_backup(sanitize_filename(student_name) + JOURNAL_SUFFIX, data, journal.disk_bytes(), journal.modified_time(), is_journal=True)
+            return str(journal.directory)
 
         # 파일명 생성 및 저장
         filename = generate_save_filename(student_name)
         filepath = save_dir / filename
 
-        # 임시 파일로 먼저 저장 후 이름 변경 (원자성 확보)
-        temp_filepath = filepath.with_suffix('.tmp')
+        # 초안/자막 본문은 blob으로 저장하고 백업 파일에는 참조만 남김
+        stored, blob_refs = externalize_blobs(data, _blob_store)
+        payload = dumps_compact(stored)
+
+        # 파일을 내놓기 전에 목록 인덱스(blob 참조 포함)부터 기록
+        # 인덱스에 못 올리면 저장 실패로 처리 (목록에 안 보이고, 정리 때 참조 중인 blob이 지워질 수 있는 파일을 남기지 않음)
+        if not _index_backup(filename, data, len(payload.encode("utf-8")), time.time(), blob_refs=blob_refs):
+            return None
+
         try:
-            with open(temp_filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            # 성공 시 임시 파일을 실제 파일로 이름 변경
-            temp_filepath.replace(filepath)
+            # 임시 파일로 먼저 저장 후 이름 변경 (원자성 확보)
+            temp_filepath = filepath.with_suffix('.tmp')
+            try:
+                with open(temp_filepath, 'w', encoding='utf-8') as f:
+                    f.write(payload)
+                # 성공 시 임시 파일을 실제 파일로 이름 변경
+                temp_filepath.replace(filepath)
+            except Exception:
+                # 임시 파일 저장 실패 시 직접 저장 시도
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(payload)
         except Exception:
-            # 임시 파일 저장 실패 시 직접 저장 시도
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-        # 자동 저장인 경우 오래된 백업 정리
-        if is_autosave:
-            cleanup_old_backups(student_name)
+            # 파일을 못 썼으면 인덱스 행도 되돌림
+            _unindex_backup(filename)
+            raise
 
-        # 마지막 저장 시간 업데이트
-        st.session_state.last_save_time = datetime.now().isoformat()
-        st.session_state.last_save_filename = filename
+        # 오래된 백업 정리
+        cleanup_old_backups(student_name)
 
         return str(filepath)
 
@@ -211,98 +312,240 @@ def save_progress(student_name: str = None, is_autosave: bool = True) -> Optiona
 
 def cleanup_old_backups(student_name: str) -> int:
     """
-    오래된 백업 파일 정리 (최대 5개 유지)
+    오래된 백업 파일 정리 (최대 5개 유지, 저널은 따로 관리)
 
     Returns:
         삭제된 파일 수
     """
     try:
-        safe_name = sanitize_filename(student_name)
-        pattern = f"{safe_name}_*.json"
-
-        # 해당 학생의 모든 백업 파일 찾기
-        backup_files = list(AUTOSAVE_DIR.glob(pattern))
+        # 해당 학생의 백업 파일 (인덱스에서 최신순으로 조회)
+        backups = _list_backup_rows(student_key=sanitize_filename(student_name), include_journals=False)
 
-        if len(backup_files) <= MAX_BACKUPS:
+        if len(backups) <= MAX_BACKUPS:
             return 0
 
-        # 수정 시간 기준으로 정렬 (최신 순)
-        backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+        storage = get_storage()
+        if storage is not None:
+            return sum(1 for old_backup in backups[MAX_BACKUPS:] if storage.delete_backup(old_backup["filename"]))
 
-        # 오래된 파일 삭제
-        deleted_count = 0
-        for old_file in backup_files[MAX_BACKUPS:]:
+        # 오래된 파일 삭제 (더 이상 참조되지 않는 본문 blob도 정리)
+        deleted = []
+        for old_backup in backups[MAX_BACKUPS:]:
             try:
-                old_file.unlink()
-                deleted_count += 1
+                old_file = AUTOSAVE_DIR / old_backup["filename"]
+                if old_file.exists():
+                    old_file.unlink()
+                deleted.append(old_backup["filename"])
             except Exception:
                 pass
 
-        return deleted_count
+        _release_backups(deleted)
+        return len(deleted)
 
     except Exception:
         return 0
 
 
-def get_all_backups() -> List[Dict[str, Any]]:
-    """모든 백업 파일 목록 조회"""
+def _backup_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """백업 데이터에서 목록 표시용 메타 정보 추출"""
+    drafts = data.get("drafts", {})
+    return {
+        "saved_at": data.get("saved_at", ""),
+        "student_name": data.get("student_name", data.get("book_info", {}).get("name", "알 수 없음")),
+        "selected_title": data.get("selected_title", ""),
+        "current_step": data.get("current_step", 1),
+        "drafts_count": len(drafts),
+        "total_chars": sum(len(d) for d in drafts.values()),
+    }
+
+
+def _manifest_entry(
+    filename: str,
+    data: Dict[str, Any],
+    file_size: int,
+    modified_time: float,
+    is_journal: bool = False,
+    blob_refs: List[str] = None,
+) -> Dict[str, Any]:
+    """목록 인덱스 행 생성 (blob_refs를 주면 참조 목록도 함께 기록)"""
+    if is_journal:
+        student_key = filename[:-len(JOURNAL_SUFFIX)]
+    else:
+        match = BACKUP_FILENAME_PATTERN.match(filename)
+        student_key = match.group(1) if match else sanitize_filename(data.get("student_name", ""))
+    entry = {
+        "filename": filename,
+        "student_key": student_key,
+        **_backup_summary(data),
+        "file_size": file_size,
+        "modified_time": modified_time,
+        "is_journal": is_journal,
+    }
+    if blob_refs is not None:
+        entry["blob_refs"] = blob_refs
+    return entry
+
+
+def _index_backup(
+    filename: str,
+    data: Dict[str, Any],
+    file_size: int,
+    modified_time: float,
+    is_journal: bool = False,
+    blob_refs: List[str] = None,
+) -> bool:
+    """
+    저장한 백업을 목록 인덱스에 반영
+
+    Returns:
+        반영했으면 True (실패하면 다음 조회 때 빠진 백업을 다시 찾도록 표시)
+    """
     try:
-        ensure_autosave_directory()
-        backup_files = list(AUTOSAVE_DIR.glob("*.json"))
+        get_manifest().upsert(_manifest_entry(filename, data, file_size, modified_time, is_journal, blob_refs))
+        return True
+    except Exception as e:
+        print(f"백업 목록 갱신 실패: {e}")
+        _manifest.synced_at = None
+        return False
+
+
+def _unindex_backup(filename: str):
+    """쓰지 못한 백업의 인덱스 행 되돌리기 (blob은 유예 시간 뒤 다른 정리 때 처리)"""
+    try:
+        _manifest.remove([filename])
+    except Exception as e:
+        print(f"백업 목록 되돌리기 실패: {e}")
 
-        backups = []
-        for filepath in backup_files:
+
+def _release_backups(filenames: List[str]):
+    """지운 백업을 목록에서 빼고, 어디서도 참조하지 않게 된 본문 blob 삭제"""
+    if not filenames:
+        return
+    # 인덱스에 빠진 백업의 참조부터 채운 뒤 안 쓰는 blob을 고름
+    manifest = get_manifest(force_sync=True)
+    refs = manifest.blob_refs(filenames)
+    manifest.remove(filenames)
+    _blob_store.delete(manifest.unreferenced(refs))
+
+
+def _scan_backups(indexed: Iterable[str] = ()) -> List[Dict[str, Any]]:
+    """
+    백업 파일/저널을 열어 인덱스 행 만들기
+
+    Args:
+        indexed: 이미 인덱스에 있는 이름 (열지 않고 건너뜀, 비우면 전체)
+    """
+    indexed = set(indexed)
+    entries = []
+    ensure_autosave_directory()
+    for filepath in AUTOSAVE_DIR.glob("*.json"):
+        if filepath.name in indexed:
+            continue
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            stat = filepath.stat()
+            entries.append(_manifest_entry(
+                filepath.name, resolve_blobs(data, _blob_store), stat.st_size, stat.st_mtime,
+                blob_refs=collect_blob_refs(data),
+            ))
+        except Exception:
+            continue
+
+    if JOURNAL_DIR.exists():
+        for directory in JOURNAL_DIR.iterdir():
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # 메타 정보 추출
-                saved_at = data.get("saved_at", "")
-                student_name = data.get("student_name", data.get("book_info", {}).get("name", "알 수 없음"))
-                selected_title = data.get("selected_title", "")
-                current_step = data.get("current_step", 1)
-                drafts_count = len(data.get("drafts", {}))
-                total_chars = sum(len(d) for d in data.get("drafts", {}).values())
-
-                backups.append({
-                    "filename": filepath.name,
-                    "filepath": str(filepath),
-                    "saved_at": saved_at,
-                    "student_name": student_name,
-                    "selected_title": selected_title,
-                    "current_step": current_step,
-                    "drafts_count": drafts_count,
-                    "total_chars": total_chars,
-                    "file_size": filepath.stat().st_size,
-                    "modified_time": datetime.fromtimestamp(filepath.stat().st_mtime),
-                })
+                if not directory.is_dir() or directory.name + JOURNAL_SUFFIX in indexed:
+                    continue
+                journal = get_journal(directory.name)
+                data = journal.load()
+                if data:
+                    entries.append(_manifest_entry(directory.name + JOURNAL_SUFFIX, data, journal.disk_bytes(), journal.modified_time(), is_journal=True))
             except Exception:
                 continue
+    return entries
+
+
+def get_manifest(force_sync: bool = False) -> BackupManifest:
+    """백업 목록 인덱스 (처음 한 번 기존 백업을 모두 채우고, 이후에는 빠진 백업만 가끔 채움)"""
+    return ensure_manifest(_manifest, _scan_backups, _scan_backups, force=force_sync)
+
+
+def _list_backup_rows(student_key: str = None, limit: int = None, include_journals: bool = True) -> List[Dict[str, Any]]:
+    """백업 목록 행 조회 (SQLite 저장소 또는 파일 백업 인덱스)"""
+    storage = get_storage()
+    if storage is not None:
+        return storage.list_backups(student_key=student_key, limit=limit, include_journals=include_journals)
+    return get_manifest().list(student_key=student_key, limit=limit, include_journals=include_journals)
+
 
-        # 최신순 정렬
-        backups.sort(key=lambda x: x["modified_time"], reverse=True)
-        return backups
+def count_backups() -> int:
+    """저장된 백업 수"""
+    storage = get_storage()
+    if storage is not None:
+        return storage.count_backups()
+    return get_manifest().count()
 
+
+def _backup_info(row: Dict[str, Any]) -> Dict[str, Any]:
+    """인덱스 행을 목록 표시 형식으로 변환"""
+    filename = row["filename"]
+    if get_storage() is not None:
+        filepath = filename  # SQLite 저장소는 이름으로 불러옴
+    elif row.get("is_journal"):
+        filepath = JOURNAL_DIR / filename[:-len(JOURNAL_SUFFIX)]
+    else:
+        filepath = AUTOSAVE_DIR / filename
+    return {
+        "filename": filename,
+        "filepath": str(filepath),
+        "saved_at": row.get("saved_at") or "",
+        "student_name": row.get("student_name") or "알 수 없음",
+        "selected_title": row.get("selected_title") or "",
+        "current_step": row.get("current_step") or 1,
+        "drafts_count": row.get("drafts_count") or 0,
+        "total_chars": row.get("total_chars") or 0,
+        "file_size": row.get("file_size") or 0,
+        "modified_time": datetime.fromtimestamp(row["modified_time"]),
+    }
+
+
+def get_all_backups(limit: int = None) -> List[Dict[str, Any]]:
+    """모든 백업 목록 조회 (최신순, 목록 인덱스에서 조회)"""
+    try:
+        return [_backup_info(row) for row in _list_backup_rows(limit=limit)]
     except Exception:
         return []
 
 
 def get_student_backups(student_name: str) -> List[Dict[str, Any]]:
     """특정 학생의 백업 파일 목록 조회"""
-    all_backups = get_all_backups()
-    safe_name = sanitize_filename(student_name)
-    return [b for b in all_backups if b["filename"].startswith(safe_name)]
+    try:
+        rows = _list_backup_rows(student_key=sanitize_filename(student_name))
+        return [_backup_info(row) for row in rows]
+    except Exception:
+        return []
 
 
 def load_backup(filename: str) -> Optional[Dict[str, Any]]:
-    """백업 파일 로드"""
+    """백업 파일 로드 (저널이면 스냅샷 + 저널을 다시 적용한 최신 상태)"""
     try:
+        storage = get_storage()
+        if storage is not None:
+            return storage.load_backup(filename)
+
+        if is_journal_backup(filename):
+            return get_journal(filename[:-len(JOURNAL_SUFFIX)]).load()
+
         filepath = AUTOSAVE_DIR / filename
         if not filepath.exists():
+            # 밖에서 지워진 파일은 목록에서도 정리
+            _release_backups([filename])
             return None
 
+        # 참조로 남긴 초안/자막 본문을 다시 채워서 반환 (예전 백업은 그대로)
         with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return resolve_blobs(json.load(f), _blob_store)
 
     except Exception:
         return None
@@ -311,9 +554,22 @@ def load_backup(filename: str) -> Optional[Dict[str, Any]]:
 def delete_backup(filename: str) -> bool:
     """백업 파일 삭제"""
     try:
+        storage = get_storage()
+        if storage is not None:
+            return storage.delete_backup(filename)
+
+        if is_journal_backup(filename):
+            journal = get_journal(filename[:-len(JOURNAL_SUFFIX)])
+            if not journal.exists():
+                return False
+            journal.delete()
+            get_manifest().remove([filename])
+            return True
+
         filepath = AUTOSAVE_DIR / filename
         if filepath.exists():
             filepath.unlink()
+            _release_backups([filename])
             return True
         return False
     except Exception:
@@ -327,7 +583,7 @@ def check_for_previous_work() -> Optional[Dict[str, Any]]:
     Returns:
         가장 최근 백업 정보 또는 None
     """
-    backups = get_all_backups()
+    backups = get_all_backups(limit=1)
     if backups:
         return backups[0]  # 가장 최근 백업
     return None
@@ -339,13 +595,19 @@ def should_autosave() -> bool:
     if not st.session_state.get("drafts") and not st.session_state.get("selected_title"):
         return False
 
-    # 마지막 저장 시간 확인
-    last_save = st.session_state.get("last_save_time")
-    if last_save is None:
+    # 백그라운드 저장이 아직 진행 중이면 다시 요청하지 않음
+    status = get_autosave_status()
+    if status and status.get("state") in (STATUS_PENDING, STATUS_SAVING):
+        return False
+
+    # 마지막 저장(또는 저장 요청) 시간 확인 - 실패했어도 다음 주기에 다시 시도
+    times = [st.session_state.get("last_save_time"), st.session_state.get("autosave_queued_at")]
+    times = [value for value in times if value]
+    if not times:
         return True
 
     try:
-        last_save_dt = datetime.fromisoformat(last_save)
+        last_save_dt = max(datetime.fromisoformat(value) for value in times)
         time_diff = datetime.now() - last_save_dt
         return time_diff.total_seconds() >= AUTOSAVE_INTERVAL_SECONDS
     except Exception:
@@ -416,10 +678,19 @@ def format_backup_info(backup: Dict[str, Any]) -> str:
 # ===== UI 렌더링 함수 =====
 
 def render_autosave_status():
-    """자동 저장 상태 표시 UI"""
+    """자동 저장 상태 표시 UI (백그라운드 저장 중/실패도 표시, 기다리지 않음)"""
+    status = get_autosave_status() or {}
     time_since_save = get_time_since_last_save()
 
-    if time_since_save == "저장 안 됨":
+    if status.get("state") in (STATUS_PENDING, STATUS_SAVING):
+        status_color = "#2196F3"
+        status_text = "저장 중..."
+        status_icon = "⏳"
+    elif status.get("state") == STATUS_FAILED:
+        status_color = "#F44336"
+        status_text = "자동 저장 실패 - '지금 저장하기'를 눌러 주세요"
+        status_icon = "⚠️"
+    elif time_since_save == "저장 안 됨":
         status_color = "#FF9800"
         status_text = "저장 안 됨"
         status_icon = "💾"
@@ -475,7 +746,7 @@ def render_backup_list():
     """저장된 작업 목록 UI"""
     st.markdown("### 📂 저장된 작업 목록")
 
-    backups = get_all_backups()
+    backups = get_all_backups(limit=10)  # 최대 10개 표시
 
     if not backups:
         st.info("💡 저장된 작업이 없어요.")
@@ -484,9 +755,9 @@ def render_backup_list():
             st.rerun()
         return
 
-    st.markdown(f"총 **{len(backups)}**개의 저장된 작업이 있어요.")
+    st.markdown(f"총 **{count_backups()}**개의 저장된 작업이 있어요.")
 
-    for idx, backup in enumerate(backups[:10]):  # 최대 10개 표시
+    for idx, backup in enumerate(backups):
         info = format_backup_info(backup)
 
         col1, col2, col3 = st.columns([5, 1, 1])
@@ -580,18 +851,69 @@ def render_recovery_prompt():
     return True  # 복구 화면이 표시됨
 
 
+def _write_autosave(student_name: str, data: Dict[str, Any]) -> Optional[str]:
+    """백그라운드 작업자가 부르는 자동 저장"""
+    return write_backup(student_name, data, is_autosave=True)
+
+
+def queue_autosave(student_name: str = None, immediate: bool = False) -> bool:
+    """
+    현재 세션 스냅샷을 백그라운드 자동 저장 큐에 넣고 바로 반환
+
+    Args:
+        student_name: 학생 이름 (None이면 세션에서 가져옴)
+        immediate: True면 기다리지 않고 바로 저장 (중요 변경)
+
+    Returns:
+        큐에 넣었으면 True
+    """
+    try:
+        student_name = get_student_name(student_name)
+        data = get_session_data()
+        data["student_name"] = student_name
+        data["is_autosave"] = True
+
+        key = sanitize_filename(student_name)
+        get_autosave_writer(_write_autosave).submit(key, student_name, snapshot_session_data(data), immediate=immediate)
+        st.session_state.autosave_key = key
+        st.session_state.autosave_queued_at = datetime.now().isoformat()
+        return True
+    except Exception as e:
+        print(f"자동 저장 요청 실패: {e}")
+        return False
+
+
+def get_autosave_status() -> Optional[Dict[str, Any]]:
+    """
+    이 세션의 백그라운드 자동 저장 상태 (저장이 끝났으면 마지막 저장 시간도 갱신)
+
+    Returns:
+        {"state": pending/saving/saved/failed, ...} 또는 None (요청한 적 없음)
+    """
+    key = st.session_state.get("autosave_key")
+    if not key:
+        return None
+    status = get_autosave_writer(_write_autosave).status(key)
+    if status and status.get("saved_at"):
+        saved_at = datetime.fromtimestamp(status["saved_at"]).isoformat()
+        if saved_at != st.session_state.get("last_save_time") and status["state"] != STATUS_FAILED:
+            st.session_state.last_save_time = saved_at
+            st.session_state.last_save_filename = key + JOURNAL_SUFFIX
+    return status
+
+
 def perform_autosave_if_needed():
-    """자동 저장 수행 (필요한 경우)"""
+    """자동 저장 수행 (필요한 경우, 백그라운드에서 저장)"""
     if should_autosave():
         student_name = st.session_state.get("book_info", {}).get("name", "")
         if student_name or st.session_state.get("drafts"):
-            save_progress(student_name, is_autosave=True)
+            queue_autosave(student_name)
 
 
 def trigger_important_save(event_name: str = ""):
-    """중요 변경 후 즉시 저장 트리거"""
+    """중요 변경 후 즉시 저장 트리거 (기다리지 않고 바로 백그라운드 저장)"""
     student_name = st.session_state.get("book_info", {}).get("name", "")
-    result = save_progress(student_name, is_autosave=True)
+    result = queue_autosave(student_name, immediate=True)
     if result:
         st.session_state.last_important_save = {
             "time": datetime.now().isoformat(),
@@ -606,6 +928,8 @@ def init_autosave_state():
         "last_save_time": None,
         "last_save_filename": None,
         "last_important_save": None,
+        "autosave_key": None,
+        "autosave_queued_at": None,
         "recovery_checked": False,
         "show_backup_list": False,
     }
@@ -0,0 +1,172 @@
+"""
+백그라운드 자동 저장 모듈
+==========================
+- 자동 저장을 화면 그리기(스크립트 실행) 중에 하지 않고 백그라운드 스레드 하나가 대신 씀
+- 화면 쪽은 세션 스냅샷을 큐에 넣기만 하고 바로 돌아감
+- 같은 학생의 스냅샷이 쌓이면 가장 최신 것 하나만 남김 (coalescing)
+- 마지막 요청 뒤 잠깐(debounce) 기다렸다가 모인 학생들을 한 번에 저장 (계속 요청이 와도 최대 대기 시간 안에는 저장)
+- 학생별 저장 상태(대기/저장 중/저장됨/실패)를 보관해서 자동 저장 표시에 사용
+- 앱 종료 때 남은 스냅샷을 마저 저장
+"""
+
+import atexit
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+
+# 마지막 요청 뒤 기다리는 시간 (초) - 연달아 바뀌는 동안은 한 번만 저장
+AUTOSAVE_DEBOUNCE_SECONDS = 2.0
+# 요청이 계속 와도 처음 요청 뒤 이 시간 안에는 저장 (초)
+AUTOSAVE_MAX_DELAY_SECONDS = 10.0
+# 종료 때 남은 저장을 기다리는 시간 (초)
+SHUTDOWN_FLUSH_SECONDS = 10.0
+
+STATUS_PENDING = "pending"
+STATUS_SAVING = "saving"
+STATUS_SAVED = "saved"
+STATUS_FAILED = "failed"
+
+
+def snapshot_session_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    저장용 세션 스냅샷 (화면이 이후 세션을 바꿔도 영향 없음)
+
+    deepcopy는 문자열을 복사하지 않으므로 초안/자막 길이가 아니라 항목 수에 비례합니다.
+    """
+    return copy.deepcopy(data)
+
+
+class AutosaveWriter:
+    """학생별 최신 스냅샷을 모아 백그라운드에서 저장하는 작업자 (프로세스에 하나)"""
+
+    def __init__(
+        self,
+        save_fn: Callable[[str, Dict[str, Any]], Optional[str]],
+        debounce_seconds: float = AUTOSAVE_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = AUTOSAVE_MAX_DELAY_SECONDS,
+    ):
+        self.save_fn = save_fn
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._condition = threading.Condition()
+        self._pending: Dict[str, dict] = {}   # 학생 키 -> {student_name, data, first_at, last_at, immediate}
+        self._status: Dict[str, dict] = {}    # 학생 키 -> 저장 상태
+        self._saving = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, key: str, student_name: str, data: Dict[str, Any], immediate: bool = False):
+        """
+        스냅샷을 큐에 넣음 (같은 학생의 이전 스냅샷은 대체)
+
+        Args:
+            key: 학생 키 (같은 키끼리 합쳐짐)
+            student_name: 저장할 때 넘길 학생 이름
+            data: 세션 스냅샷 (snapshot_session_data로 복사한 것)
+            immediate: True면 기다리지 않고 바로 저장 (중요 변경)
+        """
+        now = time.monotonic()
+        with self._condition:
+            previous = self._pending.get(key)
+            self._pending[key] = {
+                "student_name": student_name,
+                "data": data,
+                "first_at": previous["first_at"] if previous else now,
+                "last_at": now,
+                "immediate": immediate or bool(previous and previous["immediate"]),
+            }
+            status = self._status.setdefault(key, {})
+            status.update({"state": STATUS_PENDING, "queued_at": time.time()})
+            self._ensure_thread()
+            self._condition.notify_all()
+
+    def status(self, key: str) -> Optional[dict]:
+        """학생 저장 상태 (state, saved_at, result, error)"""
+        with self._condition:
+            status = self._status.get(key)
+            return dict(status) if status else None
+
+    def flush(self, timeout: float = None) -> bool:
+        """대기 중인 스냅샷을 바로 저장하고 끝날 때까지 기다림 (시간 안에 끝나면 True)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            for entry in self._pending.values():
+                entry["immediate"] = True
+            self._condition.notify_all()
+            while self._pending or self._saving:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+            self._thread.start()
+
+    def _due_in(self, entry: dict, now: float) -> float:
+        """저장할 때까지 남은 시간 (0 이하면 지금 저장)"""
+        if entry["immediate"]:
+            return 0.0
+        return min(entry["last_at"] + self.debounce_seconds, entry["first_at"] + self.max_delay_seconds) - now
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    now = time.monotonic()
+                    waits = [self._due_in(entry, now) for entry in self._pending.values()]
+                    if waits and min(waits) <= 0:
+                        break
+                    self._condition.wait(min(waits) if waits else None)
+
+                # 저장할 때가 된 학생들을 한 번에 꺼냄
+                now = time.monotonic()
+                batch = {key: entry for key, entry in self._pending.items() if self._due_in(entry, now) <= 0}
+                for key in batch:
+                    del self._pending[key]
+                    self._status[key]["state"] = STATUS_SAVING
+                self._saving += len(batch)
+
+            for key, entry in batch.items():
+                try:
+                    result = self.save_fn(entry["student_name"], entry["data"])
+                    error = None if result else "저장 결과 없음"
+                except Exception as e:
+                    result, error = None, str(e)
+                    print(f"자동 저장 실패 ({key}): {e}")
+
+                with self._condition:
+                    self._saving -= 1
+                    status = self._status[key]
+                    if key in self._pending:
+                        # 저장하는 사이에 새 스냅샷이 들어왔으면 대기 상태 유지
+                        status["state"] = STATUS_PENDING
+                    elif error:
+                        status["state"] = STATUS_FAILED
+                    else:
+                        status["state"] = STATUS_SAVED
+                    if error:
+                        status["error"] = error
+                        status["failed_at"] = time.time()
+                    else:
+                        status.pop("error", None)
+                        status["saved_at"] = time.time()
+                        status["result"] = result
+                    self._condition.notify_all()
+
+
+_writer: Optional[AutosaveWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_autosave_writer(save_fn: Callable[[str, Dict[str, Any]], Optional[str]]) -> AutosaveWriter:
+    """프로세스 공용 작업자 (처음 부를 때 만들고 종료 때 남은 저장을 마저 씀)"""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = AutosaveWriter(save_fn)
+            atexit.register(_writer.flush, SHUTDOWN_FLUSH_SECONDS)
+        return _writer
@@ -0,0 +1,279 @@
+"""
+백업 목록 인덱스 모듈
+======================
+- 백업마다 목록 표시용 메타 정보(학생, 제목, 단계, 꼭지 수, 글자 수, 시각)를 SQLite 한 곳에 보관
+- 저장/정리/삭제 때 해당 행만 트랜잭션으로 갱신
+- 목록/최근 작업/학생별 조회는 인덱스 조회로 끝남 (백업 파일을 열지 않음)
+- 인덱스가 처음 만들어질 때만 기존 백업 파일을 모두 열어서 채움
+- 이후에는 가끔(MANIFEST_SYNC_SECONDS마다) 파일 이름만 훑어 인덱스에 빠진 백업만 열어서 추가
+- 백업이 참조하는 본문 blob 해시도 함께 기록 (정리할 때 더 이상 안 쓰는 blob 찾기)
+
+앱 시작과 백업 목록 화면마다 모든 백업 JSON을 열어 읽던 부분을 대체합니다.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+MANIFEST_COLUMNS = (
+    "filename",
+    "student_key",
+    "student_name",
+    "saved_at",
+    "selected_title",
+    "current_step",
+    "drafts_count",
+    "total_chars",
+    "file_size",
+    "modified_time",
+    "is_journal",
+)
+
+# 백업 이름 규칙 (파일 백엔드와 SQLite 저장소가 함께 사용)
+BACKUP_FILENAME_PATTERN = re.compile(r"^(.+)_\d{8}_\d{6}\.json$")  # 수동 백업: 학생이름_날짜_시간.json
+JOURNAL_SUFFIX = ".journal"  # 자동 저장 저널: 학생이름.journal
+
+# 인덱스에 빠진 백업(인덱스 갱신 실패, 밖에서 넣은 파일)을 찾아 채우는 간격 (초)
+MANIFEST_SYNC_SECONDS = 30
+
+
+class BackupManifest:
+    """백업 메타 정보 인덱스 (SQLite)"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+        # 마지막으로 빠진 백업을 찾아 채운 시각 (None이면 다음 조회 때 바로 찾음)
+        self.synced_at: Optional[float] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS backups (
+                            filename TEXT PRIMARY KEY,
+                            student_key TEXT NOT NULL,
+                            student_name TEXT,
+                            saved_at TEXT,
+                            selected_title TEXT,
+                            current_step INTEGER,
+                            drafts_count INTEGER,
+                            total_chars INTEGER,
+                            file_size INTEGER,
+                            modified_time REAL NOT NULL,
+                            is_journal INTEGER NOT NULL DEFAULT 0
+                        )
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_backups_modified ON backups (modified_time)")
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_backups_student ON backups (student_key, modified_time)")
+                    conn.execute("CREATE TABLE IF NOT EXISTS manifest_meta (key TEXT PRIMARY KEY, value TEXT)")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS blob_refs (
+                            filename TEXT NOT NULL,
+                            digest TEXT NOT NULL,
+                            PRIMARY KEY (filename, digest)
+                        ) WITHOUT ROWID
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_blob_refs_digest ON blob_refs (digest)")
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def is_built(self) -> bool:
+        """기존 백업 파일로 처음 채우기를 마쳤는지"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM manifest_meta WHERE key = 'built'").fetchone()
+            return row is not None
+        finally:
+            conn.close()
+
+    def rebuild(self, entries: Iterable[Dict[str, Any]]):
+        """전체 다시 채우기 (한 트랜잭션)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM backups")
+                conn.execute("DELETE FROM blob_refs")
+                for entry in entries:
+                    conn.execute(self._upsert_sql(), self._row(entry))
+                    self._write_refs(conn, entry)
+                conn.execute("INSERT OR REPLACE INTO manifest_meta (key, value) VALUES ('built', '1')")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _upsert_sql() -> str:
+        placeholders = ", ".join("?" for _ in MANIFEST_COLUMNS)
+        return f"INSERT OR REPLACE INTO backups ({', '.join(MANIFEST_COLUMNS)}) VALUES ({placeholders})"
+
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> tuple:
+        return tuple(
+            int(bool(entry.get(column))) if column == "is_journal" else entry.get(column)
+            for column in MANIFEST_COLUMNS
+        )
+
+    @staticmethod
+    def _write_refs(conn: sqlite3.Connection, entry: Dict[str, Any]):
+        """entry에 blob_refs가 있으면 해당 백업의 참조 목록 교체"""
+        if "blob_refs" not in entry:
+            return
+        conn.execute("DELETE FROM blob_refs WHERE filename = ?", (entry["filename"],))
+        conn.executemany(
+            "INSERT OR IGNORE INTO blob_refs (filename, digest) VALUES (?, ?)",
+            [(entry["filename"], digest) for digest in entry["blob_refs"]],
+        )
+
+    @staticmethod
+    def _delete_rows(conn: sqlite3.Connection, filenames: Iterable[str]):
+        params = [(name,) for name in filenames]
+        conn.executemany("DELETE FROM backups WHERE filename = ?", params)
+        conn.executemany("DELETE FROM blob_refs WHERE filename = ?", params)
+
+    def add(self, entries: Iterable[Dict[str, Any]]):
+        """백업 여러 개 추가/갱신 (한 트랜잭션)"""
+        conn = self._connect()
+        try:
+            with conn:
+                for entry in entries:
+                    conn.execute(self._upsert_sql(), self._row(entry))
+                    self._write_refs(conn, entry)
+        finally:
+            conn.close()
+
+    def filenames(self) -> Set[str]:
+        """인덱스에 있는 백업 이름"""
+        conn = self._connect()
+        try:
+            return {row[0] for row in conn.execute("SELECT filename FROM backups")}
+        finally:
+            conn.close()
+
+    def upsert(self, entry: Dict[str, Any], remove: Iterable[str] = ()):
+        """백업 하나 추가/갱신 (같은 트랜잭션에서 정리된 백업 행 삭제)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(self._upsert_sql(), self._row(entry))
+                self._write_refs(conn, entry)
+                self._delete_rows(conn, remove)
+        finally:
+            conn.close()
+
+    def remove(self, filenames: Iterable[str]):
+        """백업 행 삭제 (참조 목록도 함께)"""
+        conn = self._connect()
+        try:
+            with conn:
+                self._delete_rows(conn, filenames)
+        finally:
+            conn.close()
+
+    def blob_refs(self, filenames: Iterable[str]) -> List[str]:
+        """백업들이 참조하는 blob 해시"""
+        conn = self._connect()
+        try:
+            digests = set()
+            for name in filenames:
+                digests.update(row[0] for row in conn.execute("SELECT digest FROM blob_refs WHERE filename = ?", (name,)))
+            return sorted(digests)
+        finally:
+            conn.close()
+
+    def unreferenced(self, digests: Iterable[str]) -> List[str]:
+        """어떤 백업도 참조하지 않는 해시만 골라냄"""
+        conn = self._connect()
+        try:
+            return [
+                digest for digest in digests
+                if conn.execute("SELECT 1 FROM blob_refs WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None
+            ]
+        finally:
+            conn.close()
+
+    def list(self, student_key: str = None, limit: int = None, include_journals: bool = True) -> List[Dict[str, Any]]:
+        """백업 목록 (최신순, 학생 지정 가능)"""
+        query, params = backup_list_query(student_key, limit, include_journals)
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def latest(self) -> Optional[Dict[str, Any]]:
+        """가장 최근 백업 (없으면 None)"""
+        rows = self.list(limit=1)
+        return rows[0] if rows else None
+
+    def count(self) -> int:
+        """백업 수"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM backups").fetchone()[0]
+        finally:
+            conn.close()
+
+
+def backup_list_query(student_key: str = None, limit: int = None, include_journals: bool = True) -> Tuple[str, list]:
+    """
+    백업 목록 조회 SQL (최신순, 같은 시각이면 나중에 넣은 것 먼저)
+
+    인덱스와 SQLite 저장소의 backups 테이블이 같은 열을 쓰므로 두 곳에서 함께 사용합니다.
+
+    Returns:
+        (SQL, 파라미터)
+    """
+    query = f"SELECT {', '.join(MANIFEST_COLUMNS)} FROM backups"
+    conditions, params = [], []
+    if student_key is not None:
+        conditions.append("student_key = ?")
+        params.append(student_key)
+    if not include_journals:
+        conditions.append("is_journal = 0")
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY modified_time DESC, rowid DESC"
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(int(limit))
+    return query, params
+
+
+def ensure_manifest(
+    manifest: BackupManifest,
+    scan_fn: Callable[[], Iterable[Dict[str, Any]]],
+    catch_up_fn: Callable[[Set[str]], Iterable[Dict[str, Any]]] = None,
+    force: bool = False,
+) -> BackupManifest:
+    """
+    인덱스가 아직 없으면 기존 백업을 한 번 훑어서 채우고, 이후에는 빠진 백업만 채움
+
+    Args:
+        scan_fn: 모든 백업의 인덱스 행 (처음 한 번)
+        catch_up_fn: 인덱스에 있는 이름을 받아 빠진 백업의 인덱스 행만 반환
+        force: True면 간격과 상관없이 빠진 백업을 바로 찾음
+    """
+    now = time.monotonic()
+    if not force and manifest.synced_at is not None and now - manifest.synced_at < MANIFEST_SYNC_SECONDS:
+        return manifest
+
+    if not manifest.is_built():
+        manifest.rebuild(scan_fn())
+    elif catch_up_fn is not None:
+        missing = list(catch_up_fn(manifest.filenames()))
+        if missing:
+            manifest.add(missing)
+    manifest.synced_at = now
+    return manifest
@@ -0,0 +1,227 @@
+"""
+초안 일괄 생성(Message Batches) 핸들러
+========================================
+- 남은 꼭지 초안 요청을 하나의 Message Batch로 제출 (Haiku 비용 50% 절감)
+- 배치 ID는 세션(→ 자동 저장 파일)에 보관해서 새로고침/재접속 후에도 이어서 확인
+- 백그라운드 스레드가 주기적으로 상태를 확인하고, 끝나면 결과를 보관
+- 화면은 다시 그려질 때 보관된 결과를 drafts에 반영
+
+실시간으로 볼 필요가 없는 '전체 자동 생성'용이며, 결과는 보통 수 분~수 시간
+(최대 24시간) 뒤에 도착합니다.
+"""
+
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from utils.claude_client import (
+    DRAFT_MAX_TOKENS,
+    DRAFT_SYSTEM_PROMPT,
+    MODELS,
+    get_client,
+)
+
+
+# 배치 상태 확인 주기 (초)
+BATCH_POLL_INTERVAL_SECONDS = 30
+# 상태 확인이 연속으로 이만큼 실패하면 폴링 중단 (다음 화면 갱신 때 다시 시작)
+MAX_POLL_FAILURES = 5
+
+# 배치 ID별 확인 결과 / 폴링 스레드 (프로세스 전체 공유)
+_batch_results: Dict[str, dict] = {}
+_pollers: Dict[str, threading.Thread] = {}
+_lock = threading.Lock()
+
+
+def build_draft_requests(book_info: dict, sections: List[Tuple[str, dict]]) -> Tuple[List[dict], Dict[str, str]]:
+    """
+    꼭지별 초안 요청 목록 생성
+
+    custom_id는 영문/숫자만 허용되므로 순번을 쓰고, 섹션 키와의 대응표를 함께 반환합니다.
+
+    Returns:
+        (배치 요청 리스트, {custom_id: 섹션 키})
+    """
+    from prompts.templates import get_draft_generation_prompt
+
+    requests = []
+    id_map = {}
+    for index, (key, section_info) in enumerate(sections):
+        custom_id = f"section-{index}"
+        id_map[custom_id] = key
+        requests.append({
+            "custom_id": custom_id,
+            "params": {
+                "model": MODELS["haiku"],
+                "max_tokens": DRAFT_MAX_TOKENS,
+                "system": DRAFT_SYSTEM_PROMPT,
+                "messages": [
+                    {"role": "user", "content": get_draft_generation_prompt(book_info, section_info)}
+                ],
+            },
+        })
+    return requests, id_map
+
+
+def submit_draft_batch(book_info: dict, sections: List[Tuple[str, dict]], client=None) -> Optional[dict]:
+    """
+    초안 요청을 하나의 배치로 제출
+
+    Returns:
+        세션/자동 저장에 보관할 작업 정보 딕셔너리 또는 None (실패 시)
+    """
+    if not sections:
+        return None
+
+    client = client or get_client()
+    if client is None:
+        return None
+
+    requests, id_map = build_draft_requests(book_info, sections)
+    batch = client.messages.batches.create(requests=requests)
+
+    return {
+        "batch_id": batch.id,
+        "sections": id_map,
+        "submitted_at": datetime.now().isoformat(),
+    }
+
+
+def check_draft_batch(job: dict, client) -> dict:
+    """
+    배치 상태를 한 번 확인하고, 끝났으면 결과를 모아서 반환
+
+    Returns:
+        {"status": "in_progress" | "ended",
+         "drafts": {섹션 키: 초안}, "failed": [섹션 키], "counts": {...}}
+    """
+    batch = client.messages.batches.retrieve(job["batch_id"])
+    counts = getattr(batch, "request_counts", None)
+    result = {
+        "status": "in_progress",
+        "drafts": {},
+        "failed": [],
+        "counts": {
+            "processing": getattr(counts, "processing", 0),
+            "succeeded": getattr(counts, "succeeded", 0),
+            "errored": getattr(counts, "errored", 0),
+        },
+    }
+
+    if batch.processing_status != "ended":
+        return result
+
+    result["status"] = "ended"
+    id_map = job.get("sections", {})
+    for entry in client.messages.batches.results(job["batch_id"]):
+        key = id_map.get(entry.custom_id)
+        if key is None:
+            continue
+
+        text = None
+        if entry.result.type == "succeeded":
+            content = entry.result.message.content
+            text = content[0].text if content else None
+
+        if text:
+            result["drafts"][key] = text
+        else:
+            result["failed"].append(key)
+
+    return result
+
+
+def _poll_until_done(job: dict, client, interval: float):
+    """배치가 끝날 때까지 주기적으로 확인하는 스레드 본문"""
+    batch_id = job["batch_id"]
+    failures = 0
+
+    try:
+        while True:
+            try:
+                result = check_draft_batch(job, client)
+                failures = 0
+            except Exception as e:
+                failures += 1
+                if failures >= MAX_POLL_FAILURES:
+                    with _lock:
+                        _batch_results[batch_id] = {"status": "error", "error": str(e)[:500]}
+                    return
+                time.sleep(interval)
+                continue
+
+            with _lock:
+                _batch_results[batch_id] = result
+            if result["status"] == "ended":
+                return
+            time.sleep(interval)
+    finally:
+        with _lock:
+            _pollers.pop(batch_id, None)
+
+
+def start_batch_poller(job: dict, client=None, interval: float = BATCH_POLL_INTERVAL_SECONDS) -> bool:
+    """
+    배치 상태를 백그라운드에서 확인하는 스레드 시작 (이미 실행 중이면 그대로 둠)
+
+    Returns:
+        스레드가 실행 중이거나 결과가 이미 있으면 True
+    """
+    batch_id = job.get("batch_id") if job else None
+    if not batch_id:
+        return False
+
+    with _lock:
+        if batch_id in _pollers or _batch_results.get(batch_id, {}).get("status") == "ended":
+            return True
+        # 이전 폴링이 오류로 멈췄으면 결과를 지우고 다시 시작
+        _batch_results.pop(batch_id, None)
+
+    client = client or get_client()
+    if client is None:
+        return False
+
+    with _lock:
+        if batch_id in _pollers:
+            return True
+        thread = threading.Thread(
+            target=_poll_until_done,
+            args=(job, client, interval),
+            name=f"batch-poller-{batch_id}",
+            daemon=True,
+        )
+        _pollers[batch_id] = thread
+        thread.start()
+    return True
+
+
+def get_batch_status(job: dict) -> Optional[dict]:
+    """백그라운드 폴링으로 확인된 최신 결과 (아직 없으면 None)"""
+    if not job:
+        return None
+    with _lock:
+        return _batch_results.get(job.get("batch_id"))
+
+
+def apply_batch_results(job: dict, drafts: dict) -> Optional[dict]:
+    """
+    끝난 배치 결과를 drafts에 반영 (이미 쓴 꼭지는 덮어쓰지 않음)
+
+    Returns:
+        배치가 끝났으면 {"added": [섹션 키], "failed": [섹션 키]}, 아니면 None
+    """
+    status = get_batch_status(job)
+    if not status or status.get("status") != "ended":
+        return None
+
+    added = []
+    for key, text in status["drafts"].items():
+        if key not in drafts:
+            drafts[key] = text
+            added.append(key)
+
+    with _lock:
+        _batch_results.pop(job["batch_id"], None)
+
+    return {"added": added, "failed": list(status["failed"])}
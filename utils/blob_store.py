@@ -0,0 +1,163 @@
+"""
+백업 내용 저장소 모듈 (content-addressed)
+==========================================
+- 꼭지 초안과 영상 자막을 내용 해시(SHA-256) 이름의 압축 파일(blob)로 한 번만 저장
+- 백업 JSON에는 본문 대신 {"$blob": 해시} 참조만 남김 (안 바뀐 꼭지는 백업끼리 같은 파일을 공유)
+- 본문은 zlib으로 압축 (디스크 캐시와 같은 방식)
+- 백업을 불러올 때 참조를 본문으로 다시 바꿔 넣음
+
+학생마다 돌아가며 남기는 백업이 매번 책 전체를 통째로 복사하던 부분을 대체합니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from utils.disk_cache import dumps_compact
+
+
+BLOB_REF_KEY = "$blob"
+
+# 본문을 따로 저장하는 항목: 꼭지/영상별 딕셔너리와 통합 자막 문자열
+BLOB_SECTION_FIELDS = ("drafts", "youtube_transcripts")
+BLOB_VALUE_FIELDS = ("youtube_merged_transcript",)
+
+# 이보다 짧은 값은 참조보다 그냥 넣는 게 작음
+BLOB_MIN_CHARS = 256
+COMPRESS_LEVEL = 6
+
+# 방금 다시 쓰인 blob은 정리하지 않음 (다른 세션이 같은 내용을 저장하는 중일 수 있음)
+BLOB_GC_GRACE_SECONDS = 60
+
+
+def is_blob_ref(value: Any) -> bool:
+    """{"$blob": 해시} 참조인지 확인"""
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(BLOB_REF_KEY), str)
+
+
+class BlobStore:
+    """해시 이름의 압축 파일 저장소 (디렉토리 하나, 앞 두 글자로 하위 폴더 분산)"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+
+    def path(self, digest: str) -> Path:
+        return self.directory / digest[:2] / digest
+
+    def put(self, value: Any) -> str:
+        """값 저장 후 해시 반환 (같은 내용이 이미 있으면 쓰지 않음)"""
+        payload = dumps_compact(value).encode("utf-8")
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self.path(digest)
+        if path.exists():
+            # 정리 대상에서 빠지도록 시각만 갱신
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{digest}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(zlib.compress(payload, COMPRESS_LEVEL))
+        temp_path.replace(path)
+        return digest
+
+    def get(self, digest: str) -> Any:
+        """해시로 값 읽기 (없으면 FileNotFoundError)"""
+        return json.loads(zlib.decompress(self.path(digest).read_bytes()).decode("utf-8"))
+
+    def delete(self, digests: Iterable[str], grace_seconds: float = None) -> int:
+        """blob 삭제 (최근에 쓰인 것은 건너뜀) 후 삭제 수 반환"""
+        deleted = 0
+        cutoff = time.time() - (BLOB_GC_GRACE_SECONDS if grace_seconds is None else grace_seconds)
+        for digest in digests:
+            path = self.path(digest)
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                deleted += 1
+            except OSError:
+                continue
+        return deleted
+
+
+def externalize_blobs(data: Dict[str, Any], store: BlobStore) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    긴 본문을 blob으로 저장하고 참조로 바꾼 사본 반환
+
+    Returns:
+        (참조로 바꾼 데이터, 참조한 해시 목록)
+    """
+    result = dict(data)
+    refs: Set[str] = set()
+
+    def to_ref(value: Any) -> Any:
+        if is_blob_ref(value) or len(dumps_compact(value)) < BLOB_MIN_CHARS:
+            return value
+        digest = store.put(value)
+        refs.add(digest)
+        return {BLOB_REF_KEY: digest}
+
+    for field in BLOB_SECTION_FIELDS:
+        sections = data.get(field)
+        if isinstance(sections, dict):
+            result[field] = {key: to_ref(value) for key, value in sections.items()}
+    for field in BLOB_VALUE_FIELDS:
+        if field in data:
+            result[field] = to_ref(data[field])
+    return result, sorted(refs)
+
+
+def collect_blob_refs(data: Dict[str, Any]) -> List[str]:
+    """백업 데이터가 참조하는 해시 목록"""
+    refs: Set[str] = set()
+    for field in BLOB_SECTION_FIELDS:
+        sections = data.get(field)
+        if isinstance(sections, dict):
+            refs.update(value[BLOB_REF_KEY] for value in sections.values() if is_blob_ref(value))
+    for field in BLOB_VALUE_FIELDS:
+        if is_blob_ref(data.get(field)):
+            refs.add(data[field][BLOB_REF_KEY])
+    return sorted(refs)
+
+
+def resolve_blobs(data: Dict[str, Any], store: BlobStore) -> Dict[str, Any]:
+    """
+    참조를 본문으로 바꾼 데이터 반환 (참조가 없는 예전 백업은 그대로)
+
+    blob이 없어진 꼭지는 빼고 나머지는 살립니다.
+    """
+    def resolve(field: str, key: Any, value: Any) -> Tuple[bool, Any]:
+        if not is_blob_ref(value):
+            return True, value
+        try:
+            return True, store.get(value[BLOB_REF_KEY])
+        except Exception as e:
+            print(f"백업 본문 읽기 실패 ({field} {key}): {e}")
+            return False, None
+
+    result = dict(data)
+    for field in BLOB_SECTION_FIELDS:
+        sections = data.get(field)
+        if isinstance(sections, dict):
+            resolved = {}
+            for key, value in sections.items():
+                ok, content = resolve(field, key, value)
+                if ok:
+                    resolved[key] = content
+            result[field] = resolved
+    for field in BLOB_VALUE_FIELDS:
+        if field in data:
+            ok, content = resolve(field, "", data[field])
+            if ok:
+                result[field] = content
+            else:
+                result.pop(field)
+    return result
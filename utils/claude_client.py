@@ -1,8 +1,16 @@
 """Claude API 클라이언트 모듈 - 모델 혼합 사용 + 강화된 에러 핸들링"""
 import streamlit as st
-from anthropic import Anthropic
+from anthropic import Anthropic, DefaultHttpxClient
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+from utils.disk_cache import DiskCache, make_cache_key
+from utils.http_pool import build_http_client, build_timeout, get_shared_client
+from utils.rate_limiter import RequestScheduler, backoff_delay, get_retry_after
+from utils.transcript_index import PART_HEADER_PATTERN, TranscriptIndex
 
 
 # 모델 설정 (용도별 최적화)
@@ -66,7 +74,52 @@ AI가 처리하기 어려운 내용이 있을 수 있어요.
 
 # 재시도 설정
 MAX_RETRIES = 3
-RETRY_DELAY = 2  # 초
+RETRY_DELAY = 2  # 초 (지수 백오프 기본값)
+NON_RETRYABLE_ERRORS = ["api_key", "invalid_request", "content_policy"]
+
+# 모델별 요청 한도 (모든 세션 공유, Secrets의 RATE_LIMIT_OPUS_RPM 등으로 변경 가능)
+DEFAULT_RATE_LIMITS = {
+    "opus": {"rpm": 50, "tpm": 80000},
+    "sonnet": {"rpm": 50, "tpm": 80000},
+    "haiku": {"rpm": 50, "tpm": 100000},
+}
+SCHEDULER_MAX_WAIT_SECONDS = 180  # 차례를 기다리는 최대 시간
+CHARS_PER_TOKEN_ESTIMATE = 1.5  # 한국어 기준 대략적인 글자/토큰 비율 (넉넉히 예약)
+
+# 사용량 집계 항목 (프롬프트 캐시 절감 효과 확인용)
+USAGE_STAT_FIELDS = [
+    "requests",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_input_tokens",
+    "cache_creation_input_tokens",
+]
+
+# 응답 캐시 설정 (같은 요청이면 API 재호출 없이 저장된 응답 사용)
+RESPONSE_CACHE_PATH = Path(__file__).parent.parent / "data" / "cache" / "responses.sqlite3"
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 3600  # 7일
+RESPONSE_CACHE_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+
+_response_cache = DiskCache(
+    RESPONSE_CACHE_PATH,
+    ttl_seconds=RESPONSE_CACHE_TTL_SECONDS,
+    max_bytes=RESPONSE_CACHE_MAX_BYTES,
+)
+
+# 꼭지 초안 생성 설정 (일괄 처리 모드와 공유)
+DRAFT_SYSTEM_PROMPT = "당신은 베스트셀러 작가의 고스트라이터입니다. 독자가 술술 읽히는 글을 씁니다."
+DRAFT_MAX_TOKENS = 4096
+
+# 전체 자동 생성 동시 요청 수 (Secrets의 DRAFT_MAX_CONCURRENCY로 변경 가능)
+DEFAULT_MAX_CONCURRENCY = 5
+MAX_CONCURRENCY_LIMIT = 20
+
+# 긴 자막 요약(map-reduce) 설정
+DIGEST_MAX_CHARS = 8000  # 분석/제목/목차 요청에 넣는 자막 요약 최대 길이
+DIGEST_CHUNK_CHARS = 6000  # 한 번에 요약할 자막 조각 크기
+DIGEST_SUMMARY_MAX_TOKENS = 1024
+DIGEST_MAX_ROUNDS = 3  # 요약을 합쳐도 길면 다시 요약하는 최대 횟수
+TRANSCRIPT_SUMMARY_SYSTEM_PROMPT = "당신은 강의 내용을 빠짐없이 정리하는 편집 보조입니다. 말한 내용만 요약하고 새로운 내용을 지어내지 않습니다."
 
 
 def classify_error(error: Exception) -> str:
@@ -104,6 +157,15 @@ def classify_error(error: Exception) -> str:
     return "unknown"
 
 
+class StreamInterruptedError(Exception):
+    """스트리밍 응답이 중간에 끊김 (그때까지 받은 텍스트는 partial_text)"""
+
+    def __init__(self, error_type: str, partial_text: str):
+        super().__init__(f"stream interrupted: {error_type}")
+        self.error_type = error_type
+        self.partial_text = partial_text
+
+
 def with_retry(max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY):
     """API 호출 재시도 데코레이터"""
     def decorator(func):
@@ -119,13 +181,12 @@ def with_retry(max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY):
                     error_type = classify_error(e)
 
                     # 재시도가 의미 없는 에러는 바로 반환
-                    if error_type in ["api_key", "invalid_request", "content_policy"]:
+                    if error_type in NON_RETRYABLE_ERRORS:
                         raise e
 
-                    # 마지막 시도가 아니면 대기 후 재시도
+                    # 마지막 시도가 아니면 대기 후 재시도 (지터 지수 백오프)
                     if attempt < max_retries - 1:
-                        wait_time = delay * (attempt + 1)  # 점진적 대기
-                        time.sleep(wait_time)
+                        time.sleep(backoff_delay(attempt, delay, retry_after=get_retry_after(e)))
                         continue
                     else:
                         raise e
@@ -135,14 +196,176 @@ def with_retry(max_retries: int = MAX_RETRIES, delay: float = RETRY_DELAY):
     return decorator
 
 
+def _create_client(api_key: str) -> Anthropic:
+    """연결 풀이 설정된 Anthropic 클라이언트 생성
+
+    재시도는 요청 스케줄러가 담당하므로 SDK 자체 재시도는 끕니다.
+    """
+    return Anthropic(
+        api_key=api_key,
+        http_client=build_http_client(DefaultHttpxClient),
+        timeout=build_timeout(),
+        max_retries=0,
+    )
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_rate_limits() -> dict:
+    """모델 ID별 요청 한도 반환 (Secrets 설정 우선)"""
+    limits = {}
+    for model_type, defaults in DEFAULT_RATE_LIMITS.items():
+        limit = dict(defaults)
+        for name in ("rpm", "tpm"):
+            try:
+                value = st.secrets.get(f"RATE_LIMIT_{model_type.upper()}_{name.upper()}")
+                if value:
+                    limit[name] = int(value)
+            except Exception:
+                pass
+        limits[MODELS[model_type]] = limit
+    return limits
+
+
+def get_scheduler() -> RequestScheduler:
+    """프로세스 전체에서 공유하는 요청 스케줄러 반환"""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = RequestScheduler(get_rate_limits())
+    return _scheduler
+
+
+def _current_session_id() -> str:
+    """공평 대기열에서 사용할 현재 Streamlit 세션 ID"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            return ctx.session_id
+    except Exception:
+        pass
+    return threading.current_thread().name
+
+
+def _text_length(content) -> int:
+    """문자열 또는 content 블록 리스트의 글자 수"""
+    if isinstance(content, list):
+        return sum(len(str(block.get("text", ""))) for block in content if isinstance(block, dict))
+    return len(str(content or ""))
+
+
+def _estimate_tokens(kwargs: dict) -> int:
+    """요청에 필요한 토큰 수 추정 (입력 글자 수 기반 + 최대 출력 토큰)"""
+    chars = _text_length(kwargs.get("system"))
+    for message in kwargs.get("messages", []):
+        chars += _text_length(message.get("content", ""))
+    return int(chars / CHARS_PER_TOKEN_ESTIMATE) + kwargs.get("max_tokens", 0)
+
+
+def _used_tokens(usage) -> Optional[int]:
+    """응답 usage에서 한도에 반영되는 토큰 수 계산 (캐시 읽기 토큰은 제외)"""
+    if usage is None:
+        return None
+    try:
+        return (
+            (usage.input_tokens or 0)
+            + (getattr(usage, "cache_creation_input_tokens", 0) or 0)
+            + (usage.output_tokens or 0)
+        )
+    except Exception:
+        return None
+
+
+_usage_stats = {field: 0 for field in USAGE_STAT_FIELDS}
+_usage_lock = threading.Lock()
+
+
+def _settle_usage(model: str, reserved_tokens: int, usage):
+    """스케줄러 예약분 정산 + 프롬프트 캐시 포함 사용량 집계"""
+    get_scheduler().record_usage(model, reserved_tokens, _used_tokens(usage))
+    if usage is None:
+        return
+    with _usage_lock:
+        _usage_stats["requests"] += 1
+        for field in USAGE_STAT_FIELDS[1:]:
+            _usage_stats[field] += getattr(usage, field, 0) or 0
+
+
+def get_usage_stats() -> dict:
+    """
+    서버 시작 이후 API 사용량 집계 반환
+
+    cache_read_input_tokens: 프롬프트 캐시에서 읽은 입력 토큰 (정가의 10%)
+    cache_creation_input_tokens: 프롬프트 캐시에 새로 저장한 입력 토큰
+    cache_hit_ratio: 전체 입력 토큰 중 캐시에서 읽은 비율
+    """
+    with _usage_lock:
+        stats = dict(_usage_stats)
+    total_input = stats["input_tokens"] + stats["cache_read_input_tokens"] + stats["cache_creation_input_tokens"]
+    stats["cache_hit_ratio"] = stats["cache_read_input_tokens"] / total_input if total_input else 0.0
+    return stats
+
+
+def _cached_block(text: str) -> dict:
+    """프롬프트 캐시 지점으로 표시한 텍스트 블록"""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+def _acquire_slot(model: str, reserved_tokens: int):
+    """스케줄러에서 요청 차례를 받음 (너무 오래 기다리면 rate limit 에러)"""
+    if not get_scheduler().acquire(model, reserved_tokens, _current_session_id(), timeout=SCHEDULER_MAX_WAIT_SECONDS):
+        raise RuntimeError("rate limit: 요청 대기 시간이 너무 길어요")
+
+
+def _wait_before_retry(error: Exception, model: str, attempt: int) -> bool:
+    """
+    재시도할 수 있는 에러면 대기 후 True 반환
+
+    429는 해당 모델 요청을 모든 세션에서 함께 멈춰서 재시도가 몰리지 않게 합니다.
+    """
+    if classify_error(error) in NON_RETRYABLE_ERRORS or attempt >= MAX_RETRIES - 1:
+        return False
+
+    delay = backoff_delay(attempt, RETRY_DELAY, retry_after=get_retry_after(error))
+    if classify_error(error) == "rate_limit":
+        get_scheduler().pause(model, delay)
+    else:
+        time.sleep(delay)
+    return True
+
+
+def _create_message(client, kwargs: dict):
+    """스케줄러를 거쳐 messages.create 호출 (일시적 오류는 백오프 후 재시도)"""
+    model = kwargs.get("model")
+    reserved = _estimate_tokens(kwargs)
+
+    for attempt in range(MAX_RETRIES):
+        _acquire_slot(model, reserved)
+        try:
+            response = client.messages.create(**kwargs)
+        except Exception as e:
+            get_scheduler().release(model, reserved)
+            if _wait_before_retry(e, model, attempt):
+                continue
+            raise
+
+        _settle_usage(model, reserved, getattr(response, "usage", None))
+        return response
+
+
 def get_client():
-    """Anthropic 클라이언트 인스턴스 반환"""
+    """Anthropic 클라이언트 인스턴스 반환 (프로세스 전체에서 공유)"""
     try:
         api_key = st.secrets.get("ANTHROPIC_API_KEY")
         if not api_key or api_key == "여기에_API_키_입력":
             st.error(ERROR_MESSAGES["api_key"])
             return None
-        return Anthropic(api_key=api_key)
+        return get_shared_client("anthropic", api_key, lambda: _create_client(api_key))
     except Exception as e:
         st.error(ERROR_MESSAGES["api_key"])
         return None
@@ -157,8 +380,103 @@ def show_error_with_retry(error_type: str, show_retry_button: bool = True, key:
             st.rerun()
 
 
+def _stream_message(client, kwargs: dict, cache_key: str = None, show_errors: bool = True) -> Iterator[str]:
+    """
+    스트리밍 API로 응답을 받아 텍스트 조각을 차례로 반환
+
+    첫 글자가 오기 전의 일시적 오류만 재시도합니다.
+    (이미 화면에 나간 글자를 다시 보낼 수 없기 때문)
+    글자가 나간 뒤 끊기면 StreamInterruptedError를 발생시켜 잘린 응답이 저장되지 않게 합니다.
+    완료된 전체 응답은 cache_key가 있으면 캐시에 저장합니다.
+    """
+    chunks = []
+    model = kwargs.get("model")
+    reserved = _estimate_tokens(kwargs)
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            _acquire_slot(model, reserved)
+            try:
+                with client.messages.stream(**kwargs) as stream:
+                    for text in stream.text_stream:
+                        if text:
+                            chunks.append(text)
+                            yield text
+                    usage = getattr(stream.get_final_message(), "usage", None)
+            except Exception:
+                get_scheduler().release(model, reserved)
+                raise
+            _settle_usage(model, reserved, usage)
+            break
+
+        except Exception as e:
+            error_type = classify_error(e)
+
+            if not chunks and _wait_before_retry(e, model, attempt):
+                continue
+
+            if show_errors:
+                st.error(ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"]))
+                with st.expander("기술 정보 (선생님께 보여주세요)", expanded=False):
+                    st.code(f"에러 유형: {error_type}\n에러 내용: {str(e)[:500]}")
+            if chunks:
+                raise StreamInterruptedError(error_type, "".join(chunks)) from e
+            return
+
+    full_text = "".join(chunks)
+    if not full_text:
+        if show_errors:
+            st.warning("AI가 빈 응답을 보냈어요. 다시 시도해주세요.")
+        return
+
+    if cache_key:
+        _response_cache.set(cache_key, full_text)
+
+
+def write_stream(stream) -> Optional[str]:
+    """
+    스트리밍 응답을 화면에 표시하고 전체 텍스트 반환
+
+    스트림이 없거나 중간에 끊기면 None을 반환합니다 (잘린 응답을 저장하지 않도록).
+    """
+    if not stream:
+        return None
+    try:
+        return st.write_stream(stream)
+    except StreamInterruptedError:
+        st.warning("응답이 중간에 끊겨서 저장하지 않았어요. 다시 시도해주세요.")
+        return None
+
+
+def _build_system(system_prompt: str = None, static_context: str = None):
+    """시스템 프롬프트 구성 (고정 지침이 있으면 캐시 지점으로 표시한 블록 리스트)"""
+    if not static_context:
+        return system_prompt
+    blocks = []
+    if system_prompt:
+        blocks.append({"type": "text", "text": system_prompt})
+    blocks.append(_cached_block(static_context))
+    return blocks
+
+
+def _build_user_content(prompt: str, book_context: str = None):
+    """사용자 메시지 구성 (책 정보가 있으면 캐시 블록 뒤에 요청 문장)"""
+    if not book_context:
+        return prompt
+    return [_cached_block(book_context), {"type": "text", "text": prompt}]
+
+
 @with_retry()
-def generate_response(prompt: str, system_prompt: str = None, max_tokens: int = 4096, model_type: str = "sonnet") -> str:
+def generate_response(
+    prompt: str,
+    system_prompt: str = None,
+    max_tokens: int = 4096,
+    model_type: str = "sonnet",
+    use_cache: bool = True,
+    stream: bool = False,
+    static_context: str = None,
+    book_context: str = None,
+) -> str:
     """
     Claude API를 통해 응답 생성
 
@@ -167,9 +485,15 @@ def generate_response(prompt: str, system_prompt: str = None, max_tokens: int =
         system_prompt: 시스템 프롬프트 (선택)
         max_tokens: 최대 토큰 수
         model_type: 모델 타입 ("opus", "sonnet", "haiku")
+        use_cache: False면 저장된 응답을 무시하고 새로 생성 (결과는 다시 저장)
+        stream: True면 텍스트 조각을 차례로 내보내는 제너레이터 반환
+                (st.write_stream에 그대로 전달 가능)
+        static_context: 모든 책에 공통인 고정 지침 (시스템 프롬프트 뒤에 붙여 캐시)
+        book_context: 책마다 고정인 책 정보 (사용자 메시지 앞부분에 캐시)
+                      요청은 고정 지침 → 책 정보 → prompt 순서로 구성됩니다.
 
     Returns:
-        생성된 응답 텍스트
+        생성된 응답 텍스트 (stream=True면 텍스트 조각 제너레이터)
     """
     # 입력 검증 - 타입 체크 추가
     if not prompt or not isinstance(prompt, str) or not prompt.strip():
@@ -182,24 +506,36 @@ def generate_response(prompt: str, system_prompt: str = None, max_tokens: int =
         st.warning(f"입력이 너무 길어요! {MAX_INPUT_LENGTH:,}자 이내로 줄여주세요. (현재: {len(prompt):,}자)")
         prompt = prompt[:MAX_INPUT_LENGTH]
 
+    model = MODELS.get(model_type, MODELS["sonnet"])
+    if not (system_prompt and isinstance(system_prompt, str)):
+        system_prompt = None
+
+    # 캐시 확인 (같은 프롬프트/시스템/모델/토큰 수)
+    cache_key = make_cache_key(model, system_prompt, max_tokens, prompt, static_context, book_context)
+    if use_cache:
+        cached = _response_cache.get(cache_key)
+        if cached:
+            return iter([cached]) if stream else cached
+
     client = get_client()
     # 클라이언트 None 체크 추가
     if client is None:
         return None
 
-    messages = [{"role": "user", "content": prompt}]
-
-    try:
-        kwargs = {
-            "model": MODELS.get(model_type, MODELS["sonnet"]),
-            "max_tokens": max_tokens,
-            "messages": messages,
-        }
+    kwargs = {
+        "model": model,
+        "max_tokens": max_tokens,
+        "messages": [{"role": "user", "content": _build_user_content(prompt, book_context)}],
+    }
+    system = _build_system(system_prompt, static_context)
+    if system:
+        kwargs["system"] = system
 
-        if system_prompt and isinstance(system_prompt, str):
-            kwargs["system"] = system_prompt
+    if stream:
+        return _stream_message(client, kwargs, cache_key=cache_key)
 
-        response = client.messages.create(**kwargs)
+    try:
+        response = _create_message(client, kwargs)
 
         # 응답 검증 강화
         if not response or not response.content:
@@ -210,7 +546,10 @@ def generate_response(prompt: str, system_prompt: str = None, max_tokens: int =
             st.warning("AI가 빈 응답을 보냈어요. 다시 시도해주세요.")
             return None
 
-        return response.content[0].text
+        text = response.content[0].text
+        if text:
+            _response_cache.set(cache_key, text)
+        return text
 
     except Exception as e:
         error_type = classify_error(e)
@@ -227,8 +566,8 @@ def generate_response(prompt: str, system_prompt: str = None, max_tokens: int =
 # 🔴 OPUS 사용 (최고 품질) - 제목, 목차, 탈고, 기획서
 # ============================================================
 
-def generate_titles(book_info: dict) -> str:
-    """제목 10개 생성 [OPUS]"""
+def generate_titles(book_info: dict, use_cache: bool = True, stream: bool = False) -> str:
+    """제목 10개 생성 [OPUS] (use_cache=False면 다시 생성, stream=True면 스트리밍)"""
     # 입력 검증
     if not book_info:
         st.warning("책 정보가 없어요. 1단계에서 정보를 입력해주세요.")
@@ -241,10 +580,17 @@ def generate_titles(book_info: dict) -> str:
         return None
 
     try:
-        from prompts.templates import get_title_generation_prompt
-        prompt = get_title_generation_prompt(book_info)
+        from prompts.templates import TITLE_GENERATION_GUIDE, TITLE_GENERATION_REQUEST, get_title_book_context
         system = "당신은 20년 경력의 베스트셀러 편집자입니다. 독자의 마음을 사로잡는 제목을 만드는 전문가입니다."
-        return generate_response(prompt, system, model_type="opus")
+        return generate_response(
+            TITLE_GENERATION_REQUEST,
+            system,
+            model_type="opus",
+            use_cache=use_cache,
+            stream=stream,
+            static_context=TITLE_GENERATION_GUIDE,
+            book_context=get_title_book_context(book_info),
+        )
     except ImportError as e:
         st.error("템플릿 파일을 찾을 수 없어요. 선생님께 말씀해주세요!")
         return None
@@ -254,18 +600,25 @@ def generate_titles(book_info: dict) -> str:
         return None
 
 
-def generate_toc(book_info: dict) -> str:
-    """목차 40꼭지 생성 [OPUS]"""
+def generate_toc(book_info: dict, use_cache: bool = True, stream: bool = False) -> str:
+    """목차 40꼭지 생성 [OPUS] (use_cache=False면 다시 생성, stream=True면 스트리밍)"""
     # 입력 검증
     if not book_info:
         st.warning("책 정보가 없어요. 1단계에서 정보를 입력해주세요.")
         return None
 
     try:
-        from prompts.templates import get_toc_generation_prompt
-        prompt = get_toc_generation_prompt(book_info)
+        from prompts.templates import TOC_GENERATION_GUIDE, TOC_GENERATION_REQUEST, get_toc_book_context
         system = "당신은 50권 이상 편집한 베테랑 출판 편집자입니다. 논리적이고 매력적인 책 구조를 설계하는 전문가입니다."
-        return generate_response(prompt, system, model_type="opus")
+        return generate_response(
+            TOC_GENERATION_REQUEST,
+            system,
+            model_type="opus",
+            use_cache=use_cache,
+            stream=stream,
+            static_context=TOC_GENERATION_GUIDE,
+            book_context=get_toc_book_context(book_info),
+        )
     except ImportError as e:
         st.error("템플릿 파일을 찾을 수 없어요. 선생님께 말씀해주세요!")
         return None
@@ -335,8 +688,8 @@ def edit_draft_with_instruction(draft: str, instruction: str) -> str:
     return generate_response(prompt, system, model_type="opus")
 
 
-def generate_proposal(book_info: dict, author_info: dict) -> str:
-    """출간기획서 생성 [OPUS]"""
+def generate_proposal(book_info: dict, author_info: dict, stream: bool = False) -> str:
+    """출간기획서 생성 [OPUS] (stream=True면 스트리밍)"""
     # 입력 검증
     if not book_info:
         st.warning("책 정보가 없어요. 1단계에서 정보를 입력해주세요.")
@@ -350,7 +703,7 @@ def generate_proposal(book_info: dict, author_info: dict) -> str:
         from prompts.templates import get_proposal_generation_prompt
         prompt = get_proposal_generation_prompt(book_info, author_info)
         system = "당신은 대형 출판사 기획 편집자입니다. 답장률 85%의 기획서를 작성합니다."
-        return generate_response(prompt, system, model_type="opus")
+        return generate_response(prompt, system, model_type="opus", stream=stream)
     except ImportError as e:
         st.error("템플릿 파일을 찾을 수 없어요. 선생님께 말씀해주세요!")
         return None
@@ -360,8 +713,8 @@ def generate_proposal(book_info: dict, author_info: dict) -> str:
         return None
 
 
-def generate_landing_page(book_info: dict, webinar_info: dict) -> str:
-    """랜딩페이지 카피 생성 [OPUS]"""
+def generate_landing_page(book_info: dict, webinar_info: dict, stream: bool = False) -> str:
+    """랜딩페이지 카피 생성 [OPUS] (stream=True면 스트리밍)"""
     # 입력 검증
     if not book_info:
         st.warning("책 정보가 없어요. 1단계에서 정보를 입력해주세요.")
@@ -375,7 +728,7 @@ def generate_landing_page(book_info: dict, webinar_info: dict) -> str:
         from prompts.templates import get_landing_page_prompt
         prompt = get_landing_page_prompt(book_info, webinar_info)
         system = "당신은 전환율 30% 이상의 랜딩페이지 전문 카피라이터입니다."
-        return generate_response(prompt, system, model_type="opus")
+        return generate_response(prompt, system, model_type="opus", stream=stream)
     except ImportError as e:
         st.error("템플릿 파일을 찾을 수 없어요. 선생님께 말씀해주세요!")
         return None
@@ -403,8 +756,7 @@ def generate_draft(book_info: dict, section_info: dict) -> str:
     try:
         from prompts.templates import get_draft_generation_prompt
         prompt = get_draft_generation_prompt(book_info, section_info)
-        system = "당신은 베스트셀러 작가의 고스트라이터입니다. 독자가 술술 읽히는 글을 씁니다."
-        return generate_response(prompt, system, model_type="haiku")
+        return generate_response(prompt, DRAFT_SYSTEM_PROMPT, max_tokens=DRAFT_MAX_TOKENS, model_type="haiku")
     except ImportError as e:
         st.error("템플릿 파일을 찾을 수 없어요. 선생님께 말씀해주세요!")
         return None
@@ -439,6 +791,83 @@ def add_storytelling(experience: str) -> str:
         return None
 
 
+def get_max_concurrency() -> int:
+    """전체 자동 생성 시 동시 요청 수 반환 (Secrets 설정 우선)"""
+    try:
+        value = int(st.secrets.get("DRAFT_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+    except Exception:
+        value = DEFAULT_MAX_CONCURRENCY
+    return max(1, min(value, MAX_CONCURRENCY_LIMIT))
+
+
+def _attach_script_context():
+    """현재 Streamlit 스크립트 컨텍스트를 작업 스레드에 연결하는 초기화 함수 반환
+
+    작업 스레드에서도 st.secrets / st.error 가 정상 동작하도록 합니다.
+    """
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+        ctx = get_script_run_ctx()
+        if ctx is None:
+            return None
+
+        def initializer():
+            add_script_run_ctx(threading.current_thread(), ctx)
+
+        return initializer
+    except Exception:
+        return None
+
+
+def generate_drafts_concurrently(
+    book_info: dict,
+    sections: List[Tuple[str, dict]],
+    max_concurrency: int = None,
+    draft_fn: Callable[[dict, dict], Optional[str]] = None,
+) -> Iterator[Tuple[str, Optional[str]]]:
+    """
+    여러 꼭지 초안을 동시에 생성 [HAIKU - 전체 자동 생성용]
+
+    최대 max_concurrency개의 요청만 동시에 보내고, 완료되는 순서대로
+    (섹션 키, 초안) 을 돌려줍니다. 실패한 꼭지는 초안 대신 None 을 돌려줍니다.
+
+    Args:
+        book_info: 책 정보 딕셔너리
+        sections: (섹션 키, section_info) 튜플 리스트
+        max_concurrency: 동시 요청 수 (None이면 get_max_concurrency())
+        draft_fn: 초안 생성 함수 (기본: generate_draft)
+
+    Yields:
+        (섹션 키, 생성된 초안 또는 None)
+    """
+    if not sections:
+        return
+
+    if draft_fn is None:
+        draft_fn = generate_draft
+
+    if max_concurrency is None:
+        max_concurrency = get_max_concurrency()
+    max_workers = max(1, min(max_concurrency, len(sections)))
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="draft",
+        initializer=_attach_script_context(),
+    ) as executor:
+        futures = {
+            executor.submit(draft_fn, book_info, section_info): key
+            for key, section_info in sections
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                yield key, future.result()
+            except Exception:
+                yield key, None
+
+
 # ============================================================
 # 🟡 SONNET 사용 (균형) - 대화, 피드백
 # ============================================================
@@ -469,13 +898,28 @@ def get_feedback(content: str, feedback_type: str) -> str:
         return None
 
 
-def chat_with_coach(messages: list, book_info: dict = None, elementary_friendly: bool = False) -> str:
+def _mark_history_cache_point(messages: list) -> list:
+    """지난 대화의 마지막 메시지를 캐시 지점으로 표시한 사본 반환 (원본은 그대로)"""
+    if len(messages) < 2:
+        return messages
+
+    marked = list(messages)
+    last_history = dict(marked[-2])
+    content = last_history.get("content", "")
+    if isinstance(content, str):
+        last_history["content"] = [_cached_block(content)]
+        marked[-2] = last_history
+    return marked
+
+
+def chat_with_coach(messages: list, book_info: dict = None, elementary_friendly: bool = False, stream: bool = False) -> str:
     """책쓰기 코치와 대화 [SONNET]
 
     Args:
         messages: 대화 메시지 리스트
         book_info: 책 정보 딕셔너리
         elementary_friendly: True면 초등학생도 이해할 수 있게 쉽게 답변
+        stream: True면 답변 텍스트 조각 제너레이터 반환 (st.write_stream용)
     """
     # 입력 검증
     if not messages:
@@ -531,25 +975,31 @@ def chat_with_coach(messages: list, book_info: dict = None, elementary_friendly:
 - 실행 가능한 조언
 - 한국어로 답변"""
 
-    if book_info:
-        context = f"""
+    # 캐시 순서: 고정 코치 지침 → 수강생(책) 정보 → 지난 대화 → 이번 질문
+    system_blocks = [_cached_block(system)]
 
-현재 수강생 정보:
+    if book_info:
+        context = f"""현재 수강생 정보:
 - 이름: {book_info.get('name', '미입력')}
 - 책 주제: {book_info.get('topic', '미입력')}
 - 타겟 독자: {book_info.get('target_reader', '미입력')}
 - 핵심 메시지: {book_info.get('core_message', '미입력')}
 - 선택한 제목: {book_info.get('title', '미선택')}
 """
-        system += context
+        system_blocks.append(_cached_block(context))
+
+    kwargs = {
+        "model": MODELS["sonnet"],
+        "max_tokens": 1024 if elementary_friendly else 2048,
+        "system": system_blocks,
+        "messages": _mark_history_cache_point(messages),
+    }
+
+    if stream:
+        return _stream_message(client, kwargs, show_errors=not elementary_friendly)
 
     try:
-        response = client.messages.create(
-            model=MODELS["sonnet"],
-            max_tokens=1024 if elementary_friendly else 2048,
-            system=system,
-            messages=messages,
-        )
+        response = _create_message(client, kwargs)
 
         if not response or not response.content:
             if not elementary_friendly:
@@ -569,6 +1019,136 @@ def chat_with_coach(messages: list, book_info: dict = None, elementary_friendly:
 # 유튜브 모드 전용 함수들
 # ============================================================
 
+def summarize_transcript_chunk(chunk: str) -> Optional[str]:
+    """
+    자막 조각 하나를 요약 [HAIKU]
+
+    프롬프트에 조각 내용만 들어가므로 같은 조각은 응답 캐시(내용 해시)에서 바로 반환됩니다.
+    """
+    prompt = f"""다음은 강의 영상 자막의 한 부분입니다.
+
+## 자막:
+{chunk}
+
+## 요청:
+- 이 부분에서 다룬 핵심 주장, 개념, 방법, 사례, 숫자를 빠짐없이 정리해주세요
+- 말한 순서를 유지하고, 구어체 군더더기는 빼주세요
+- 800자 이내, 짧은 불릿 포인트로만 작성해주세요"""
+
+    return generate_response(
+        prompt,
+        TRANSCRIPT_SUMMARY_SYSTEM_PROMPT,
+        max_tokens=DIGEST_SUMMARY_MAX_TOKENS,
+        model_type="haiku",
+    )
+
+
+def _split_transcript_parts(transcript: str) -> List[Tuple[str, str]]:
+    """통합 자막을 (Part 구분자, 본문) 목록으로 분할 (구분자가 없으면 빈 문자열)"""
+    headers = list(PART_HEADER_PATTERN.finditer(transcript))
+    if not headers:
+        return [("", transcript)]
+
+    parts = []
+    if transcript[:headers[0].start()].strip():
+        parts.append(("", transcript[:headers[0].start()]))
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(transcript)
+        parts.append((header.group(0), transcript[header.end():end]))
+    return parts
+
+
+def _summarize_chunks_concurrently(
+    chunks: List[str],
+    summarize_fn: Callable[[str], Optional[str]],
+    max_concurrency: int = None,
+) -> List[Optional[str]]:
+    """자막 조각들을 동시에 요약하고 원래 순서대로 반환 (실패한 조각은 None)"""
+    if max_concurrency is None:
+        max_concurrency = get_max_concurrency()
+    max_workers = max(1, min(max_concurrency, len(chunks)))
+
+    summaries: List[Optional[str]] = [None] * len(chunks)
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="digest",
+        initializer=_attach_script_context(),
+    ) as executor:
+        futures = {executor.submit(summarize_fn, chunk): i for i, chunk in enumerate(chunks)}
+        for future in as_completed(futures):
+            try:
+                summaries[futures[future]] = future.result()
+            except Exception:
+                pass
+    return summaries
+
+
+def build_transcript_digest(
+    transcript: str,
+    max_chars: int = DIGEST_MAX_CHARS,
+    summarize_fn: Callable[[str], Optional[str]] = None,
+    max_concurrency: int = None,
+) -> str:
+    """
+    긴 자막을 map-reduce로 요약해서 max_chars 이내로 줄임
+
+    - map: Part별로 chunk_transcript 조각을 나눠 동시에 요약 (Haiku, 조각별 캐시)
+    - reduce: 요약을 Part 구분자와 함께 순서대로 합치고, 그래도 길면 한 번 더 요약
+    요약에 실패한 조각은 앞부분 일부를 그대로 넣어 내용이 통째로 빠지지 않게 합니다.
+
+    Args:
+        transcript: 통합 자막 (=== Part N: 제목 === 구분자 유지)
+        max_chars: 결과 최대 길이 (이보다 짧은 자막은 그대로 반환)
+        summarize_fn: 조각 요약 함수 (기본: summarize_transcript_chunk)
+        max_concurrency: 동시 요약 요청 수
+
+    Returns:
+        요약된 자막
+    """
+    if not transcript or len(transcript) <= max_chars:
+        return transcript
+
+    from utils.youtube_handler import chunk_transcript
+
+    summarize_fn = summarize_fn or summarize_transcript_chunk
+    text = transcript
+
+    for _ in range(DIGEST_MAX_ROUNDS):
+        parts = _split_transcript_parts(text)
+        jobs = [
+            (part_idx, chunk)
+            for part_idx, (_, body) in enumerate(parts)
+            for chunk in chunk_transcript(body.strip(), DIGEST_CHUNK_CHARS)
+        ]
+        if not jobs:
+            break
+
+        summaries = _summarize_chunks_concurrently([chunk for _, chunk in jobs], summarize_fn, max_concurrency)
+        fallback_chars = max(200, max_chars // len(jobs))
+
+        part_summaries = [[] for _ in parts]
+        for (part_idx, chunk), summary in zip(jobs, summaries):
+            part_summaries[part_idx].append((summary or chunk[:fallback_chars]).strip())
+
+        blocks = []
+        for (header, _), summaries_in_part in zip(parts, part_summaries):
+            body = "\n".join(summaries_in_part)
+            if header:
+                blocks.append(f"{header}\n\n{body}")
+            elif body:
+                blocks.append(body)
+        digest = "\n\n".join(blocks).strip()
+
+        # 더 줄어들지 않으면 그만 (무한 반복 방지)
+        shrunk = len(digest) < len(text)
+        if shrunk:
+            text = digest
+        if len(text) <= max_chars or not shrunk:
+            break
+
+    return text[:max_chars]
+
+
 def analyze_youtube_transcript(transcript: str, video_title: str = "") -> str:
     """유튜브 자막 분석 및 핵심 내용 추출 [SONNET]"""
     # 입력 검증
@@ -580,17 +1160,15 @@ def analyze_youtube_transcript(transcript: str, video_title: str = "") -> str:
         st.warning("자막이 너무 짧아요. 더 긴 영상을 선택해주세요.")
         return None
 
-    # 자막이 너무 길면 잘라내기
-    MAX_TRANSCRIPT_LENGTH = 15000
-    if len(transcript) > MAX_TRANSCRIPT_LENGTH:
-        transcript = transcript[:MAX_TRANSCRIPT_LENGTH]
+    # 자막이 길면 잘라내지 않고 전체를 요약해서 사용
+    transcript = build_transcript_digest(transcript)
 
     prompt = f"""다음은 유튜브 영상의 자막입니다.
 
 ## 영상 제목: {video_title}
 
 ## 자막 내용:
-{transcript[:8000]}
+{transcript}
 
 ## 분석 요청:
 1. **핵심 주제**: 이 영상이 다루는 핵심 주제 (1-2문장)
@@ -605,8 +1183,8 @@ def analyze_youtube_transcript(transcript: str, video_title: str = "") -> str:
     return generate_response(prompt, system, max_tokens=2048, model_type="sonnet")
 
 
-def generate_titles_from_transcript(transcript: str, video_info: dict) -> str:
-    """유튜브 자막 기반 제목 생성 [OPUS]"""
+def generate_titles_from_transcript(transcript: str, video_info: dict, use_cache: bool = True) -> str:
+    """유튜브 자막 기반 제목 생성 [OPUS] (use_cache=False면 다시 생성)"""
     # 입력 검증
     if not transcript or not transcript.strip():
         st.warning("자막이 비어있어요.")
@@ -621,12 +1199,15 @@ def generate_titles_from_transcript(transcript: str, video_info: dict) -> str:
     except ImportError:
         TITLE_FORMULAS = ""
 
+    # 자막이 길면 잘라내지 않고 전체를 요약해서 사용
+    transcript = build_transcript_digest(transcript)
+
     prompt = f"""유튜브 영상 정보:
 - 제목: {video_info.get('title', '')}
 - 채널: {video_info.get('channel', '')}
 
 자막 내용 요약:
-{transcript[:6000]}
+{transcript}
 
 {TITLE_FORMULAS}
 
@@ -641,11 +1222,11 @@ def generate_titles_from_transcript(transcript: str, video_info: dict) -> str:
 형식으로 출력해주세요. 마크다운 형식으로 깔끔하게 정리해주세요."""
 
     system = "당신은 20년 경력의 베스트셀러 편집자입니다. 유튜브 콘텐츠를 매력적인 책 제목으로 변환하는 전문가입니다."
-    return generate_response(prompt, system, model_type="opus")
+    return generate_response(prompt, system, model_type="opus", use_cache=use_cache)
 
 
-def generate_toc_from_transcript(transcript: str, book_info: dict, video_count: int = 1) -> str:
-    """유튜브 자막 기반 목차 생성 [OPUS]"""
+def generate_toc_from_transcript(transcript: str, book_info: dict, video_count: int = 1, use_cache: bool = True) -> str:
+    """유튜브 자막 기반 목차 생성 [OPUS] (use_cache=False면 다시 생성)"""
     # 입력 검증
     if not transcript or not transcript.strip():
         st.warning("자막이 비어있어요.")
@@ -669,13 +1250,16 @@ def generate_toc_from_transcript(transcript: str, book_info: dict, video_count:
 - 각 Part는 8개 꼭지
 """
 
+    # 자막이 길면 잘라내지 않고 전체를 요약해서 사용 (Part 구분자 유지)
+    transcript = build_transcript_digest(transcript)
+
     prompt = f"""내 책 정보:
 - 제목: {book_info.get('title', '')}
 - 타겟 독자: {book_info.get('target_reader', '')}
 - 핵심 메시지: {book_info.get('core_message', '')}
 
 ## 유튜브 영상 자막 내용:
-{transcript[:10000]}
+{transcript}
 
 {structure_guide}
 
@@ -707,11 +1291,21 @@ Part 2. [Part 제목] - WHAT (무엇?)
 ```"""
 
     system = "당신은 50권 이상 편집한 베테랑 출판 편집자입니다. 유튜브 콘텐츠를 체계적인 책 구조로 변환하는 전문가입니다."
-    return generate_response(prompt, system, model_type="opus")
+    return generate_response(prompt, system, model_type="opus", use_cache=use_cache)
+
 
+def generate_draft_from_transcript(
+    book_info: dict,
+    section_info: dict,
+    transcript_chunk: str,
+    transcript_index: TranscriptIndex = None,
+) -> str:
+    """
+    유튜브 자막 기반 초안 생성 [HAIKU - 비용 절감]
 
-def generate_draft_from_transcript(book_info: dict, section_info: dict, transcript_chunk: str) -> str:
-    """유튜브 자막 기반 초안 생성 [HAIKU - 비용 절감]"""
+    transcript_index를 넘기면 자막 전체를 다시 훑지 않고 인덱스에서
+    꼭지 제목과 가까운 구간을 바로 찾습니다.
+    """
     # 입력 검증
     if not book_info:
         st.warning("책 정보가 없어요.")
@@ -725,9 +1319,14 @@ def generate_draft_from_transcript(book_info: dict, section_info: dict, transcri
         st.warning("자막 내용이 없어요.")
         return None
 
-    # 꼭지 제목에서 키워드 추출하여 관련 자막 부분 찾기
+    # 꼭지 제목과 관련된 자막 구간 찾기
     section_title = section_info.get('section_title', '')
-    relevant_chunk = find_relevant_transcript_chunk(transcript_chunk, section_title)
+    relevant_chunk = find_relevant_transcript_chunk(
+        transcript_chunk,
+        section_title,
+        index=transcript_index,
+        part=section_info.get('part_number'),
+    )
 
     prompt = f"""내 책 정보:
 - 제목: {book_info.get('title', '')}
@@ -768,52 +1367,29 @@ def generate_draft_from_transcript(book_info: dict, section_info: dict, transcri
     return generate_response(prompt, system, model_type="haiku")
 
 
-def find_relevant_transcript_chunk(transcript: str, section_title: str, chunk_size: int = 4000) -> str:
+def find_relevant_transcript_chunk(
+    transcript: str,
+    section_title: str,
+    chunk_size: int = 4000,
+    index: TranscriptIndex = None,
+    part: int = None,
+) -> str:
     """
-    섹션 제목과 관련된 자막 부분을 찾아 반환
+    섹션 제목과 관련된 자막 부분을 찾아 반환 (BM25 구간 검색)
 
     Args:
         transcript: 전체 자막
         section_title: 꼭지 제목
         chunk_size: 반환할 청크 크기
+        index: 미리 만든 자막 인덱스 (없으면 transcript로 새로 만듦)
+        part: 지정하면 해당 Part 구간에서 우선 검색
 
     Returns:
         관련 자막 부분
     """
-    if not transcript or not section_title:
-        return transcript[:chunk_size] if transcript else ""
-
-    # 제목에서 핵심 키워드 추출 (2글자 이상 단어)
-    import re
-    keywords = [word for word in re.findall(r'[가-힣a-zA-Z]{2,}', section_title)]
-
-    if not keywords:
-        return transcript[:chunk_size]
-
-    # 각 키워드가 등장하는 위치 찾기
-    positions = []
-    for keyword in keywords[:3]:  # 상위 3개 키워드만 사용
-        for match in re.finditer(re.escape(keyword), transcript, re.IGNORECASE):
-            positions.append(match.start())
-
-    if not positions:
-        # 키워드를 찾지 못하면 전체 자막을 균등하게 분할
-        return transcript[:chunk_size]
-
-    # 가장 많은 키워드가 밀집된 구간 찾기
-    avg_position = sum(positions) // len(positions)
-
-    # 해당 위치 중심으로 청크 추출
-    start = max(0, avg_position - chunk_size // 2)
-    end = min(len(transcript), start + chunk_size)
-
-    # 문장 단위로 자르기 (마침표 기준)
-    chunk = transcript[start:end]
-
-    # 시작 부분 정리 (문장 중간에서 시작하지 않도록)
-    if start > 0:
-        first_period = chunk.find('. ')
-        if first_period != -1 and first_period < 100:
-            chunk = chunk[first_period + 2:]
+    if index is None:
+        if not transcript or not section_title or len(transcript) <= chunk_size:
+            return transcript[:chunk_size] if transcript else ""
+        index = TranscriptIndex(transcript)
 
-    return chunk
+    return index.build_context(section_title, max_chars=chunk_size, part=part)
@@ -7,6 +7,8 @@ from datetime import datetime
 from pathlib import Path
 import time
 
+from utils.storage import get_storage
+
 
 # 데이터 파일 경로
 DATA_DIR = Path(__file__).parent.parent / "data"
@@ -82,6 +84,10 @@ def ensure_data_directory():
     try:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
 
+        # SQLite 저장소를 쓰면 메시지 파일은 만들지 않음
+        if get_storage() is not None:
+            return True
+
         # CSV 파일 헤더 생성
         if not MESSAGES_CSV.exists():
             try:
@@ -142,6 +148,10 @@ def validate_message(message: str) -> tuple:
 def save_message_to_csv(student_name: str, message: str, current_step: int) -> bool:
     """메시지를 CSV 파일에 저장 - 강화된 에러 처리"""
     try:
+        # SQLite 저장소에서는 save_message_to_json이 DB에 기록하므로 CSV 사본은 쓰지 않음
+        if get_storage() is not None:
+            return False
+
         ensure_data_directory()
 
         # 입력 검증
@@ -191,9 +201,6 @@ def save_message_to_json(student_name: str, message: str, current_step: int, boo
         if not message:
             return False
 
-        # 기존 데이터 로드
-        messages = load_all_messages_json()
-
         # book_info 안전하게 처리
         book_title = ""
         book_topic = ""
@@ -203,7 +210,6 @@ def save_message_to_json(student_name: str, message: str, current_step: int, boo
 
         # 새 메시지 추가
         new_message = {
-            "id": len(messages) + 1,
             "student_name": student_name,
             "timestamp": datetime.now().isoformat(),
             "message": message[:MAX_MESSAGE_LENGTH],  # 길이 제한
@@ -215,9 +221,18 @@ def save_message_to_json(student_name: str, message: str, current_step: int, boo
             "admin_reply": "",
             "reply_timestamp": "",
         }
+
+        storage = get_storage()
+        if storage is not None:
+            # SQLite 저장소: 번호는 DB가 매기고 한 트랜잭션으로 추가
+            storage.add_message(new_message)
+            return True
+
+        # 기존 데이터 로드 후 저장
+        messages = load_all_messages_json()
+        new_message = {"id": len(messages) + 1, **new_message}
         messages.append(new_message)
 
-        # 저장
         with open(MESSAGES_JSON, 'w', encoding='utf-8') as f:
             json.dump(messages, f, ensure_ascii=False, indent=2)
 
@@ -237,6 +252,10 @@ def save_message_to_json(student_name: str, message: str, current_step: int, boo
 def load_all_messages_json() -> list:
     """모든 메시지 로드 (JSON) - 안전한 로딩"""
     try:
+        storage = get_storage()
+        if storage is not None:
+            return storage.list_messages()
+
         ensure_data_directory()
         if MESSAGES_JSON.exists():
             with open(MESSAGES_JSON, 'r', encoding='utf-8') as f:
@@ -262,6 +281,10 @@ def load_all_messages_json() -> list:
 def load_all_messages_csv() -> list:
     """모든 메시지 로드 (CSV) - 안전한 로딩"""
     try:
+        storage = get_storage()
+        if storage is not None:
+            return storage.list_messages()
+
         ensure_data_directory()
         messages = []
         if MESSAGES_CSV.exists():
@@ -287,6 +310,11 @@ def update_message_status(message_id: int, status: str, admin_reply: str = "") -
         if not status:
             status = "pending"
 
+        storage = get_storage()
+        if storage is not None:
+            reply = str(admin_reply)[:10000] if admin_reply else ""
+            return storage.update_message(message_id, status, reply, datetime.now().isoformat() if reply else "")
+
         messages = load_all_messages_json()
 
         updated = False
@@ -334,6 +362,10 @@ def get_step_name(step: int) -> str:
 def get_pending_messages_count() -> int:
     """대기 중인 메시지 수 - 안전한 카운트"""
     try:
+        storage = get_storage()
+        if storage is not None:
+            return storage.count_messages("pending")
+
         messages = load_all_messages_json()
         return sum(1 for m in messages if m.get("status") == "pending")
     except Exception:
@@ -353,6 +385,10 @@ def get_student_messages(student_name: str) -> list:
         if not student_name:
             return []
 
+        storage = get_storage()
+        if storage is not None:
+            return storage.list_messages(student_name)
+
         messages = load_all_messages_json()
         # 대소문자 구분 없이 비교
         return [m for m in messages if m.get("student_name", "").lower() == student_name.lower()]
@@ -0,0 +1,172 @@
+"""
+디스크 캐시 모듈
+=================
+- SQLite 파일 하나에 키-값 저장 (여러 세션/프로세스가 함께 사용)
+- 값은 zlib 압축해서 저장
+- 유효 기간(TTL)이 지난 항목은 무시 후 삭제
+- 전체 용량이 한도를 넘으면 오래 안 쓴 항목부터 삭제 (LRU)
+
+캐시 오류는 절대 본 기능을 막지 않도록 모든 실패를 조용히 무시합니다.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+
+# 용량 정리 시 한도의 90%까지 줄여서 매번 정리가 일어나지 않게 함
+EVICTION_TARGET_RATIO = 0.9
+
+
+def make_cache_key(*parts: Any) -> str:
+    """입력값들로 SHA-256 캐시 키 생성 (순서와 타입까지 구분)"""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def dumps_compact(value: Any) -> str:
+    """공백 없는 JSON 문자열 (저널/백업/blob 저장용, 직렬화 못 하는 값은 문자열로)"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+class DiskCache:
+    """SQLite 기반 TTL + LRU 디스크 캐시"""
+
+    def __init__(self, db_path: Path, ttl_seconds: Optional[float] = None, max_bytes: int = 50 * 1024 * 1024):
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    conn.execute("""
+                        CREATE TABLE IF NOT EXISTS cache (
+                            key TEXT PRIMARY KEY,
+                            value BLOB NOT NULL,
+                            size INTEGER NOT NULL,
+                            created_at REAL NOT NULL,
+                            accessed_at REAL NOT NULL
+                        )
+                    """)
+                    conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """캐시에서 원본 바이트 조회 (없거나 만료되면 None)"""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value, created_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+
+                value, created_at = row
+                now = time.time()
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    conn.commit()
+                    return None
+
+                conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+                return zlib.decompress(value)
+            finally:
+                conn.close()
+        except Exception:
+            return None
+
+    def set_bytes(self, key: str, data: bytes) -> bool:
+        """캐시에 원본 바이트 저장 후 필요하면 용량 정리"""
+        try:
+            compressed = zlib.compress(data, 6)
+            now = time.time()
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                    (key, compressed, len(compressed), now, now),
+                )
+                conn.commit()
+                self._evict(conn)
+            finally:
+                conn.close()
+            return True
+        except Exception:
+            return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """JSON 값 조회"""
+        data = self.get_bytes(key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except Exception:
+            return None
+
+    def set(self, key: str, value: Any) -> bool:
+        """JSON 직렬화 가능한 값 저장"""
+        try:
+            data = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        except Exception:
+            return False
+        return self.set_bytes(key, data)
+
+    def delete(self, key: str) -> bool:
+        """항목 삭제"""
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                conn.commit()
+            finally:
+                conn.close()
+            return True
+        except Exception:
+            return False
+
+    def total_bytes(self) -> int:
+        """저장된 (압축) 데이터 총 용량"""
+        try:
+            conn = self._connect()
+            try:
+                return conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+            finally:
+                conn.close()
+        except Exception:
+            return 0
+
+    def _evict(self, conn: sqlite3.Connection):
+        """만료 항목 삭제 후 용량 한도를 넘으면 오래 안 쓴 항목부터 삭제"""
+        if self.ttl_seconds is not None:
+            conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+        if total > self.max_bytes:
+            target = int(self.max_bytes * EVICTION_TARGET_RATIO)
+            rows = conn.execute("SELECT key, size FROM cache ORDER BY accessed_at ASC").fetchall()
+            stale_keys = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                stale_keys.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM cache WHERE key = ?", stale_keys)
+        conn.commit()
@@ -0,0 +1,122 @@
+"""
+초안 통계 인덱스 모듈
+======================
+- drafts 딕셔너리를 대신하는 DraftStore: 꼭지를 저장/삭제할 때 바뀐 꼭지만 다시 셈
+- 꼭지별 글자 수는 내용 해시와 함께 보관 (같은 내용을 다시 저장하면 재계산 안 함)
+- 전체 글자 수는 항상 합계를 유지해서 O(1)로 조회
+
+진행률 바, 헤더, 뱃지, 사이드바가 화면을 그릴 때마다 모든 초안을
+다시 세던 부분을 대체합니다.
+"""
+
+from typing import Any, Dict, Tuple
+
+
+def count_chars(text: str) -> int:
+    """공백/줄바꿈을 뺀 글자 수"""
+    if not text or not isinstance(text, str):
+        return 0
+    return len(text.replace(" ", "").replace("\n", ""))
+
+
+class DraftStore(dict):
+    """꼭지별 글자 수 인덱스를 함께 관리하는 drafts 딕셔너리"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__()
+        self._counts: Dict[Any, Tuple[Any, int]] = {}  # 키 -> ((내용 해시, 길이), 글자 수)
+        self._total_chars = 0
+        self.membership_version = 0  # 꼭지가 추가/삭제될 때마다 증가 (목차 인덱스 동기화용)
+        self.update(*args, **kwargs)
+
+    def _index(self) -> Dict[Any, Tuple[Any, int]]:
+        # copy.deepcopy / pickle 은 __init__ 없이 객체를 만들 수 있음
+        if "_counts" not in self.__dict__:
+            self._counts = {}
+            self._total_chars = 0
+            self.membership_version = 0
+        return self._counts
+
+    def _track(self, key, value):
+        counts = self._index()
+        # 문자열 해시는 객체에 캐시되므로 같은 문자열이면 O(1)
+        content_hash = (hash(value), len(value)) if isinstance(value, str) else None
+        previous = counts.get(key)
+        if previous is not None and content_hash is not None and previous[0] == content_hash:
+            return
+
+        chars = count_chars(value)
+        self._total_chars += chars - (previous[1] if previous else 0)
+        counts[key] = (content_hash, chars)
+        if previous is None:
+            self.membership_version += 1
+
+    def _untrack(self, key):
+        previous = self._index().pop(key, None)
+        if previous is not None:
+            self._total_chars -= previous[1]
+            self.membership_version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._track(key, value)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._untrack(key)
+
+    def pop(self, key, *default):
+        if key in self:
+            self._untrack(key)
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._untrack(key)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return super().__getitem__(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def clear(self):
+        super().clear()
+        self._index().clear()
+        self._total_chars = 0
+        self.membership_version += 1
+
+    def copy(self) -> "DraftStore":
+        return DraftStore(self)
+
+    @property
+    def total_chars(self) -> int:
+        """전체 글자 수 (O(1))"""
+        self._index()
+        return self._total_chars
+
+    def section_chars(self, key) -> int:
+        """꼭지 글자 수 (O(1))"""
+        entry = self._index().get(key)
+        return entry[1] if entry else 0
+
+
+def ensure_draft_store(state) -> DraftStore:
+    """
+    세션의 drafts를 DraftStore로 바꿔서 반환
+
+    자동 저장 복구 등으로 일반 dict가 들어온 경우에만 한 번 변환합니다.
+    """
+    drafts = state.get("drafts", {})
+    if not isinstance(drafts, DraftStore):
+        drafts = DraftStore(drafts if isinstance(drafts, dict) else {})
+        state["drafts"] = drafts
+    return drafts
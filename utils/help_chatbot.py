@@ -592,19 +592,21 @@ def render_enhanced_chatbot(current_step: int, book_info: dict = None):
         pending_q = st.session_state.pending_help_question
         del st.session_state.pending_help_question
 
-        with st.spinner("답변을 준비하고 있습니다..."):
-            try:
-                response = chat_with_coach(
-                    st.session_state.help_chat_messages,
-                    book_info,
-                    elementary_friendly=True
-                )
-                if response:
-                    st.session_state.help_chat_messages.append({"role": "assistant", "content": response})
-            except Exception as e:
-                # 에러 시 기본 응답 제공
-                fallback = get_fallback_response(pending_q, context)
-                st.session_state.help_chat_messages.append({"role": "assistant", "content": fallback})
+        try:
+            # 답변을 생성되는 대로 바로 표시
+            stream = chat_with_coach(
+                st.session_state.help_chat_messages,
+                book_info,
+                elementary_friendly=True,
+                stream=True
+            )
+            response = st.write_stream(stream) if stream else None
+            if response:
+                st.session_state.help_chat_messages.append({"role": "assistant", "content": response})
+        except Exception as e:
+            # 에러 시 기본 응답 제공
+            fallback = get_fallback_response(pending_q, context)
+            st.session_state.help_chat_messages.append({"role": "assistant", "content": fallback})
         st.rerun()
 
     # 최근 대화 표시 (최대 6개)
@@ -0,0 +1,93 @@
+"""
+API 클라이언트 공유 모듈
+=========================
+- Anthropic/OpenAI 클라이언트를 프로세스 전체에서 하나씩만 만들어 재사용
+- keep-alive 연결 풀로 요청마다 TCP/TLS 연결을 새로 맺지 않음
+- 연결 풀 크기와 타임아웃은 Streamlit Secrets로 변경 가능
+"""
+
+import threading
+from typing import Any, Callable, Dict, Tuple
+
+import streamlit as st
+
+try:
+    import httpx
+except ImportError:  # 최신 SDK는 httpx2 패키지를 사용
+    import httpx2 as httpx
+
+
+# 연결 풀 기본 설정 (Secrets로 변경 가능)
+DEFAULT_POOL_SETTINGS = {
+    "API_POOL_MAX_CONNECTIONS": 50,      # 동시에 열 수 있는 최대 연결 수
+    "API_POOL_MAX_KEEPALIVE": 20,        # 유휴 상태로 유지할 연결 수
+    "API_POOL_KEEPALIVE_EXPIRY": 30.0,   # 유휴 연결 유지 시간 (초)
+    "API_CONNECT_TIMEOUT": 10.0,         # 연결 타임아웃 (초)
+    "API_READ_TIMEOUT": 600.0,           # 응답 대기 타임아웃 (초, 긴 생성 고려)
+}
+
+_registry: Dict[Tuple[str, str], Any] = {}
+_registry_lock = threading.Lock()
+
+
+def get_pool_settings() -> dict:
+    """Secrets에 지정된 값으로 덮어쓴 연결 풀 설정 반환"""
+    settings = dict(DEFAULT_POOL_SETTINGS)
+    for name, default in DEFAULT_POOL_SETTINGS.items():
+        try:
+            value = st.secrets.get(name)
+            if value is not None:
+                settings[name] = type(default)(value)
+        except Exception:
+            pass
+    return settings
+
+
+def build_http_client(client_class: Callable, settings: dict = None):
+    """SDK 기본 HTTP 클라이언트를 연결 풀/타임아웃 설정과 함께 생성"""
+    settings = settings or get_pool_settings()
+    return client_class(
+        limits=httpx.Limits(
+            max_connections=settings["API_POOL_MAX_CONNECTIONS"],
+            max_keepalive_connections=settings["API_POOL_MAX_KEEPALIVE"],
+            keepalive_expiry=settings["API_POOL_KEEPALIVE_EXPIRY"],
+        ),
+        timeout=build_timeout(settings),
+    )
+
+
+def build_timeout(settings: dict = None):
+    """연결/응답 타임아웃 객체 생성"""
+    settings = settings or get_pool_settings()
+    return httpx.Timeout(settings["API_READ_TIMEOUT"], connect=settings["API_CONNECT_TIMEOUT"])
+
+
+def get_shared_client(name: str, api_key: str, factory: Callable[[], Any]):
+    """
+    (이름, API 키)별로 클라이언트를 한 번만 만들어 공유
+
+    여러 스레드가 동시에 처음 요청해도 factory는 한 번만 호출됩니다.
+    API 키가 바뀌면 새 클라이언트를 만듭니다.
+    """
+    registry_key = (name, api_key)
+    client = _registry.get(registry_key)
+    if client is not None:
+        return client
+
+    with _registry_lock:
+        client = _registry.get(registry_key)
+        if client is None:
+            client = factory()
+            _registry[registry_key] = client
+        return client
+
+
+def reset_shared_clients():
+    """공유 클라이언트를 모두 닫고 비움 (설정 변경/테스트용)"""
+    with _registry_lock:
+        for client in _registry.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _registry.clear()
@@ -0,0 +1,219 @@
+"""
+API 요청 속도 제한 모듈
+========================
+- 모델별 토큰 버킷으로 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한
+- 여러 세션(학생)이 동시에 요청하면 세션 단위로 돌아가며 공평하게 순서 배정
+- 429 응답을 받으면 해당 모델 요청을 모든 세션에서 잠시 멈춤
+- 재시도 대기 시간은 지터(무작위)를 섞은 지수 백오프 + retry-after 헤더 존중
+
+한 반 전체가 동시에 버튼을 눌러도 요청이 한꺼번에 몰려 429가 연쇄적으로
+터지지 않도록, 모든 API 호출이 이 스케줄러에서 차례를 받은 뒤 나갑니다.
+"""
+
+import random
+import threading
+import time
+from collections import OrderedDict, deque
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+
+# 재시도 대기 상한 (초)
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class TokenBucket:
+    """분당 한도만큼 연속적으로 채워지는 토큰 버킷"""
+
+    def __init__(self, per_minute: float, capacity: float = None, clock=time.monotonic):
+        self.rate = per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else per_minute)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def wait_time(self, amount: float) -> float:
+        """amount 만큼 쓰려면 기다려야 하는 시간 (초, 0이면 바로 가능)"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        """토큰 사용 (실제 사용량이 예상보다 많으면 음수까지 허용)"""
+        self._refill()
+        self.tokens -= amount
+
+    def refund(self, amount: float):
+        """예약했지만 쓰지 않은 토큰 반환"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RequestScheduler:
+    """
+    모델별 RPM/TPM 버킷과 세션 간 공평 대기열을 가진 요청 스케줄러
+
+    limits 예시: {"claude-opus-...": {"rpm": 50, "tpm": 80000}}
+    (선택) "burst": 한 번에 몰아서 보낼 수 있는 최대 요청 수
+    limits에 없는 모델은 제한 없이 바로 통과합니다.
+    """
+
+    def __init__(self, limits: Dict[str, dict], clock=time.monotonic):
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._request_buckets = {}
+        self._token_buckets = {}
+        self._queues: Dict[str, OrderedDict] = {}
+        self._paused_until: Dict[str, float] = {}
+
+        for model, limit in limits.items():
+            self._request_buckets[model] = TokenBucket(limit["rpm"], limit.get("burst"), clock=clock)
+            self._token_buckets[model] = TokenBucket(limit["tpm"], clock=clock)
+
+    def _reserve_wait(self, model: str, tokens: int) -> float:
+        """버킷에 여유가 있으면 예약하고 0, 없으면 기다릴 시간 반환"""
+        paused = self._paused_until.get(model, 0) - self._clock()
+        if paused > 0:
+            return paused
+
+        wait = max(
+            self._request_buckets[model].wait_time(1),
+            self._token_buckets[model].wait_time(tokens),
+        )
+        if wait > 0:
+            return wait
+
+        self._request_buckets[model].consume(1)
+        self._token_buckets[model].consume(tokens)
+        return 0.0
+
+    def acquire(self, model: str, tokens: int, session_id: str = "", timeout: float = None) -> bool:
+        """
+        요청 차례를 받을 때까지 대기
+
+        같은 세션의 요청은 들어온 순서대로, 세션끼리는 돌아가며 한 건씩 배정합니다.
+
+        Returns:
+            True: 차례를 받음 (tokens 만큼 예약됨)
+            False: timeout 안에 차례를 받지 못함
+        """
+        if model not in self._request_buckets:
+            return True
+
+        deadline = None if timeout is None else self._clock() + timeout
+        ticket = object()
+
+        with self._cond:
+            queue = self._queues.setdefault(model, OrderedDict())
+            queue.setdefault(session_id, deque()).append(ticket)
+
+            try:
+                while True:
+                    head_session = next(iter(queue))
+                    wait = None
+                    if head_session == session_id and queue[session_id][0] is ticket:
+                        wait = self._reserve_wait(model, tokens)
+                        if wait == 0:
+                            self._pop_head(queue, session_id)
+                            self._cond.notify_all()
+                            return True
+
+                    if deadline is not None:
+                        remaining = deadline - self._clock()
+                        if remaining <= 0:
+                            self._remove_ticket(queue, session_id, ticket)
+                            self._cond.notify_all()
+                            return False
+                        wait = remaining if wait is None else min(wait, remaining)
+
+                    self._cond.wait(timeout=wait)
+            except BaseException:
+                self._remove_ticket(queue, session_id, ticket)
+                self._cond.notify_all()
+                raise
+
+    @staticmethod
+    def _pop_head(queue: OrderedDict, session_id: str):
+        """세션의 첫 요청을 꺼내고 세션을 대기열 맨 뒤로 보냄 (라운드 로빈)"""
+        queue[session_id].popleft()
+        if queue[session_id]:
+            queue.move_to_end(session_id)
+        else:
+            del queue[session_id]
+
+    @staticmethod
+    def _remove_ticket(queue: OrderedDict, session_id: str, ticket):
+        tickets = queue.get(session_id)
+        if tickets and ticket in tickets:
+            tickets.remove(ticket)
+            if not tickets:
+                del queue[session_id]
+
+    def record_usage(self, model: str, reserved_tokens: int, used_tokens: Optional[int]):
+        """실제 사용 토큰으로 예약분 정산 (남으면 반환, 모자라면 추가 차감)"""
+        if model not in self._token_buckets or used_tokens is None:
+            return
+        with self._cond:
+            difference = reserved_tokens - used_tokens
+            if difference > 0:
+                self._token_buckets[model].refund(difference)
+            elif difference < 0:
+                self._token_buckets[model].consume(-difference)
+            self._cond.notify_all()
+
+    def release(self, model: str, reserved_tokens: int):
+        """요청이 처리되지 않았을 때 예약한 토큰 전부 반환"""
+        self.record_usage(model, reserved_tokens, 0)
+
+    def pause(self, model: str, seconds: float):
+        """429 등으로 모델 요청을 모든 세션에서 seconds 동안 멈춤"""
+        if seconds <= 0:
+            return
+        with self._cond:
+            until = self._clock() + seconds
+            self._paused_until[model] = max(self._paused_until.get(model, 0), until)
+            self._cond.notify_all()
+
+
+def backoff_delay(attempt: int, base: float, retry_after: float = None, cap: float = MAX_BACKOFF_SECONDS) -> float:
+    """
+    재시도 대기 시간 계산 (full jitter 지수 백오프)
+
+    0 ~ base * 2^attempt 사이 무작위 값으로 여러 세션의 재시도가 한꺼번에
+    몰리지 않게 하고, 서버가 retry-after를 알려주면 그보다 짧게 기다리지 않습니다.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """API 에러 응답의 retry-after 헤더 값 (초) 반환, 없으면 None"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return max(0.0, float(retry_after_ms) / 1000)
+
+        retry_after = headers.get("retry-after")
+        if retry_after is None:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            # HTTP 날짜 형식
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+    except Exception:
+        return None
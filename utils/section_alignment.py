@@ -0,0 +1,225 @@
+"""
+목차-영상 구간 정렬 모듈
+=========================
+- 영상별 타임스탬프 자막을 ALIGN_WINDOW_SECONDS 단위 시간 창으로 묶음
+- 목차 꼭지를 영상에 배정 (영상 수와 Part 수가 맞으면 Part별, 아니면 순서대로 나눔)
+- 꼭지 제목과 시간 창의 BM25 점수 + "목차 순서 ≈ 영상 순서" 위치 점수를 합쳐
+  꼭지 순서를 지키는 최적 배치를 동적 계획법으로 찾음
+- 결과는 영상별 구간 인덱스(시작 시각 정렬 리스트)로 보관해서
+  꼭지 → (영상, 시작, 끝, 자막) / 시각 → 꼭지 를 바로 조회
+
+초안 요청마다 해당 꼭지 구간의 자막만 넣고, 화면에는 영상 타임코드 링크를 보여줍니다.
+Part 구간을 글자 수로 5등분하던 방식을 대체합니다.
+"""
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+from utils.toc_index import section_key
+from utils.transcript_index import Bm25Index
+
+
+# 정렬 단위 시간 창 (초)
+ALIGN_WINDOW_SECONDS = 30
+# 제목과 겹치는 단어가 없을 때 목차 순서대로 고르게 펼치는 위치 점수 가중치
+POSITION_PRIOR_WEIGHT = 1.0
+
+
+def build_windows(segments: List[Dict], window_seconds: float = ALIGN_WINDOW_SECONDS) -> List[Tuple[float, float, str]]:
+    """
+    타임스탬프 자막을 시간 창 목록으로 묶음
+
+    Returns:
+        [(시작 초, 끝 초, 자막 텍스트)]
+    """
+    windows = []
+    texts: List[str] = []
+    window_start = None
+    window_end = 0.0
+
+    for segment in segments or []:
+        start = float(segment.get("start", 0) or 0)
+        end = start + float(segment.get("duration", 0) or 0)
+        if window_start is None:
+            window_start = start
+        elif start - window_start >= window_seconds and texts:
+            windows.append((window_start, window_end, " ".join(texts)))
+            texts = []
+            window_start = start
+        texts.append(segment.get("text", ""))
+        window_end = max(window_end, end, start)
+
+    if texts:
+        windows.append((window_start, window_end, " ".join(texts)))
+    return windows
+
+
+def align_sections(titles: List[str], windows: List[Tuple[float, float, str]]) -> List[Tuple[int, int]]:
+    """
+    꼭지 제목 목록(목차 순서)을 시간 창 범위에 순서대로 배치
+
+    각 꼭지의 기준 창(anchor)을 꼭지 순서대로 증가하게 고르되, 제목과의 관련도와
+    목차상 위치에 맞는 영상 위치를 함께 고려합니다. 인접한 기준 창의 중간이 경계가 됩니다.
+
+    Returns:
+        꼭지별 (시작 창, 끝 창(미포함))
+    """
+    count = len(titles)
+    total = len(windows)
+    if not count or not total:
+        return []
+
+    bm25 = Bm25Index([text for _, _, text in windows])
+
+    # 꼭지별 창 점수: 관련도(꼭지 안에서 0~1로 정규화) - 위치 차이
+    score_rows = []
+    for s, title in enumerate(titles):
+        relevance = bm25.scores(title)
+        best = max(relevance.values(), default=0.0) or 1.0
+        expected = (s + 0.5) / count
+        score_rows.append([
+            relevance.get(w, 0.0) / best - POSITION_PRIOR_WEIGHT * abs((w + 0.5) / total - expected)
+            for w in range(total)
+        ])
+
+    # 동적 계획법: best[w] = 이번 꼭지 기준 창이 w일 때 지금까지 최고 점수 (기준 창은 감소하지 않음)
+    choices = []
+    previous = None
+    for s in range(count):
+        current = [0.0] * total
+        choice = [0] * total
+        running_best, running_arg = float("-inf"), 0
+        for w in range(total):
+            if previous is not None and previous[w] > running_best:
+                running_best, running_arg = previous[w], w
+            carried = running_best if previous is not None else 0.0
+            current[w] = carried + score_rows[s][w]
+            choice[w] = running_arg
+        choices.append(choice)
+        previous = current
+
+    anchors = [0] * count
+    anchors[-1] = max(range(total), key=lambda w: previous[w])
+    for s in range(count - 1, 0, -1):
+        anchors[s - 1] = choices[s][anchors[s]]
+
+    cuts = [0] + [(anchors[s - 1] + anchors[s] + 1) // 2 for s in range(1, count)] + [total]
+    return [(cuts[s], min(total, max(cuts[s + 1], cuts[s] + 1))) for s in range(count)]
+
+
+def assign_videos(parsed_toc: List[dict], video_ids: List[str], video_parts: List[int]) -> List[str]:
+    """
+    꼭지별 영상 배정
+
+    모든 꼭지의 Part 번호에 해당하는 영상이 있으면 Part별로, 아니면 목차 순서대로 나눠 배정합니다.
+    """
+    if not video_ids:
+        return []
+    part_to_video = dict(zip(video_parts, video_ids))
+    if all(section.get("part") in part_to_video for section in parsed_toc):
+        return [part_to_video[section["part"]] for section in parsed_toc]
+
+    total = len(parsed_toc)
+    return [video_ids[min(len(video_ids) - 1, idx * len(video_ids) // total)] for idx in range(total)]
+
+
+class SectionAlignment:
+    """목차 꼭지 ↔ 영상 타임스탬프 구간 인덱스"""
+
+    def __init__(
+        self,
+        parsed_toc: List[dict],
+        video_ids: List[str],
+        video_segments: Dict[str, List[Dict]],
+        video_parts: List[int] = None,
+    ):
+        """
+        Args:
+            parsed_toc: 파싱된 목차
+            video_ids: 영상 ID 목록 (Part 순서)
+            video_segments: {video_id: 타임스탬프 자막} (못 가져온 영상은 없어도 됨)
+            video_parts: 영상별 Part 번호 (없으면 1, 2, ...)
+        """
+        self.toc = parsed_toc
+        self.video_ids = list(video_ids)
+        self.spans: Dict[str, dict] = {}
+        self.intervals: Dict[str, Tuple[List[float], List[str]]] = {}
+
+        parts = video_parts or list(range(1, len(self.video_ids) + 1))
+        assigned = assign_videos(parsed_toc, self.video_ids, parts)
+
+        for video_id in self.video_ids:
+            windows = build_windows(video_segments.get(video_id))
+            if not windows:
+                # 타임스탬프가 없는 영상의 꼭지는 구간 없음 (기존 방식으로 대체)
+                continue
+
+            indices = [idx for idx, vid in enumerate(assigned) if vid == video_id]
+            ranges = align_sections([parsed_toc[idx]["section_title"] for idx in indices], windows)
+
+            starts, keys = [], []
+            for idx, (first, last) in zip(indices, ranges):
+                key = section_key(parsed_toc[idx])
+                span = {
+                    "video_id": video_id,
+                    "start": windows[first][0],
+                    "end": windows[last - 1][1],
+                    "text": " ".join(text for _, _, text in windows[first:last]),
+                }
+                self.spans[key] = span
+                starts.append(span["start"])
+                keys.append(key)
+            self.intervals[video_id] = (starts, keys)
+
+    def matches(self, parsed_toc: List[dict], video_ids: List[str]) -> bool:
+        """같은 목차/영상 목록으로 만든 정렬인지 확인"""
+        return self.toc is parsed_toc and self.video_ids == list(video_ids)
+
+    def span_for(self, key: str) -> Optional[dict]:
+        """꼭지의 영상 구간 ({video_id, start, end, text}, 없으면 None)"""
+        return self.spans.get(key)
+
+    def section_at(self, video_id: str, seconds: float) -> Optional[str]:
+        """영상의 특정 시각이 속한 꼭지 키"""
+        starts, keys = self.intervals.get(video_id, ([], []))
+        position = bisect_right(starts, seconds) - 1
+        return keys[position] if position >= 0 else None
+
+
+def get_section_alignment(state, segments_fn: Callable = None) -> Optional[SectionAlignment]:
+    """
+    세션의 목차/영상 자막에 맞는 구간 정렬 반환 (목차나 영상 목록이 바뀔 때만 다시 만듦)
+
+    타임스탬프 자막은 자막 추출 때 디스크 캐시에 함께 저장되어 있어 보통 바로 읽힙니다.
+    타임스탬프를 하나도 못 가져오면 None (기존 Part 자막 방식 사용).
+    """
+    parsed_toc = state.get("parsed_toc") or []
+    transcripts = state.get("youtube_transcripts") or {}
+    if not parsed_toc or not transcripts:
+        return None
+
+    video_ids = sorted(transcripts, key=lambda vid: transcripts[vid].get("part_number", 0))
+    alignment = state.get("youtube_section_alignment")
+    if not isinstance(alignment, SectionAlignment) or not alignment.matches(parsed_toc, video_ids):
+        if segments_fn is None:
+            from utils.youtube_handler import get_transcript_with_timestamps
+            segments_fn = get_transcript_with_timestamps
+
+        video_segments = {}
+        for video_id in video_ids:
+            try:
+                segments, _ = segments_fn(video_id)
+            except Exception:
+                segments = None
+            if segments:
+                video_segments[video_id] = segments
+
+        alignment = SectionAlignment(
+            parsed_toc,
+            video_ids,
+            video_segments,
+            [transcripts[video_id].get("part_number", i + 1) for i, video_id in enumerate(video_ids)],
+        )
+        state["youtube_section_alignment"] = alignment
+
+    return alignment if alignment.spans else None
@@ -0,0 +1,140 @@
+"""
+한국어 문장 분리 모듈
+======================
+- 음성 인식(자동 자막) 텍스트처럼 마침표가 없는 한국어도 문장 끝(~다/~요/~죠 등)에서 분리
+- 정규식 한 번 훑기(finditer)로 처리해서 자막 길이에 비례하는 시간만 걸림
+- 문장 문자열을 복사하지 않고 (시작, 끝) 위치만 차례로 돌려줌
+- [00:12], (1:02:03) 같은 타임스탬프와 줄바꿈은 문장 경계로 보고 문장에서 뺌
+- 청크는 문장 조각을 리스트에 모아 한 번에 join (선택적으로 앞 청크 끝부분을 겹쳐 넣음)
+"""
+
+import re
+from typing import Iterator, List, Optional, Tuple
+
+
+# 문장 끝으로 보는 한국어 어미 (뒤에 공백/끝이 와야 함)
+# "다"/"요"는 흔한 어미 앞 글자와 함께일 때만 ("다 같이", "필요", "중요"는 제외)
+SENTENCE_ENDINGS = (
+    r"니다|습니까|니까요"
+    r"|[었았였했겠됐갔왔봤줬]다|[한된는인있없같싶렵좋많]다"
+    r"|[어아에예해세네군지죠래게걸데까]요"
+    r"|거든요|잖아요|죠"
+)
+
+# 타임스탬프: [00:12], (01:02:03), 00:12 (단독 단어)
+TIMESTAMP_PATTERN = r"[\[(]?\b\d{1,2}:\d{2}(?::\d{2})?\b[\])]?"
+
+BOUNDARY_PATTERN = re.compile(
+    r"(?P<punct>[.?!。？！…]+[\"'”’)\]]*)(?=\s|$)"
+    r"|(?P<ending>" + SENTENCE_ENDINGS + r")[.?!~]*(?=\s|$)"
+    r"|(?P<break>" + TIMESTAMP_PATTERN + r"|\n)"
+)
+
+
+def _trimmed(text: str, start: int, end: int) -> Tuple[int, int]:
+    """앞뒤 공백을 뺀 위치"""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _split_long(text: str, start: int, end: int, max_chars: int) -> Iterator[Tuple[int, int]]:
+    """max_chars보다 긴 문장을 공백 위치(없으면 글자 수)에서 나눔"""
+    while end - start > max_chars:
+        cut = text.rfind(" ", start + 1, start + max_chars + 1)
+        if cut <= start:
+            cut = start + max_chars
+        yield _trimmed(text, start, cut)
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    if start < end:
+        yield start, end
+
+
+def iter_sentence_spans(text: str, max_chars: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+    """
+    문장 위치를 앞에서부터 차례로 반환
+
+    Args:
+        text: 자막 텍스트
+        max_chars: 지정하면 이보다 긴 문장은 공백 위치에서 더 나눔
+
+    Yields:
+        (시작, 끝) - text[시작:끝]이 문장 (앞뒤 공백 없음)
+    """
+    if not text:
+        return
+
+    start = 0
+    for match in BOUNDARY_PATTERN.finditer(text):
+        if match.lastgroup == "break":
+            end, next_start = match.start(), match.end()
+        else:
+            end = next_start = match.end()
+
+        span_start, span_end = _trimmed(text, start, end)
+        if span_start < span_end:
+            if max_chars and span_end - span_start > max_chars:
+                yield from _split_long(text, span_start, span_end, max_chars)
+            else:
+                yield span_start, span_end
+        start = next_start
+
+    span_start, span_end = _trimmed(text, start, len(text))
+    if span_start < span_end:
+        if max_chars and span_end - span_start > max_chars:
+            yield from _split_long(text, span_start, span_end, max_chars)
+        else:
+            yield span_start, span_end
+
+
+def split_sentences(text: str, max_chars: Optional[int] = None) -> List[str]:
+    """문장 리스트 반환 (iter_sentence_spans 결과를 잘라낸 문자열)"""
+    return [text[start:end] for start, end in iter_sentence_spans(text, max_chars)]
+
+
+def chunk_text(text: str, max_chars: int = 4000, overlap: int = 0) -> List[str]:
+    """
+    문장 단위로 max_chars 이내 청크 만들기
+
+    Args:
+        text: 자막 텍스트
+        max_chars: 청크당 최대 글자 수
+        overlap: 다음 청크 앞에 이전 청크 끝 문장들을 이만큼(글자 수 이내) 다시 넣음
+
+    Returns:
+        청크 리스트
+    """
+    if not text:
+        return []
+
+    overlap = max(0, min(overlap, max_chars // 2))
+    chunks: List[str] = []
+    parts: List[Tuple[int, int]] = []
+    length = 0
+
+    for start, end in iter_sentence_spans(text, max_chars):
+        size = end - start
+        if parts and length + 1 + size > max_chars:
+            chunks.append(" ".join(text[s:e] for s, e in parts))
+
+            # 겹침: 끝에서부터 overlap 글자 이내 문장들을 다음 청크로 넘김
+            carried: List[Tuple[int, int]] = []
+            carried_length = 0
+            for s, e in reversed(parts):
+                if carried_length + (e - s) + 1 > overlap or carried_length + (e - s) + 1 + size > max_chars:
+                    break
+                carried.append((s, e))
+                carried_length += (e - s) + 1
+            parts = carried[::-1]
+            length = max(0, carried_length - 1)
+
+        length += size + (1 if parts else 0)
+        parts.append((start, end))
+
+    if parts:
+        chunks.append(" ".join(text[s:e] for s, e in parts))
+    return chunks
@@ -0,0 +1,284 @@
+"""
+세션 저널 모듈
+===============
+- 자동 저장 때마다 세션 전체를 다시 쓰지 않고, 바뀐 항목만 한 줄(JSON)씩 저널 끝에 덧붙임
+- 초안(drafts)과 영상별 자막(youtube_transcripts)은 꼭지/영상 단위로 바뀐 것만 기록
+- 기록이 쌓이면 전체 상태를 스냅샷 파일로 압축(compaction)하고 저널을 비움
+- 복구는 스냅샷 + 저널을 순서대로 다시 적용(replay)
+
+자동 저장이 꼭지 하나를 쓸 때마다 책 전체와 자막을 다시 쓰던 부분을 대체합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.disk_cache import dumps_compact
+
+
+JOURNAL_FILENAME = "journal.jsonl"
+SNAPSHOT_FILENAME = "snapshot.json"
+
+# 꼭지/영상 단위로 기록하는 항목 (딕셔너리)
+SECTIONED_FIELDS = ("drafts", "youtube_transcripts")
+# 매번 바뀌지만 그것만으로는 기록할 필요 없는 항목 (기록 머리에 따로 남김)
+VOLATILE_FIELDS = ("saved_at",)
+
+# 압축 조건: 기록 수가 이보다 많거나, 저널이 스냅샷보다 커지면 (최소 크기 이상일 때)
+COMPACT_MAX_RECORDS = 50
+COMPACT_MIN_JOURNAL_BYTES = 64 * 1024
+
+
+def _fingerprint(value: Any) -> Any:
+    """
+    값 비교용 해시 (내용이 같으면 같은 값, 프로세스 안에서만 사용)
+
+    문자열은 객체에 캐시되는 hash()를 써서 같은 초안 문자열이면 다시 훑지 않습니다.
+    """
+    if isinstance(value, str):
+        return ("str", hash(value), len(value))
+    payload = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def apply_record(state: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    """저널 기록 하나를 상태에 적용"""
+    state.update(record.get("set", {}))
+    for field, sections in record.get("sections", {}).items():
+        target = state.get(field)
+        if not isinstance(target, dict):
+            target = state[field] = {}
+        target.update(sections)
+    for field, keys in record.get("removed", {}).items():
+        target = state.get(field)
+        if isinstance(target, dict):
+            for key in keys:
+                target.pop(key, None)
+    if record.get("saved_at"):
+        state["saved_at"] = record["saved_at"]
+    return state
+
+
+class SessionJournal:
+    """학생 한 명의 스냅샷 + 저널 저장소 (디렉토리 하나)"""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.journal_path = self.directory / JOURNAL_FILENAME
+        self.snapshot_path = self.directory / SNAPSHOT_FILENAME
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._state: Dict[str, Any] = {}
+        self._fingerprints: Dict[str, Any] = {}
+        self._seq = 0
+        self._records = 0
+        self._journal_bytes = 0
+        self._snapshot_bytes = 0
+
+    def exists(self) -> bool:
+        """저장된 내용이 있는지"""
+        return self.snapshot_path.exists() or self.journal_path.exists()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """스냅샷 + 저널을 다시 적용한 최신 상태 (저장된 게 없으면 None)"""
+        with self._lock:
+            self._replay()
+            return json.loads(dumps_compact(self._state)) if self._state else None
+
+    def _replay(self):
+        state: Dict[str, Any] = {}
+        seq = 0
+        records = 0
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
+
+        if self.snapshot_path.exists():
+            try:
+                raw = self.snapshot_path.read_bytes()
+                snapshot = json.loads(raw.decode("utf-8"))
+                state = snapshot.get("state", {})
+                seq = snapshot.get("seq", 0)
+                self._snapshot_bytes = len(raw)
+            except Exception:
+                state, seq = {}, 0
+
+        if self.journal_path.exists():
+            good_offset = 0
+            with open(self.journal_path, "rb") as f:
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break  # 쓰다 만 마지막 줄
+                    try:
+                        record = json.loads(line.decode("utf-8"))
+                    except Exception:
+                        break
+                    good_offset += len(line)
+                    # 스냅샷 직후 저널을 비우기 전에 멈춘 경우 이미 반영된 기록은 건너뜀
+                    if record.get("seq", 0) <= seq:
+                        continue
+                    apply_record(state, record)
+                    seq = record["seq"]
+                    records += 1
+            if good_offset < self.journal_path.stat().st_size:
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(good_offset)
+            self._journal_bytes = good_offset
+
+        self._state = state
+        self._seq = seq
+        self._records = records
+        self._fingerprints = self._fingerprint_state(state)
+        self._loaded = True
+
+    @staticmethod
+    def _fingerprint_state(state: Dict[str, Any]) -> Dict[str, Any]:
+        fingerprints: Dict[str, Any] = {}
+        for field, value in state.items():
+            if field in VOLATILE_FIELDS:
+                continue
+            if field in SECTIONED_FIELDS and isinstance(value, dict):
+                fingerprints[field] = {key: _fingerprint(section) for key, section in value.items()}
+            else:
+                fingerprints[field] = _fingerprint(value)
+        return fingerprints
+
+    def _update_fingerprints(self, record: Dict[str, Any]):
+        """기록에 들어간 항목의 해시만 갱신"""
+        for field, value in record.get("set", {}).items():
+            if field in SECTIONED_FIELDS and isinstance(value, dict):
+                self._fingerprints[field] = {key: _fingerprint(section) for key, section in value.items()}
+            else:
+                self._fingerprints[field] = _fingerprint(value)
+        for field, sections in record.get("sections", {}).items():
+            target = self._fingerprints.setdefault(field, {})
+            for key, section in sections.items():
+                target[key] = _fingerprint(section)
+        for field, keys in record.get("removed", {}).items():
+            target = self._fingerprints.get(field, {})
+            for key in keys:
+                target.pop(key, None)
+
+    def _delta(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """저장된 상태와 비교해 바뀐 항목만 모은 기록 (바뀐 게 없으면 빈 딕셔너리)"""
+        changed: Dict[str, Any] = {}
+        sections: Dict[str, Dict] = {}
+        removed: Dict[str, list] = {}
+
+        for field, value in state.items():
+            if field in VOLATILE_FIELDS:
+                continue
+            previous = self._fingerprints.get(field)
+            if field in SECTIONED_FIELDS and isinstance(value, dict) and (previous is None or isinstance(previous, dict)):
+                previous = previous or {}
+                updated = {key: section for key, section in value.items() if previous.get(key) != _fingerprint(section)}
+                gone = [key for key in previous if key not in value]
+                if field not in self._fingerprints:
+                    # 처음 기록하는 항목은 빈 딕셔너리라도 남김
+                    changed[field] = {}
+                if updated:
+                    sections[field] = updated
+                if gone:
+                    removed[field] = gone
+            elif previous != _fingerprint(value):
+                changed[field] = value
+
+        record = {}
+        if changed:
+            record["set"] = changed
+        if sections:
+            record["sections"] = sections
+        if removed:
+            record["removed"] = removed
+        return record
+
+    def append(self, state: Dict[str, Any]) -> bool:
+        """
+        바뀐 항목만 저널에 덧붙임 (필요하면 스냅샷으로 압축)
+
+        Returns:
+            새 기록을 썼으면 True, 바뀐 게 없으면 False
+        """
+        with self._lock:
+            if not self._loaded:
+                self._replay()
+
+            record = self._delta(state)
+            if not record:
+                return False
+
+            record["seq"] = self._seq + 1
+            record["saved_at"] = state.get("saved_at")
+            line = (dumps_compact(record) + "\n").encode("utf-8")
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "ab") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            apply_record(self._state, json.loads(line.decode("utf-8")))
+            self._update_fingerprints(record)
+            self._seq = record["seq"]
+            self._records += 1
+            self._journal_bytes += len(line)
+
+            if self._should_compact():
+                self.compact()
+            return True
+
+    def _should_compact(self) -> bool:
+        if self._records >= COMPACT_MAX_RECORDS:
+            return True
+        return self._journal_bytes >= COMPACT_MIN_JOURNAL_BYTES and self._journal_bytes > self._snapshot_bytes
+
+    def compact(self):
+        """현재 상태를 스냅샷으로 쓰고 저널 비우기 (임시 파일에 쓴 뒤 이름 변경)"""
+        with self._lock:
+            if not self._loaded:
+                self._replay()
+
+            payload = dumps_compact({"seq": self._seq, "saved_at": self._state.get("saved_at"), "state": self._state}).encode("utf-8")
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path = self.snapshot_path.with_suffix(".tmp")
+            with open(temp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            temp_path.replace(self.snapshot_path)
+
+            # 여기서 멈춰도 다음 복구 때 seq로 중복 기록을 건너뜀
+            with open(self.journal_path, "wb"):
+                pass
+            self._records = 0
+            self._journal_bytes = 0
+            self._snapshot_bytes = len(payload)
+
+    def modified_time(self) -> float:
+        """마지막으로 쓴 시각 (스냅샷/저널 중 늦은 것)"""
+        times = [path.stat().st_mtime for path in (self.snapshot_path, self.journal_path) if path.exists()]
+        return max(times) if times else 0.0
+
+    def disk_bytes(self) -> int:
+        """스냅샷 + 저널 용량"""
+        return sum(path.stat().st_size for path in (self.snapshot_path, self.journal_path) if path.exists())
+
+    def delete(self):
+        """저장된 스냅샷/저널 삭제"""
+        with self._lock:
+            for path in (self.snapshot_path, self.journal_path):
+                if path.exists():
+                    path.unlink()
+            try:
+                self.directory.rmdir()
+            except OSError:
+                pass
+            self._state = {}
+            self._fingerprints = {}
+            self._seq = 0
+            self._records = 0
+            self._journal_bytes = 0
+            self._snapshot_bytes = 0
+            self._loaded = True
@@ -0,0 +1,514 @@
+"""
+저장소 모듈
+============
+- 자동 저장/백업과 문의 메시지를 파일 대신 SQLite(WAL) 한 곳에 저장하는 백엔드
+- 학생(students), 백업(backups), 초안(drafts), 메시지(messages) 테이블과 조회용 인덱스
+- 쓰기는 모두 트랜잭션 하나로 처리 (임시 파일 이름 변경 대신, 여러 세션이 동시에 써도 안전)
+- 자동 저장은 바뀐 꼭지 초안만 다시 씀
+- 기존 파일(data/autosave, messages.json/csv)을 가져오는 이전(migration) 도구 포함
+
+사용할 백엔드는 Streamlit Secrets의 STORAGE_BACKEND로 고릅니다 ("file" 기본, "sqlite").
+기존 파일 가져오기:
+    python -m utils.storage migrate
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import streamlit as st
+
+from utils.backup_manifest import BACKUP_FILENAME_PATTERN, JOURNAL_SUFFIX, backup_list_query
+from utils.blob_store import BlobStore, resolve_blobs
+from utils.disk_cache import dumps_compact
+from utils.session_journal import SessionJournal
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DEFAULT_DB_PATH = DATA_DIR / "book_coaching.sqlite3"
+
+STORAGE_BACKENDS = ("file", "sqlite")
+DEFAULT_STORAGE_BACKEND = "file"
+
+MESSAGE_COLUMNS = (
+    "student_name",
+    "timestamp",
+    "message",
+    "current_step",
+    "step_name",
+    "status",
+    "book_title",
+    "book_topic",
+    "admin_reply",
+    "reply_timestamp",
+)
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS students (
+        student_key TEXT PRIMARY KEY,
+        student_name TEXT,
+        updated_at REAL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS backups (
+        filename TEXT PRIMARY KEY,
+        student_key TEXT NOT NULL REFERENCES students (student_key),
+        student_name TEXT,
+        saved_at TEXT,
+        selected_title TEXT,
+        current_step INTEGER,
+        drafts_count INTEGER,
+        total_chars INTEGER,
+        file_size INTEGER,
+        modified_time REAL NOT NULL,
+        is_journal INTEGER NOT NULL DEFAULT 0,
+        state TEXT NOT NULL,
+        state_hash TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_backups_modified ON backups (modified_time)",
+    "CREATE INDEX IF NOT EXISTS idx_backups_student ON backups (student_key, modified_time)",
+    """
+    CREATE TABLE IF NOT EXISTS drafts (
+        filename TEXT NOT NULL REFERENCES backups (filename) ON DELETE CASCADE,
+        section_key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        content TEXT NOT NULL,
+        PRIMARY KEY (filename, section_key)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_key TEXT NOT NULL,
+        student_name TEXT,
+        timestamp TEXT,
+        message TEXT,
+        current_step INTEGER,
+        step_name TEXT,
+        status TEXT NOT NULL DEFAULT 'pending',
+        book_title TEXT,
+        book_topic TEXT,
+        admin_reply TEXT,
+        reply_timestamp TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_messages_status ON messages (status)",
+    "CREATE INDEX IF NOT EXISTS idx_messages_student ON messages (student_key, id)",
+)
+
+
+def message_student_key(student_name: str) -> str:
+    """메시지 조회용 학생 키 (대소문자 구분 없음)"""
+    return (student_name or "").strip().lower()
+
+
+class SqliteStorage:
+    """SQLite 저장소 (백업/초안/메시지)"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys=ON")
+        if not self._initialized:
+            with self._lock:
+                if not self._initialized:
+                    conn.execute("PRAGMA journal_mode=WAL")
+                    for statement in SCHEMA:
+                        conn.execute(statement)
+                    conn.commit()
+                    self._initialized = True
+        return conn
+
+    # ---------------------------------------------------------------
+    # 백업
+    # ---------------------------------------------------------------
+
+    def save_backup(
+        self,
+        filename: str,
+        student_key: str,
+        data: Dict[str, Any],
+        is_journal: bool = False,
+        keep: Optional[int] = None,
+        modified_time: Optional[float] = None,
+    ) -> bool:
+        """
+        백업 저장 (한 트랜잭션)
+
+        같은 filename이 있으면 바뀐 꼭지 초안과 나머지 상태만 갱신합니다.
+
+        Args:
+            filename: 백업 이름 (목록/불러오기 키)
+            student_key: 학생 키 (파일명용으로 정리한 이름)
+            data: 세션 데이터
+            is_journal: 자동 저장(학생별로 하나를 계속 갱신)인지
+            keep: 지정하면 이 학생의 일반 백업을 최신 keep개만 남김
+            modified_time: 목록 정렬에 쓰는 수정 시각 (기본: 지금, 이전할 때는 원래 파일 시각)
+
+        Returns:
+            바뀐 내용이 있어 기록했으면 True
+        """
+        drafts = data.get("drafts") if isinstance(data.get("drafts"), dict) else {}
+        state = {key: value for key, value in data.items() if key != "drafts"}
+        state_json = dumps_compact(state)
+        # saved_at은 매번 바뀌므로 변경 여부 비교에서 뺌
+        state_hash = hashlib.sha1(dumps_compact({k: v for k, v in state.items() if k != "saved_at"}).encode("utf-8")).hexdigest()
+        student_name = data.get("student_name") or data.get("book_info", {}).get("name") or student_key
+        now = time.time()
+        modified = now if modified_time is None else modified_time
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT INTO students (student_key, student_name, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT (student_key) DO UPDATE SET student_name = excluded.student_name, updated_at = excluded.updated_at",
+                    (student_key, student_name, now),
+                )
+                existing = conn.execute("SELECT state_hash FROM backups WHERE filename = ?", (filename,)).fetchone()
+                changed = existing is None or existing["state_hash"] != state_hash
+
+                contents = [(filename, str(key), position, str(text or "")) for position, (key, text) in enumerate(drafts.items())]
+                if existing is None:
+                    conn.execute(
+                        "INSERT INTO backups (filename, student_key, modified_time, is_journal, state) VALUES (?, ?, ?, ?, '{}')",
+                        (filename, student_key, modified, int(is_journal)),
+                    )
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT INTO drafts (filename, section_key, position, content) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (filename, section_key) DO UPDATE SET position = excluded.position, content = excluded.content "
+                    "WHERE drafts.content IS NOT excluded.content OR drafts.position IS NOT excluded.position",
+                    contents,
+                )
+                keys = {row[1] for row in contents}
+                stale = [
+                    (filename, row["section_key"])
+                    for row in conn.execute("SELECT section_key FROM drafts WHERE filename = ?", (filename,))
+                    if row["section_key"] not in keys
+                ]
+                conn.executemany("DELETE FROM drafts WHERE filename = ? AND section_key = ?", stale)
+                changed = changed or conn.total_changes != before
+
+                if changed:
+                    conn.execute(
+                        "UPDATE backups SET student_key = ?, student_name = ?, saved_at = ?, selected_title = ?, current_step = ?, "
+                        "drafts_count = ?, total_chars = ?, file_size = ?, modified_time = ?, is_journal = ?, state = ?, state_hash = ? "
+                        "WHERE filename = ?",
+                        (
+                            student_key,
+                            student_name,
+                            data.get("saved_at", ""),
+                            data.get("selected_title", ""),
+                            data.get("current_step", 1),
+                            len(drafts),
+                            sum(len(row[3]) for row in contents),
+                            len(state_json.encode("utf-8")) + sum(len(row[3].encode("utf-8")) for row in contents),
+                            modified,
+                            int(is_journal),
+                            state_json,
+                            state_hash,
+                            filename,
+                        ),
+                    )
+
+                if keep is not None:
+                    conn.execute(
+                        "DELETE FROM backups WHERE filename IN ("
+                        "SELECT filename FROM backups WHERE student_key = ? AND is_journal = 0 "
+                        "ORDER BY modified_time DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                        (student_key, keep),
+                    )
+            return changed
+        finally:
+            conn.close()
+
+    def load_backup(self, filename: str) -> Optional[Dict[str, Any]]:
+        """백업 불러오기 (초안을 꼭지 순서대로 다시 합침, 없으면 None)"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT state FROM backups WHERE filename = ?", (filename,)).fetchone()
+            if row is None:
+                return None
+            data = json.loads(row["state"])
+            data["drafts"] = {
+                draft["section_key"]: draft["content"]
+                for draft in conn.execute(
+                    "SELECT section_key, content FROM drafts WHERE filename = ? ORDER BY position", (filename,)
+                )
+            }
+            return data
+        finally:
+            conn.close()
+
+    def delete_backup(self, filename: str) -> bool:
+        """백업 삭제 (초안도 함께)"""
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute("DELETE FROM backups WHERE filename = ?", (filename,)).rowcount > 0
+        finally:
+            conn.close()
+
+    def list_backups(self, student_key: str = None, limit: int = None, include_journals: bool = True) -> List[Dict[str, Any]]:
+        """백업 목록 (최신순, 학생 지정 가능, 파일 백업 인덱스와 같은 형식)"""
+        query, params = backup_list_query(student_key, limit, include_journals)
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def count_backups(self) -> int:
+        """백업 수"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM backups").fetchone()[0]
+        finally:
+            conn.close()
+
+    # ---------------------------------------------------------------
+    # 메시지
+    # ---------------------------------------------------------------
+
+    def add_message(self, message: Dict[str, Any], message_id: Optional[int] = None) -> int:
+        """메시지 추가 (번호는 DB가 매김, 이전할 때는 기존 번호 유지)"""
+        values = [message.get(column, "") for column in MESSAGE_COLUMNS]
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(
+                    f"INSERT OR IGNORE INTO messages (id, student_key, {', '.join(MESSAGE_COLUMNS)}) "
+                    f"VALUES (?, ?, {', '.join('?' for _ in MESSAGE_COLUMNS)})",
+                    [message_id, message_student_key(message.get("student_name"))] + values,
+                )
+                return cursor.lastrowid if cursor.rowcount else (message_id or 0)
+        finally:
+            conn.close()
+
+    def list_messages(self, student_name: str = None) -> List[Dict[str, Any]]:
+        """메시지 목록 (접수 순, 학생 지정 시 대소문자 구분 없이 비교)"""
+        query = f"SELECT id, {', '.join(MESSAGE_COLUMNS)} FROM messages"
+        params = []
+        if student_name is not None:
+            query += " WHERE student_key = ?"
+            params.append(message_student_key(student_name))
+        query += " ORDER BY id"
+
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(query, params).fetchall()]
+        finally:
+            conn.close()
+
+    def update_message(self, message_id: int, status: str, admin_reply: str = "", reply_timestamp: str = "") -> bool:
+        """메시지 상태/답변 갱신"""
+        conn = self._connect()
+        try:
+            with conn:
+                if admin_reply:
+                    cursor = conn.execute(
+                        "UPDATE messages SET status = ?, admin_reply = ?, reply_timestamp = ? WHERE id = ?",
+                        (status, admin_reply, reply_timestamp, message_id),
+                    )
+                else:
+                    cursor = conn.execute("UPDATE messages SET status = ? WHERE id = ?", (status, message_id))
+                return cursor.rowcount > 0
+        finally:
+            conn.close()
+
+    def count_messages(self, status: str) -> int:
+        """상태별 메시지 수"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COUNT(*) FROM messages WHERE status = ?", (status,)).fetchone()[0]
+        finally:
+            conn.close()
+
+
+# ---------------------------------------------------------------
+# 백엔드 선택
+# ---------------------------------------------------------------
+
+_storage: Optional[SqliteStorage] = None
+_storage_lock = threading.Lock()
+
+
+def get_storage_backend() -> str:
+    """Secrets의 STORAGE_BACKEND ("file" 또는 "sqlite", 기본 "file")"""
+    try:
+        backend = str(st.secrets.get("STORAGE_BACKEND", DEFAULT_STORAGE_BACKEND)).strip().lower()
+    except Exception:
+        backend = DEFAULT_STORAGE_BACKEND
+    return backend if backend in STORAGE_BACKENDS else DEFAULT_STORAGE_BACKEND
+
+
+def get_db_path() -> Path:
+    """SQLite 파일 경로 (Secrets의 STORAGE_DB_PATH로 변경 가능)"""
+    try:
+        path = st.secrets.get("STORAGE_DB_PATH")
+    except Exception:
+        path = None
+    return Path(path) if path else DEFAULT_DB_PATH
+
+
+def get_storage() -> Optional[SqliteStorage]:
+    """SQLite 저장소 (파일 백엔드를 쓰면 None, 프로세스에서 하나만 만들어 재사용)"""
+    global _storage
+    if get_storage_backend() != "sqlite":
+        return None
+    with _storage_lock:
+        if _storage is None:
+            _storage = SqliteStorage(get_db_path())
+        return _storage
+
+
+# ---------------------------------------------------------------
+# 기존 파일 가져오기
+# ---------------------------------------------------------------
+
+def _student_key_from_filename(filename: str, data: Dict[str, Any]) -> str:
+    match = BACKUP_FILENAME_PATTERN.match(filename)
+    if match:
+        return match.group(1)
+    return re.sub(r"[^\w가-힣]+", "_", str(data.get("student_name") or "")).strip("_")[:50] or "unknown"
+
+
+def _read_json_messages(path: Path) -> List[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8") or "[]")
+    except Exception:
+        return []
+    return [item for item in data if isinstance(item, dict)] if isinstance(data, list) else []
+
+
+def _read_csv_messages(path: Path) -> List[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [
+                {
+                    "student_name": row.get("student_name", ""),
+                    "timestamp": row.get("timestamp", ""),
+                    "message": row.get("message", ""),
+                    # CSV에는 단계 이름만 있음
+                    "step_name": row.get("current_step", ""),
+                    "current_step": 0,
+                    "status": row.get("status") or "pending",
+                    "admin_reply": row.get("admin_reply", ""),
+                    "reply_timestamp": row.get("reply_timestamp", ""),
+                }
+                for row in csv.DictReader(f)
+                if row
+            ]
+    except Exception:
+        return []
+
+
+def migrate_files(
+    storage: SqliteStorage,
+    autosave_dir: Path = DATA_DIR / "autosave",
+    messages_json: Path = DATA_DIR / "messages.json",
+    messages_csv: Path = DATA_DIR / "messages.csv",
+) -> Dict[str, int]:
+    """
+    기존 파일 저장 데이터를 SQLite로 가져오기 (여러 번 실행해도 같은 결과)
+
+    - 자동 저장 백업(*.json)과 저널(journal/이름)은 같은 이름으로 저장 (blob 참조는 본문으로 풀어서)
+    - 수정 시각은 원래 파일 시각을 유지 (최근 작업/목록 순서가 가져온 순서로 바뀌지 않게)
+    - 메시지는 messages.json 번호를 그대로 유지
+    - messages.csv는 messages.json과 같은 내용을 함께 적던 사본이므로 JSON이 없을 때만 사용
+
+    Returns:
+        {"backups": 가져온 백업 수, "messages": 가져온 메시지 수}
+    """
+    counts = {"backups": 0, "messages": 0}
+    autosave_dir = Path(autosave_dir)
+
+    if autosave_dir.exists():
+        # 백업 파일에 참조로 남은 초안/자막 본문은 blob 저장소에서 채워서 가져옴
+        blob_store = BlobStore(autosave_dir / "blobs")
+        for path in sorted(autosave_dir.glob("*.json")):
+            try:
+                data = resolve_blobs(json.loads(path.read_text(encoding="utf-8")), blob_store)
+                storage.save_backup(
+                    path.name, _student_key_from_filename(path.name, data), data, modified_time=path.stat().st_mtime
+                )
+                counts["backups"] += 1
+            except Exception as e:
+                print(f"백업 가져오기 실패 ({path.name}): {e}")
+
+        journal_dir = autosave_dir / "journal"
+        if journal_dir.exists():
+            for directory in sorted(journal_dir.iterdir()):
+                if not directory.is_dir():
+                    continue
+                try:
+                    journal = SessionJournal(directory)
+                    data = journal.load()
+                    if data:
+                        storage.save_backup(
+                            directory.name + JOURNAL_SUFFIX, directory.name, data,
+                            is_journal=True, modified_time=journal.modified_time(),
+                        )
+                        counts["backups"] += 1
+                except Exception as e:
+                    print(f"저널 가져오기 실패 ({directory.name}): {e}")
+
+    messages_json, messages_csv = Path(messages_json), Path(messages_csv)
+    if messages_json.exists():
+        messages = [(message, message.get("id")) for message in _read_json_messages(messages_json)]
+    elif messages_csv.exists():
+        messages = [(message, None) for message in _read_csv_messages(messages_csv)]
+    else:
+        messages = []
+
+    existing = {(m["student_name"], m["timestamp"], m["message"]) for m in storage.list_messages()}
+    for message, message_id in messages:
+        if (message.get("student_name"), message.get("timestamp"), message.get("message")) in existing:
+            continue
+        storage.add_message(message, message_id if isinstance(message_id, int) else None)
+        counts["messages"] += 1
+
+    return counts
+
+
+def main(argv: Iterable[str] = None):
+    parser = argparse.ArgumentParser(description="기존 파일 저장 데이터를 SQLite 저장소로 가져오기")
+    parser.add_argument("command", choices=["migrate"])
+    parser.add_argument("--db", type=Path, default=None, help="SQLite 파일 경로 (기본: 앱과 같은 STORAGE_DB_PATH 설정)")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR, help="기존 data 디렉토리")
+    args = parser.parse_args(argv)
+
+    # 앱이 여는 DB와 같은 곳으로 가져옴
+    db_path = args.db or get_db_path()
+    if db_path != get_db_path():
+        print(f"주의: 앱은 {get_db_path()}를 사용합니다. (STORAGE_DB_PATH 설정 확인)")
+
+    counts = migrate_files(
+        SqliteStorage(db_path),
+        autosave_dir=args.data_dir / "autosave",
+        messages_json=args.data_dir / "messages.json",
+        messages_csv=args.data_dir / "messages.csv",
+    )
+    print(f"가져오기 완료: 백업 {counts['backups']}개, 메시지 {counts['messages']}개 → {db_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+목차 인덱스 모듈
+=================
+- 파싱된 목차(parsed_toc)의 섹션 키 ↔ 인덱스, Part ↔ 섹션 위치를 미리 계산
+- 꼭지 완료 여부를 비트맵(리스트)과 Part별 완료 수로 보관
+- drafts의 키 구성이 바뀐 경우에만 완료 상태를 다시 맞춤
+
+4단계 화면과 사이드바가 다시 그려질 때마다 목차 전체를 여러 번
+훑던 부분(Part별 개수, 미완료 목록, 인덱스 찾기)을 대체합니다.
+"""
+
+from typing import Dict, List, Optional
+
+from utils.draft_stats import ensure_draft_store
+
+
+def section_key(section: dict) -> str:
+    """섹션 키 생성 (drafts 딕셔너리의 키)"""
+    return f"{section['section_num']}_{section['section_title']}"
+
+
+class TocIndex:
+    """parsed_toc 한 개에 대한 조회용 인덱스"""
+
+    def __init__(self, parsed_toc: List[dict]):
+        self.toc = parsed_toc
+        self.keys: List[str] = [section_key(s) for s in parsed_toc]
+        self.key_to_index: Dict[str, int] = {}
+        self.part_indices: Dict[int, List[int]] = {}
+
+        for idx, (section, key) in enumerate(zip(parsed_toc, self.keys)):
+            self.key_to_index.setdefault(key, idx)
+            self.part_indices.setdefault(section["part"], []).append(idx)
+
+        self.parts: List[int] = sorted(self.part_indices)
+        self.completed: List[bool] = [False] * len(self.keys)
+        self.part_completed: Dict[int, int] = {part: 0 for part in self.parts}
+        self.completed_count = 0
+        self._synced_drafts = None
+        self._synced_version = None
+
+    def matches(self, parsed_toc: List[dict]) -> bool:
+        """같은 목차(같은 리스트 객체, 같은 길이)에 대한 인덱스인지 확인"""
+        return self.toc is parsed_toc and len(self.keys) == len(parsed_toc)
+
+    def set_completed(self, idx: int, done: bool):
+        """한 섹션의 완료 상태 변경 (Part별 완료 수도 함께 갱신)"""
+        if self.completed[idx] == done:
+            return
+        self.completed[idx] = done
+        delta = 1 if done else -1
+        self.completed_count += delta
+        self.part_completed[self.toc[idx]["part"]] += delta
+
+    def sync(self, drafts: dict):
+        """
+        drafts 기준으로 완료 상태 맞춤
+
+        DraftStore면 키 구성이 바뀌었을 때만 다시 확인하므로
+        글 내용만 고친 재실행에서는 아무 작업도 하지 않습니다.
+        """
+        version = getattr(drafts, "membership_version", None)
+        if version is not None and drafts is self._synced_drafts and version == self._synced_version:
+            return
+
+        for idx, key in enumerate(self.keys):
+            self.set_completed(idx, key in drafts)
+
+        self._synced_drafts = drafts
+        self._synced_version = version
+
+    def index_of(self, key: str) -> Optional[int]:
+        """섹션 키의 목차 위치 (없으면 None)"""
+        return self.key_to_index.get(key)
+
+    def sections_in_part(self, part: int) -> List[dict]:
+        """Part에 속한 섹션 목록"""
+        return [self.toc[idx] for idx in self.part_indices.get(part, [])]
+
+    def first_index_of_part(self, part: int) -> Optional[int]:
+        """Part의 첫 섹션 위치"""
+        indices = self.part_indices.get(part)
+        return indices[0] if indices else None
+
+    def is_part_completed(self, part: int) -> bool:
+        """Part의 모든 섹션 완료 여부"""
+        return self.part_completed.get(part, 0) == len(self.part_indices.get(part, []))
+
+    def unfinished_sections(self) -> List[dict]:
+        """아직 쓰지 않은 섹션 목록 (목차 순서)"""
+        return [self.toc[idx] for idx, done in enumerate(self.completed) if not done]
+
+
+def get_toc_index(state) -> TocIndex:
+    """
+    세션의 parsed_toc에 맞는 인덱스 반환 (drafts 완료 상태까지 맞춤)
+
+    parse_toc 결과가 새로 저장되면(리스트 객체가 바뀌면) 그때 한 번만 다시 만듭니다.
+    """
+    parsed_toc = state.get("parsed_toc") or []
+    index = state.get("toc_index")
+    if not isinstance(index, TocIndex) or not index.matches(parsed_toc):
+        index = TocIndex(parsed_toc)
+        state["toc_index"] = index
+
+    index.sync(ensure_draft_store(state))
+    return index
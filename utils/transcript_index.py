@@ -0,0 +1,215 @@
+"""
+자막 검색 인덱스 모듈
+======================
+- 통합 자막을 몇 문장씩 겹치는 구간(passage)으로 나눔
+- 한글은 글자 2-gram, 영문/숫자는 단어 단위로 토큰화 (형태소 분석기 없이 조사/어미 변화에 강함)
+- 토큰 → 구간 역색인 + BM25 점수로 꼭지 제목과 가까운 구간 top-k 검색
+- "=== Part N: 제목 ===" 구분자를 읽어 구간마다 Part 번호를 기록 (Part별 검색)
+
+자막 추출이 끝날 때 한 번 만들어 세션에 보관하고, 꼭지마다 자막 전체를
+다시 훑던 키워드 위치 평균 방식을 대체합니다.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from utils.sentence_segmenter import split_sentences
+
+
+# BM25 파라미터 (일반적인 기본값)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# 구간 설정: 문장 PASSAGE_SENTENCES개씩, PASSAGE_STRIDE 문장마다 새 구간 시작 (겹침으로 경계 손실 방지)
+PASSAGE_SENTENCES = 6
+PASSAGE_STRIDE = 3
+PASSAGE_MAX_CHARS = 1200
+
+PART_HEADER_PATTERN = re.compile(r"=== Part (\d+):[^\n]*===")
+TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-zA-Z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 생성
+
+    한글 덩어리는 글자 2-gram(한 글자면 그대로), 영문은 소문자 단어, 숫자는 그대로 씁니다.
+    """
+    tokens = []
+    for match in TOKEN_PATTERN.finditer(text or ""):
+        word = match.group()
+        if "가" <= word[0] <= "힣":
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif word.isdigit():
+            tokens.append(word)
+        elif len(word) > 1:
+            tokens.append(word.lower())
+    return tokens
+
+
+def split_passages(transcript: str) -> Tuple[List[str], List[Tuple[Optional[int], int, int]]]:
+    """
+    통합 자막을 문장 목록과 구간 목록으로 분할
+
+    Returns:
+        (문장 리스트, [(Part 번호, 시작 문장, 끝 문장(미포함))])
+        Part 구분자가 없으면 Part 번호는 None 입니다.
+    """
+    sections = []
+    headers = list(PART_HEADER_PATTERN.finditer(transcript or ""))
+    if headers:
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(transcript)
+            sections.append((int(header.group(1)), transcript[header.end():end]))
+    else:
+        sections.append((None, transcript or ""))
+
+    sentences = []
+    spans = []
+    for part, text in sections:
+        offset = len(sentences)
+        part_sentences = split_sentences(text, PASSAGE_MAX_CHARS)
+        sentences.extend(part_sentences)
+
+        start = 0
+        while start < len(part_sentences):
+            stop = start
+            length = 0
+            while stop < min(len(part_sentences), start + PASSAGE_SENTENCES):
+                if stop > start and length + len(part_sentences[stop]) > PASSAGE_MAX_CHARS:
+                    break
+                length += len(part_sentences[stop]) + 1
+                stop += 1
+            spans.append((part, offset + start, offset + stop))
+            if stop >= len(part_sentences):
+                break
+            start += max(1, min(PASSAGE_STRIDE, stop - start))
+    return sentences, spans
+
+
+class Bm25Index:
+    """토큰 → 문서 역색인 + BM25 점수 계산 (문서는 구간, 시간 창 등 무엇이든)"""
+
+    def __init__(self, documents: List[str]):
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}  # 토큰 -> [(문서 번호, 등장 수)]
+        self.lengths: List[int] = []
+
+        for idx, text in enumerate(documents):
+            counts = Counter(tokenize(text))
+            self.lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                self.postings.setdefault(token, []).append((idx, tf))
+
+        count = len(documents)
+        self.avg_length = (sum(self.lengths) / count) if count else 0.0
+        self.idf: Dict[str, float] = {
+            token: math.log(1 + (count - len(posting) + 0.5) / (len(posting) + 0.5))
+            for token, posting in self.postings.items()
+        }
+
+    def scores(self, query: str, allowed: Optional[set] = None) -> Dict[int, float]:
+        """질의 토큰이 하나라도 나온 문서의 BM25 점수 (allowed로 대상 문서 제한)"""
+        scores: Dict[int, float] = {}
+        for token, query_tf in Counter(tokenize(query)).items():
+            posting = self.postings.get(token)
+            if not posting:
+                continue
+            idf = self.idf[token]
+            for idx, tf in posting:
+                if allowed is not None and idx not in allowed:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[idx] / self.avg_length)
+                scores[idx] = scores.get(idx, 0.0) + query_tf * idf * tf * (BM25_K1 + 1) / (tf + norm)
+        return scores
+
+
+class TranscriptIndex:
+    """통합 자막 하나에 대한 BM25 역색인"""
+
+    def __init__(self, transcript: str):
+        self.source_hash = (hash(transcript), len(transcript or ""))
+        self.sentences, self.spans = split_passages(transcript)
+        self.part_passages: Dict[Optional[int], List[int]] = {}
+        for idx, (part, _, _) in enumerate(self.spans):
+            self.part_passages.setdefault(part, []).append(idx)
+        self.bm25 = Bm25Index([self.passage(idx) for idx in range(len(self.spans))])
+
+    def matches(self, transcript: str) -> bool:
+        """같은 자막으로 만든 인덱스인지 확인 (문자열 해시는 캐시되므로 O(1))"""
+        return self.source_hash == (hash(transcript), len(transcript or ""))
+
+    def passage(self, idx: int) -> str:
+        """구간 텍스트"""
+        _, first, last = self.spans[idx]
+        return " ".join(self.sentences[first:last])
+
+    def search(self, query: str, top_k: int = 3, part: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        질의와 가장 관련 있는 구간 검색
+
+        Args:
+            query: 검색어 (보통 꼭지 제목)
+            top_k: 반환할 구간 수
+            part: 지정하면 해당 Part 구간만 검색 (그 Part가 없으면 전체)
+
+        Returns:
+            [(구간 번호, 점수)] 점수 높은 순
+        """
+        allowed = None
+        if part is not None and part in self.part_passages:
+            allowed = set(self.part_passages[part])
+
+        scores = self.bm25.scores(query, allowed)
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:top_k]
+
+    def build_context(self, query: str, max_chars: int = 4000, part: Optional[int] = None, top_k: int = 5) -> str:
+        """
+        검색된 구간을 자막 순서대로 이어 붙여 max_chars 이내 참고 자료로 반환
+
+        겹치는 구간의 문장은 한 번만 넣고, 떨어진 구간 사이는 빈 줄로 구분합니다.
+        검색 결과가 없으면 해당 Part(또는 전체) 앞부분을 돌려줍니다.
+        """
+        hits = [idx for idx, _ in self.search(query, top_k=top_k, part=part)]
+        if not hits:
+            hits = self.part_passages.get(part) if part in self.part_passages else list(range(len(self.spans)))
+
+        chosen = set()
+        length = 0
+        for idx in hits:
+            _, first, last = self.spans[idx]
+            added = [i for i in range(first, last) if i not in chosen]
+            extra = sum(len(self.sentences[i]) + 1 for i in added)
+            if chosen and length + extra > max_chars:
+                continue
+            chosen.update(added)
+            length += extra
+            if length >= max_chars:
+                break
+
+        blocks = []
+        previous = None
+        for i in sorted(chosen):
+            if previous is None or i != previous + 1:
+                blocks.append([])
+            blocks[-1].append(self.sentences[i])
+            previous = i
+
+        return "\n\n".join(" ".join(block) for block in blocks)[:max_chars]
+
+
+def get_transcript_index(state, transcript: str, key: str = "youtube_transcript_index") -> TranscriptIndex:
+    """
+    세션에 보관된 자막 인덱스 반환 (자막이 바뀌었거나 없으면 새로 만듦)
+
+    자동 저장 복구 뒤처럼 인덱스가 없는 경우에도 처음 한 번만 만듭니다.
+    """
+    index = state.get(key)
+    if not isinstance(index, TranscriptIndex) or not index.matches(transcript):
+        index = TranscriptIndex(transcript)
+        state[key] = index
+    return index
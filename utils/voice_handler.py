@@ -1,15 +1,59 @@
 """음성 처리 모듈 - 음성 입력을 텍스트로 변환 + 강화된 에러 핸들링"""
 import streamlit as st
-from openai import OpenAI
-import tempfile
-import os
+from openai import OpenAI, DefaultHttpxClient
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+import hashlib
 import time
+from utils.disk_cache import DiskCache, make_cache_key
+from utils.http_pool import build_http_client, build_timeout, get_shared_client
 
 
+# Whisper 요청 설정
+WHISPER_MODEL = "whisper-1"
+TRANSCRIBE_LANGUAGE = "ko"  # 한국어 설정
+
 # 지원하는 오디오 형식
 SUPPORTED_AUDIO_FORMATS = ["mp3", "wav", "m4a", "ogg", "webm", "mp4"]
-MAX_FILE_SIZE_MB = 25
+MAX_FILE_SIZE_MB = 25  # Whisper API 요청 1회 최대 용량
+MAX_UPLOAD_SIZE_MB = 200  # 업로드 최대 용량 (Streamlit 기본 업로드 한도, 큰 파일은 나눠서 변환)
+
+# 긴 녹음 분할 변환 설정 (압축한 전체가 요청 1회 한도를 넘을 때만 나눔)
+# 구간은 SEGMENT_MAX_SECONDS 이하로 자르되, 자르는 위치 앞 SILENCE_SEARCH_SECONDS 안의
+# 가장 긴 무음 가운데에서 잘라 말이 끊기지 않게 합니다. (무음이 없으면 그 위치에서 자름)
+SEGMENT_MAX_SECONDS = 9 * 60
+SILENCE_SEARCH_SECONDS = 60
+MIN_SILENCE_MS = 500
+SILENCE_THRESHOLD_DB = 16  # 평균 음량보다 이만큼 작으면 무음
+SILENCE_SEEK_STEP_MS = 20
+SEGMENT_FRAME_RATE = 16000  # Whisper 내부 샘플링 레이트
+
+# 업로드 전 압축: 16kHz 모노로 줄인 뒤 mp3 32kbps로 인코딩 (1시간 ≈ 14MB, 요청 1회 한도 25MB)
+# 압축한 전체가 한도 안이면 나누지 않고 한 번에 보냅니다.
+# ffmpeg가 없으면 16kHz 모노 wav로 보냅니다. (약 13분 넘으면 한도 초과 → 9분 구간 ≈ 17MB로 나눔)
+COMPRESS_FORMAT = "mp3"
+COMPRESS_BITRATE = "32k"
+
+# 구간 동시 변환 수 (Whisper 요청은 대부분 네트워크 대기)
+DEFAULT_TRANSCRIBE_WORKERS = 4
+MAX_TRANSCRIBE_WORKERS = 8
+# 변환 결과 캐시 (같은 음성 파일을 다시 올리거나 재실행해도 Whisper에 다시 보내지 않음)
+# 키는 원본 음성 바이트의 SHA-256 + 모델 + 언어, 용량 한도(LRU)로만 정리합니다.
+# 긴 녹음은 구간별로도 저장해서 일부 구간이 실패한 뒤 다시 시도하면 남은 구간만 요청합니다.
+TRANSCRIPTION_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+TRANSCRIPTION_CACHE_MAX_BYTES = 100 * 1024 * 1024  # 100MB
+
+_transcription_cache = DiskCache(
+    TRANSCRIPTION_CACHE_DIR / "audio_transcriptions.sqlite3",
+    max_bytes=TRANSCRIPTION_CACHE_MAX_BYTES,
+)
+
+# 구간별 최대 시도 횟수 (실패한 구간만 다시 요청)
+SEGMENT_MAX_ATTEMPTS = 3
+# 다시 시도해도 소용없는 에러
+NON_RETRYABLE_ERRORS = ("api_key", "file_format", "file_size", "permission")
 
 # 에러 메시지 (전문적이고 정중한 한국어)
 ERROR_MESSAGES = {
@@ -33,7 +77,13 @@ mp3, wav, m4a 등의 음성 파일을 선택해 주세요.
     "file_size": """
 **파일 용량이 초과되었습니다.**
 
-25MB 이하의 파일을 사용해 주세요.
+200MB 이하의 파일을 사용해 주세요.
+""",
+    "decode": """
+**음성 파일을 나누는 중 오류가 발생했습니다.**
+
+긴 파일은 여러 구간으로 나눠서 변환합니다.
+mp3 또는 wav 형식으로 다시 저장한 뒤 시도해 주세요.
 """,
     "empty_audio": """
 **녹음된 내용이 너무 짧습니다.**
@@ -106,26 +156,343 @@ def classify_audio_error(error: Exception) -> str:
 
 
 def get_openai_client():
-    """OpenAI 클라이언트 인스턴스 반환"""
+    """OpenAI 클라이언트 인스턴스 반환 (프로세스 전체에서 공유)"""
     try:
         api_key = st.secrets.get("OPENAI_API_KEY")
         if not api_key or api_key == "여기에_OPENAI_API_키_입력":
             return None
-        return OpenAI(api_key=api_key)
+        return get_shared_client(
+            "openai",
+            api_key,
+            lambda: OpenAI(
+                api_key=api_key,
+                http_client=build_http_client(DefaultHttpxClient),
+                timeout=build_timeout(),
+            ),
+        )
     except Exception as e:
         return None
 
 
-def transcribe_audio(audio_data, file_extension="wav"):
+def load_audio(audio_bytes: bytes, file_extension: str = "wav"):
     """
-    음성 데이터를 텍스트로 변환 (Whisper API 사용)
+    pydub으로 오디오 불러오기 (구간 분할용으로 16kHz 모노로 변환)
+
+    wav 외 형식은 ffmpeg가 필요합니다. 실패하면 예외를 그대로 올립니다.
+    """
+    from pydub import AudioSegment
+
+    audio = AudioSegment.from_file(BytesIO(audio_bytes), format=file_extension)
+    return audio.set_channels(1).set_frame_rate(SEGMENT_FRAME_RATE)
+
+
+def find_split_points(
+    audio,
+    max_segment_ms: int = SEGMENT_MAX_SECONDS * 1000,
+    search_ms: int = SILENCE_SEARCH_SECONDS * 1000,
+    min_silence_ms: int = MIN_SILENCE_MS,
+) -> List[Tuple[int, int]]:
+    """
+    긴 오디오를 무음 위치에서 나눌 구간 계산
+
+    전체를 훑지 않고 자를 위치 바로 앞(search_ms)만 무음 검사해서 녹음 길이에 비례하는 시간만 걸립니다.
+
+    Returns:
+        [(시작 ms, 끝 ms)] 구간마다 max_segment_ms 이하
+    """
+    from pydub.silence import detect_silence
+
+    total = len(audio)
+    if total <= max_segment_ms:
+        return [(0, total)] if total else []
+
+    threshold = audio.dBFS - SILENCE_THRESHOLD_DB
+    search_ms = min(search_ms, max_segment_ms // 2)
+    ranges = []
+    start = 0
+    while total - start > max_segment_ms:
+        limit = start + max_segment_ms
+        window_start = limit - search_ms
+        silences = detect_silence(
+            audio[window_start:limit],
+            min_silence_len=min_silence_ms,
+            silence_thresh=threshold,
+            seek_step=SILENCE_SEEK_STEP_MS,
+        )
+        if silences:
+            # 가장 긴 무음(같으면 뒤쪽)의 가운데
+            silence_start, silence_end = max(silences, key=lambda r: (r[1] - r[0], r[0]))
+            cut = window_start + (silence_start + silence_end) // 2
+        else:
+            cut = limit
+        ranges.append((start, cut))
+        start = cut
+    ranges.append((start, total))
+    return ranges
+
+
+def encode_audio(audio, start_ms: int = None, end_ms: int = None) -> Tuple[bytes, str]:
+    """
+    업로드용으로 구간(없으면 전체) 인코딩
+
+    Returns:
+        (바이트, 확장자) - mp3 압축에 실패하면(ffmpeg 없음) wav
+    """
+    clip = audio[start_ms:end_ms] if start_ms is not None or end_ms is not None else audio
+    try:
+        buffer = BytesIO()
+        clip.export(buffer, format=COMPRESS_FORMAT, bitrate=COMPRESS_BITRATE)
+        return buffer.getvalue(), COMPRESS_FORMAT
+    except Exception:
+        buffer = BytesIO()
+        clip.export(buffer, format="wav")
+        return buffer.getvalue(), "wav"
+
+
+def log_compression(stats: Dict):
+    """압축 전후 용량/시간 기록"""
+    original_mb = stats["original_bytes"] / (1024 * 1024)
+    sent_mb = stats["sent_bytes"] / (1024 * 1024)
+    saved = 1 - stats["sent_bytes"] / stats["original_bytes"] if stats["original_bytes"] else 0
+    print(
+        f"음성 압축: {original_mb:.1f}MB → {sent_mb:.1f}MB ({saved:.0%} 감소), "
+        f"인코딩 {stats['encode_seconds']:.1f}초, 전체 변환 {stats['elapsed_seconds']:.1f}초 "
+        f"(구간 {stats['segments']}개)"
+    )
+
+
+def request_transcription(client, audio_bytes: bytes, file_extension: str = "wav") -> str:
+    """
+    Whisper API 요청 1회 (임시 파일 없이 메모리의 바이트를 그대로 전송)
+
+    실패하면 예외를 그대로 올립니다. (재시도는 호출하는 쪽에서)
+    """
+    transcription = client.audio.transcriptions.create(
+        model=WHISPER_MODEL,
+        file=(f"audio.{file_extension}", audio_bytes),
+        language=TRANSCRIBE_LANGUAGE,
+    )
+    return (transcription.text or "").strip()
+
+
+def audio_digest(audio_bytes: bytes) -> str:
+    """음성 바이트의 SHA-256 (변환 캐시 키용)"""
+    return hashlib.sha256(audio_bytes).hexdigest()
+
+
+def transcription_cache_key(digest: str, *segment_range) -> str:
+    """변환 캐시 키 (음성 해시 + 모델 + 언어, 구간이면 구간 위치까지)"""
+    return make_cache_key("transcription", digest, WHISPER_MODEL, TRANSCRIBE_LANGUAGE, *segment_range)
+
+
+def transcribe_segments(
+    segments: List[Dict],
+    transcribe_fn: Callable[[Dict], str],
+    max_workers: int = None,
+    on_progress: Callable[[int, int, Dict], None] = None,
+    max_attempts: int = SEGMENT_MAX_ATTEMPTS,
+) -> Tuple[Dict[int, str], Dict[int, str]]:
+    """
+    구간들을 동시에 변환하고, 실패한 구간만 다시 시도
+
+    Args:
+        segments: [{'index', 'start', 'end', ...}]
+        transcribe_fn: 구간 하나를 텍스트로 바꾸는 함수 (작업 스레드에서 호출, st 사용 금지)
+        max_workers: 동시 변환 구간 수 (기본 DEFAULT_TRANSCRIBE_WORKERS)
+        on_progress: 구간 하나가 끝날 때마다 호출 (완료 수, 전체 수, 구간) - 호출한 스레드에서 실행
+        max_attempts: 구간별 최대 시도 횟수
+
+    Returns:
+        ({구간 번호: 텍스트}, {구간 번호: 에러 유형}) 에러는 끝내 실패한 구간만
+    """
+    texts: Dict[int, str] = {}
+    errors: Dict[int, str] = {}
+    pending = list(segments)
+
+    for attempt in range(max_attempts):
+        if not pending:
+            break
+        if attempt:
+            time.sleep(RETRY_DELAY * attempt)
+
+        failed = []
+        workers = max(1, min(max_workers or DEFAULT_TRANSCRIBE_WORKERS, MAX_TRANSCRIBE_WORKERS, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper") as executor:
+            futures = {executor.submit(transcribe_fn, segment): segment for segment in pending}
+            for future in as_completed(futures):
+                segment = futures[future]
+                try:
+                    texts[segment["index"]] = future.result()
+                    errors.pop(segment["index"], None)
+                    if on_progress:
+                        on_progress(len(texts), len(segments), segment)
+                except Exception as e:
+                    errors[segment["index"]] = classify_audio_error(e)
+                    failed.append(segment)
+
+        # 키/형식 문제는 다시 보내도 같은 결과
+        if any(error in NON_RETRYABLE_ERRORS for error in errors.values()):
+            break
+        pending = sorted(failed, key=lambda segment: segment["index"])
+
+    return texts, errors
+
+
+def stitch_segments(segments: List[Dict]) -> str:
+    """구간 텍스트를 순서대로 이어 붙이기 (구간마다 문단 하나)"""
+    ordered = sorted(segments, key=lambda segment: segment["index"])
+    return "\n\n".join(segment["text"] for segment in ordered if segment.get("text"))
+
+
+def transcribe_long_audio(
+    audio_bytes: bytes,
+    file_extension: str = "wav",
+    transcribe_fn: Callable[[bytes, str], str] = None,
+    max_workers: int = None,
+    on_progress: Callable[[int, int, Dict], None] = None,
+    use_cache: bool = True,
+) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    녹음을 변환 (긴 녹음은 무음 위치에서 나눠 동시에 변환하고 순서대로 이어 붙이기)
+
+    보내기 전에 16kHz 모노 mp3로 압축해서 업로드 용량을 줄입니다. (30분 wav 수백 MB → 약 7MB)
+    압축한 전체가 MAX_FILE_SIZE_MB 안이면 한 번에 보내고, 넘을 때만 나눠 보냅니다.
+
+    Args:
+        audio_bytes: 오디오 바이트
+        file_extension: 파일 확장자
+        transcribe_fn: (구간 바이트, 확장자) -> 텍스트 (기본: Whisper API)
+        max_workers: 동시 변환 구간 수
+        on_progress: 구간 하나가 끝날 때마다 호출 (완료 수, 전체 수, 구간)
+        use_cache: 변환 캐시 사용 여부 (음성 바이트 SHA-256 기준)
+
+    Returns:
+        ({'text', 'segments': [{'index', 'start', 'end', 'text'}], 'compression'}, None) 또는 (None, 에러 유형)
+        start/end는 원본 녹음 기준 초 단위 타임스탬프, compression은 압축 전후 용량/시간입니다.
+        캐시에서 가져온 결과는 compression 대신 'cached': True 가 들어 있습니다.
+    """
+    digest = audio_digest(audio_bytes) if use_cache else None
+    if use_cache:
+        cached = _transcription_cache.get(transcription_cache_key(digest))
+        if cached and cached.get("text"):
+            print(f"음성 변환 캐시 사용: {len(audio_bytes) / (1024 * 1024):.1f}MB")
+            return {**cached, "cached": True}, None
+
+    if transcribe_fn is None:
+        client = get_openai_client()
+        if client is None:
+            return None, "api_key"
+
+        def transcribe_fn(segment_bytes, extension):
+            return request_transcription(client, segment_bytes, extension)
+
+    started = time.time()
+    max_request_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+    audio = None
+    try:
+        audio = load_audio(audio_bytes, file_extension)
+    except Exception:
+        # pydub/ffmpeg가 없거나 읽지 못하는 형식: 한 번에 보낼 수 있는 용량이면 원본 그대로 요청
+        if len(audio_bytes) > max_request_bytes:
+            return None, "decode"
+
+    # 구간별 전송 용량/인코딩 시간 (재시도해도 구간당 한 번만 셈)
+    sent_bytes: Dict[int, int] = {}
+    encode_seconds: Dict[int, float] = {}
+
+    # 먼저 전체를 압축해 보고 한도를 넘을 때만 무음 위치에서 나눔
+    compressed = None
+    ranges = None
+    whole_encode_seconds = 0.0
+    if audio is not None:
+        encode_started = time.time()
+        compressed, compressed_extension = encode_audio(audio)
+        whole_encode_seconds = time.time() - encode_started
+        if len(compressed) > max_request_bytes:
+            ranges = find_split_points(audio)
+
+    if not ranges or len(ranges) == 1:
+        duration = len(audio) / 1000 if audio is not None else None
+        segments = [{"index": 0, "start": 0.0, "end": duration}]
+
+        encoded, extension = audio_bytes, file_extension
+        # 이미 충분히 작은 압축 파일이면 원본 그대로
+        if compressed is not None and len(compressed) < len(audio_bytes):
+            encoded, extension = compressed, compressed_extension
+        sent_bytes[0] = len(encoded)
+
+        def run(segment):
+            return transcribe_fn(encoded, extension)
+    else:
+        segments = [
+            {"index": i, "start": start / 1000, "end": end / 1000, "start_ms": start, "end_ms": end}
+            for i, (start, end) in enumerate(ranges)
+        ]
+
+        def run(segment):
+            # 구간 인코딩은 작업 스레드에서 해서 메모리에 한꺼번에 올리지 않음
+            encode_started = time.time()
+            data, extension = encode_audio(audio, segment["start_ms"], segment["end_ms"])
+            encode_seconds[segment["index"]] = time.time() - encode_started
+            sent_bytes[segment["index"]] = len(data)
+            return transcribe_fn(data, extension)
+
+    if use_cache:
+        run = _cached_segment_runner(run, digest, len(segments))
+
+    texts, errors = transcribe_segments(segments, run, max_workers, on_progress)
+    if errors:
+        return None, next(iter(errors.values()))
+
+    results = [
+        {"index": segment["index"], "start": segment["start"], "end": segment["end"], "text": texts[segment["index"]]}
+        for segment in segments
+    ]
+    text = stitch_segments(results)
+    if not text:
+        return None, "no_speech"
+
+    compression = {
+        "original_bytes": len(audio_bytes),
+        "sent_bytes": sum(sent_bytes.values()),
+        "encode_seconds": whole_encode_seconds + sum(encode_seconds.values()),
+        "elapsed_seconds": time.time() - started,
+        "segments": len(segments),
+    }
+    log_compression(compression)
+    if use_cache:
+        _transcription_cache.set(transcription_cache_key(digest), {"text": text, "segments": results})
+    return {"text": text, "segments": results, "compression": compression}, None
+
+
+def _cached_segment_runner(run: Callable[[Dict], str], digest: str, total: int) -> Callable[[Dict], str]:
+    """구간 변환 함수에 구간별 캐시 적용 (구간이 하나면 전체 캐시로 충분)"""
+    if total <= 1:
+        return run
+
+    def cached_run(segment):
+        key = transcription_cache_key(digest, segment["start_ms"], segment["end_ms"])
+        cached = _transcription_cache.get(key)
+        if cached is not None:
+            return cached
+        text = run(segment)
+        _transcription_cache.set(key, text)
+        return text
+
+    return cached_run
+
+
+def transcribe_audio_with_segments(audio_data, file_extension="wav", on_progress=None):
+    """
+    음성 데이터를 텍스트로 변환 (Whisper API 사용, 긴 녹음은 구간별 동시 변환)
 
     Args:
         audio_data: 오디오 바이너리 데이터 또는 BytesIO 객체
         file_extension: 파일 확장자
+        on_progress: 구간 하나가 끝날 때마다 호출 (완료 수, 전체 수, 구간)
 
     Returns:
-        변환된 텍스트 또는 None (실패 시)
+        {'text', 'segments'} 또는 None (실패 시, 에러는 화면에 표시)
     """
     client = get_openai_client()
 
@@ -152,75 +519,71 @@ def transcribe_audio(audio_data, file_extension="wav"):
 
         # 파일 크기 검증
         file_size_mb = len(audio_bytes) / (1024 * 1024)
-        if file_size_mb > MAX_FILE_SIZE_MB:
-            st.error(f"파일 용량이 초과되었습니다. {MAX_FILE_SIZE_MB}MB 이하의 파일을 사용해 주세요. (현재: {file_size_mb:.1f}MB)")
+        if file_size_mb > MAX_UPLOAD_SIZE_MB:
+            st.error(f"파일 용량이 초과되었습니다. {MAX_UPLOAD_SIZE_MB}MB 이하의 파일을 사용해 주세요. (현재: {file_size_mb:.1f}MB)")
             return None
 
     except Exception as e:
         st.error(ERROR_MESSAGES["file_format"])
         return None
 
-    tmp_file_path = None
-    last_error = None
+    def transcribe_fn(segment_bytes, extension):
+        return request_transcription(client, segment_bytes, extension)
 
-    # 재시도 로직
-    for attempt in range(MAX_RETRIES):
-        try:
-            # 임시 파일로 저장 후 Whisper API 호출
-            with tempfile.NamedTemporaryFile(
-                delete=False,
-                suffix=f".{file_extension}"
-            ) as tmp_file:
-                tmp_file.write(audio_bytes)
-                tmp_file_path = tmp_file.name
-
-            with open(tmp_file_path, "rb") as audio_file:
-                transcription = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="ko"  # 한국어 설정
-                )
-
-            # 변환된 텍스트가 비어있는지 확인
-            if not transcription.text or transcription.text.strip() == "":
-                st.warning(ERROR_MESSAGES["no_speech"])
-                return None
-
-            return transcription.text
+    try:
+        result, error_type = transcribe_long_audio(audio_bytes, file_extension, transcribe_fn, on_progress=on_progress)
+    except Exception as e:
+        result, error_type = None, classify_audio_error(e)
 
-        except Exception as e:
-            last_error = e
-            error_type = classify_audio_error(e)
-
-            # 재시도가 의미 없는 에러는 바로 반환
-            if error_type in ["api_key", "file_format", "file_size", "permission"]:
-                st.error(ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"]))
-                return None
-
-            # 마지막 시도가 아니면 대기 후 재시도
-            if attempt < MAX_RETRIES - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
-                continue
-
-        finally:
-            # 임시 파일 삭제
-            if tmp_file_path:
-                try:
-                    if os.path.exists(tmp_file_path):
-                        os.remove(tmp_file_path)
-                except Exception:
-                    pass  # 임시 파일 삭제 실패는 무시
-
-    # 모든 재시도 실패
-    if last_error:
-        error_type = classify_audio_error(last_error)
+    if result:
+        return result
+
+    if error_type in ("no_speech", "empty_audio"):
+        st.warning(ERROR_MESSAGES[error_type])
+    else:
         st.error(ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"]))
+    return None
 
-        # 디버깅용 상세 정보
-        with st.expander("기술 정보 (관리자에게 전달해 주세요)", expanded=False):
-            st.code(f"에러 유형: {error_type}\n에러 내용: {str(last_error)}")
 
-    return None
+def transcribe_audio(audio_data, file_extension="wav"):
+    """
+    음성 데이터를 텍스트로 변환 (Whisper API 사용)
+
+    Args:
+        audio_data: 오디오 바이너리 데이터 또는 BytesIO 객체
+        file_extension: 파일 확장자
+
+    Returns:
+        변환된 텍스트 또는 None (실패 시)
+    """
+    result = transcribe_audio_with_segments(audio_data, file_extension)
+    return result["text"] if result else None
+
+
+def segment_progress_reporter():
+    """구간별 변환 진행률 표시 콜백 (구간이 2개 이상일 때만 진행 바 표시)"""
+    placeholder = st.empty()
+
+    def report(done, total, segment):
+        if total > 1:
+            placeholder.progress(
+                done / total,
+                text=f"구간 {done}/{total} 변환 완료 ({format_seconds(segment['start'])} ~ {format_seconds(segment['end'])})",
+            )
+
+    return report
+
+
+def format_seconds(seconds) -> str:
+    """초를 MM:SS 또는 H:MM:SS 형식으로 변환"""
+    if seconds is None:
+        return "?"
+    seconds = int(seconds)
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
 
 
 def validate_audio_file(uploaded_file):
@@ -256,8 +619,8 @@ def validate_audio_file(uploaded_file):
 
         # 파일 크기 확인
         file_size_mb = uploaded_file.size / (1024 * 1024)
-        if file_size_mb > MAX_FILE_SIZE_MB:
-            return False, f"파일 용량이 초과되었습니다. {MAX_FILE_SIZE_MB}MB 이하의 파일을 선택해 주세요. (현재: {file_size_mb:.1f}MB)"
+        if file_size_mb > MAX_UPLOAD_SIZE_MB:
+            return False, f"파일 용량이 초과되었습니다. {MAX_UPLOAD_SIZE_MB}MB 이하의 파일을 선택해 주세요. (현재: {file_size_mb:.1f}MB)"
 
         # 파일 크기가 너무 작은 경우 (빈 파일 체크)
         if uploaded_file.size < 1000:
@@ -446,10 +809,11 @@ def render_microphone_input():
                 try:
                     # 오디오 데이터 읽기
                     audio_bytes = audio_value.getvalue()
-                    text = transcribe_audio(audio_bytes, "wav")
+                    result = transcribe_audio_with_segments(audio_bytes, "wav", on_progress=segment_progress_reporter())
 
-                    if text:
-                        st.session_state.voice_transcribed_text = text
+                    if result:
+                        st.session_state.voice_transcribed_text = result["text"]
+                        st.session_state.voice_transcript_segments = result["segments"]
                         st.success("음성이 텍스트로 변환되었습니다.")
                         st.rerun()
                 except Exception as e:
@@ -474,7 +838,7 @@ def render_file_upload_input():
     <div class="help-box" style="background: #FFF8E1; border: 2px solid #F57C00; padding: 1.2rem; border-radius: 12px;">
     <b style="font-size: 1.2rem;">파일 업로드 안내</b><br><br>
     <b>지원 형식:</b> mp3, wav, m4a, ogg, webm, mp4<br>
-    <b>최대 용량:</b> 25MB<br><br>
+    <b>최대 용량:</b> 200MB (아주 긴 녹음은 여러 구간으로 나눠 동시에 변환합니다)<br><br>
     <span style="color: #666;">예: 스마트폰 녹음 파일, 음성 메모 등</span>
     </div>
     """, unsafe_allow_html=True)
@@ -523,10 +887,11 @@ def render_file_upload_input():
                 try:
                     file_ext = get_file_extension(uploaded_file)
                     audio_bytes = uploaded_file.getvalue()
-                    text = transcribe_audio(audio_bytes, file_ext)
+                    result = transcribe_audio_with_segments(audio_bytes, file_ext, on_progress=segment_progress_reporter())
 
-                    if text:
-                        st.session_state.voice_transcribed_text = text
+                    if result:
+                        st.session_state.voice_transcribed_text = result["text"]
+                        st.session_state.voice_transcript_segments = result["segments"]
                         st.success("음성이 텍스트로 변환되었습니다.")
                         st.rerun()
                 except Exception as e:
@@ -573,6 +938,14 @@ def render_transcription_editor(transcribed_text):
     except Exception:
         pass  # 통계 계산 실패는 무시
 
+    # 긴 녹음은 구간별 시작 시각 표시 (원본 녹음에서 찾아 들을 때 사용)
+    segments = st.session_state.get("voice_transcript_segments") or []
+    if len(segments) > 1:
+        with st.expander(f"구간별 시간 ({len(segments)}개 구간)", expanded=False):
+            for segment in segments:
+                preview = segment.get("text", "")[:60]
+                st.markdown(f"**[{format_seconds(segment['start'])} ~ {format_seconds(segment['end'])}]** {preview}...")
+
     # 텍스트 미리보기 (읽기 전용)
     st.markdown("#### 텍스트 미리보기")
     try:
@@ -611,6 +984,7 @@ def clear_voice_session():
     """음성 모드 세션 상태 초기화"""
     keys_to_clear = [
         "voice_transcribed_text",
+        "voice_transcript_segments",
         "recorded_audio",
         "is_recording",
         "voice_mode_active"
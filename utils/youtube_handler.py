@@ -1,8 +1,13 @@
 """유튜브 영상 처리 모듈 - 강화된 에러 핸들링"""
 import re
-from typing import Optional, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import time
 
+from utils.disk_cache import DiskCache, make_cache_key
+from utils.sentence_segmenter import chunk_text
+
 
 # 에러 메시지 (친근한 한국어)
 ERROR_MESSAGES = {
@@ -71,6 +76,47 @@ youtube.com 또는 youtu.be 링크를 입력해주세요.
 MAX_RETRIES = 2
 RETRY_DELAY = 1
 
+# 자막 언어 우선순위 (한국어 우선, 영어 대체)
+DEFAULT_TRANSCRIPT_LANGUAGES = ['ko', 'ko-KR', 'ko-kr', 'en', 'en-US', 'en-GB']
+
+# 여러 영상 동시 처리 수 (yt-dlp/자막 요청은 대부분 네트워크 대기)
+DEFAULT_INGEST_WORKERS = 4
+MAX_INGEST_WORKERS = 8
+
+# 자막/영상 정보 캐시 (같은 영상을 여러 학생이 쓰면 유튜브에 다시 요청하지 않음)
+# 자막은 바뀌지 않으므로 기한 없이 용량 한도(LRU)로만 정리하고,
+# 조회수 등이 바뀌는 영상 정보는 하루가 지나면 다시 가져옵니다.
+YOUTUBE_CACHE_DIR = Path(__file__).parent.parent / "data" / "cache"
+TRANSCRIPT_CACHE_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+VIDEO_INFO_CACHE_TTL_SECONDS = 24 * 3600  # 1일
+VIDEO_INFO_CACHE_MAX_BYTES = 20 * 1024 * 1024  # 20MB
+
+# 재생목록/채널 URL (watch?v=...&list=... 처럼 영상이 지정된 URL은 영상 하나로 처리)
+PLAYLIST_URL_PATTERN = re.compile(
+    r'(?:https?://)?(?:www\.|m\.|music\.)?youtube\.com/playlist\?(?:.*&)?list=([a-zA-Z0-9_-]+)'
+)
+CHANNEL_URL_PATTERN = re.compile(
+    r'(?:https?://)?(?:www\.|m\.)?youtube\.com/'
+    r'(@[\w.-]+|channel/UC[a-zA-Z0-9_-]{22}|c/[\w.-]+|user/[\w.-]+)'
+    r'(?:/([a-z]+))?/?(?:[?#].*)?$'
+)
+# 채널 탭 중 영상 목록으로 쓰는 탭 (탭이 없으면 videos)
+CHANNEL_VIDEO_TABS = ('videos', 'streams')
+# 재생목록/채널에서 한 번에 가져올 최대 영상 수
+MAX_COLLECTION_ENTRIES = 200
+# 평면 추출 목록에 남아 있는 볼 수 없는 영상 제목
+UNAVAILABLE_ENTRY_TITLES = ('[private video]', '[deleted video]')
+
+_transcript_cache = DiskCache(
+    YOUTUBE_CACHE_DIR / "youtube_transcripts.sqlite3",
+    max_bytes=TRANSCRIPT_CACHE_MAX_BYTES,
+)
+_video_info_cache = DiskCache(
+    YOUTUBE_CACHE_DIR / "youtube_video_info.sqlite3",
+    ttl_seconds=VIDEO_INFO_CACHE_TTL_SECONDS,
+    max_bytes=VIDEO_INFO_CACHE_MAX_BYTES,
+)
+
 
 def classify_youtube_error(error: Exception) -> str:
     """유튜브 관련 에러 유형 분류"""
@@ -185,13 +231,53 @@ def validate_youtube_url(url: str) -> Tuple[bool, str]:
     return True, video_id
 
 
-def get_video_info(url: str, timeout: int = 30) -> Optional[Dict]:
+def parse_collection_url(url: str) -> Optional[Dict]:
+    """
+    재생목록/채널 URL 해석
+
+    지원 형식:
+    - https://www.youtube.com/playlist?list=xxxxx
+    - https://www.youtube.com/@handle (뒤에 /videos, /streams 허용)
+    - https://www.youtube.com/channel/UCxxxxx, /c/name, /user/name
+
+    Returns:
+        {'kind': 'playlist'/'channel', 'collection_id', 'url': 목록을 가져올 URL} 또는 None
+    """
+    if not url or not isinstance(url, str):
+        return None
+    url = url.strip()
+
+    match = PLAYLIST_URL_PATTERN.search(url)
+    if match:
+        playlist_id = match.group(1)
+        return {
+            'kind': 'playlist',
+            'collection_id': f"playlist:{playlist_id}",
+            'url': f"https://www.youtube.com/playlist?list={playlist_id}",
+        }
+
+    match = CHANNEL_URL_PATTERN.match(url)
+    if match:
+        channel, tab = match.group(1), match.group(2) or 'videos'
+        if tab not in CHANNEL_VIDEO_TABS:
+            return None
+        return {
+            'kind': 'channel',
+            'collection_id': f"channel:{channel}/{tab}",
+            'url': f"https://www.youtube.com/{channel}/{tab}",
+        }
+
+    return None
+
+
+def get_video_info(url: str, timeout: int = 30, use_cache: bool = True) -> Optional[Dict]:
     """
     yt-dlp를 사용하여 유튜브 영상 정보 가져오기
 
     Args:
         url: 유튜브 URL
         timeout: 타임아웃 (초, 기본 30초)
+        use_cache: 디스크 캐시 사용 여부 (비디오 ID 기준, 1일)
 
     Returns:
         Dict with keys: title, description, thumbnail, duration, view_count, channel, upload_date
@@ -202,6 +288,21 @@ def get_video_info(url: str, timeout: int = 30) -> Optional[Dict]:
     if not is_valid:
         return {'error': result}
 
+    cache_key = make_cache_key("video_info", result)
+    if use_cache:
+        cached = _video_info_cache.get(cache_key)
+        if cached:
+            # 같은 영상이라도 입력한 URL 형식은 다를 수 있음
+            return {**cached, 'url': url}
+
+    info = _fetch_video_info(url, timeout)
+    if use_cache and info and 'error' not in info:
+        _video_info_cache.set(cache_key, info)
+    return info
+
+
+def _fetch_video_info(url: str, timeout: int) -> Dict:
+    """yt-dlp로 영상 정보를 실제로 가져오기 (재시도 포함)"""
     last_error = None
 
     for attempt in range(MAX_RETRIES):
@@ -223,20 +324,9 @@ def get_video_info(url: str, timeout: int = 30) -> Optional[Dict]:
 
                 if info:
                     # 시간 포맷팅
-                    try:
-                        duration_seconds = info.get('duration', 0) or 0
-                        hours = duration_seconds // 3600
-                        minutes = (duration_seconds % 3600) // 60
-                        seconds = duration_seconds % 60
-
-                        if hours > 0:
-                            duration_str = f"{hours}시간 {minutes}분 {seconds}초"
-                        elif minutes > 0:
-                            duration_str = f"{minutes}분 {seconds}초"
-                        else:
-                            duration_str = f"{seconds}초"
-                    except Exception:
-                        duration_str = "알 수 없음"
+                    duration_seconds = info.get('duration', 0) or 0
+                    duration_str = format_duration(duration_seconds)
+                    if duration_str == "알 수 없음":
                         duration_seconds = 0
 
                     # 썸네일 URL 최적화 (고화질 우선)
@@ -292,6 +382,184 @@ def get_video_info(url: str, timeout: int = 30) -> Optional[Dict]:
     return {'error': ERROR_MESSAGES["unknown"]}
 
 
+def list_collection_videos(url: str, timeout: int = 30, fetch_fn: Callable[[str, int], Dict] = None) -> Tuple[Optional[Dict], Optional[str]]:
+    """
+    재생목록/채널의 영상 목록 가져오기 (평면 추출: 영상별 상세 정보는 요청하지 않음)
+
+    목록은 새 강의가 올라오면 바뀌므로 캐시하지 않습니다.
+
+    Args:
+        url: 재생목록/채널 URL
+        timeout: 타임아웃 (초)
+        fetch_fn: 목록 추출 함수 (기본: yt-dlp, 테스트용 대체 가능)
+
+    Returns:
+        ({'kind', 'collection_id', 'url', 'title', 'entries': [영상]}, None) 또는 (None, 에러메시지)
+        영상은 {'video_id', 'url', 'info'} 이고 info는 get_video_info와 같은 형식입니다.
+    """
+    collection = parse_collection_url(url)
+    if not collection:
+        return None, ERROR_MESSAGES["invalid_url"]
+
+    fetch_fn = fetch_fn or _fetch_collection_info
+    last_error = None
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            info = fetch_fn(collection['url'], timeout) or {}
+            entries = []
+            seen = set()
+            for entry in _iter_flat_entries(info):
+                video_id = entry.get('id')
+                title = entry.get('title') or ''
+                if not video_id or video_id in seen or title.lower() in UNAVAILABLE_ENTRY_TITLES:
+                    continue
+                seen.add(video_id)
+                entries.append({
+                    'video_id': video_id,
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                    'info': video_info_from_entry(entry, info),
+                })
+                if len(entries) >= MAX_COLLECTION_ENTRIES:
+                    break
+
+            if not entries:
+                return None, ERROR_MESSAGES["unavailable"]
+
+            return {
+                **collection,
+                'title': info.get('title') or info.get('channel') or collection['collection_id'],
+                'entries': entries,
+            }, None
+
+        except ImportError:
+            return None, ERROR_MESSAGES["library_missing"]
+
+        except Exception as e:
+            last_error = e
+            error_type = classify_youtube_error(e)
+            if error_type in ["private", "unavailable", "library_missing"]:
+                return None, ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"])
+            if attempt < MAX_RETRIES - 1:
+                time.sleep(RETRY_DELAY * (attempt + 1))
+
+    error_type = classify_youtube_error(last_error) if last_error else "unknown"
+    return None, ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"])
+
+
+def _fetch_collection_info(url: str, timeout: int) -> Dict:
+    """yt-dlp 평면 추출로 재생목록/채널 정보 가져오기"""
+    from yt_dlp import YoutubeDL
+
+    ydl_opts = {
+        'quiet': True,
+        'no_warnings': True,
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+        'socket_timeout': timeout,
+        'retries': 3,
+        'playlistend': MAX_COLLECTION_ENTRIES,
+        'ignoreerrors': True,  # 목록 중 일부 영상 오류는 건너뜀
+    }
+    with YoutubeDL(ydl_opts) as ydl:
+        return ydl.extract_info(url, download=False) or {}
+
+
+def _iter_flat_entries(info: Dict) -> Iterator[Dict]:
+    """평면 추출 결과의 영상 항목 (채널 탭처럼 목록 안의 목록도 펼침)"""
+    for entry in info.get('entries') or []:
+        if not entry:
+            continue
+        if entry.get('entries') is not None:
+            yield from _iter_flat_entries(entry)
+        elif entry.get('ie_key', 'Youtube') == 'Youtube' and len(entry.get('id') or '') == 11:
+            yield entry
+
+
+def video_info_from_entry(entry: Dict, collection_info: Dict = None) -> Dict:
+    """평면 추출 항목을 get_video_info 결과 형식으로 변환 (없는 값은 기본값)"""
+    collection_info = collection_info or {}
+    video_id = entry.get('id', '')
+    duration_seconds = int(entry.get('duration') or 0)
+    view_count = entry.get('view_count') or 0
+
+    thumbnail = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
+    for thumb in reversed(entry.get('thumbnails') or []):
+        if thumb.get('url'):
+            thumbnail = thumb['url']
+            break
+
+    return {
+        'video_id': video_id,
+        'title': entry.get('title') or '제목 없음',
+        'description': (entry.get('description') or '')[:500],
+        'thumbnail': thumbnail,
+        'duration': duration_seconds,
+        'duration_str': format_duration(duration_seconds),
+        'view_count': view_count,
+        'view_count_str': format_view_count(view_count),
+        'channel': entry.get('channel') or entry.get('uploader') or collection_info.get('channel') or collection_info.get('uploader') or '알 수 없음',
+        'upload_date': format_upload_date(entry.get('upload_date') or ''),
+        'url': f"https://www.youtube.com/watch?v={video_id}",
+        'has_captions': None,  # 평면 추출에는 자막 정보가 없음 (자막 추출 때 확인)
+    }
+
+
+def pending_collection_entries(collection: Dict, known_video_ids) -> List[Dict]:
+    """목록에서 아직 가져오지 않은 영상만 (목록 순서)"""
+    known = set(known_video_ids or [])
+    return [entry for entry in collection.get('entries', []) if entry['video_id'] not in known]
+
+
+def record_collection_sync(registry: Dict, collection: Dict, ingested_video_ids) -> Dict:
+    """
+    재생목록/채널별로 가져온 영상 ID 기록 (다음 동기화 때 새 영상만 가져오기 위함)
+
+    Args:
+        registry: {collection_id: {'kind', 'url', 'title', 'video_ids'}} (세션에 보관)
+        collection: list_collection_videos 결과
+        ingested_video_ids: 이번에 실제로 가져온 영상 ID
+
+    Returns:
+        갱신된 registry (같은 객체)
+    """
+    record = registry.setdefault(collection['collection_id'], {'video_ids': []})
+    record.update({
+        'kind': collection.get('kind'),
+        'url': collection.get('url'),
+        'title': collection.get('title', ''),
+    })
+    known = set(record['video_ids'])
+    for video_id in ingested_video_ids:
+        if video_id not in known:
+            record['video_ids'].append(video_id)
+            known.add(video_id)
+    return registry
+
+
+def synced_video_ids(registry: Dict) -> set:
+    """registry에 기록된 모든 영상 ID"""
+    return {video_id for record in (registry or {}).values() for video_id in record.get('video_ids', [])}
+
+
+def format_duration(duration_seconds) -> str:
+    """영상 길이(초)를 "1시간 2분 3초" 형식으로 변환"""
+    try:
+        duration_seconds = int(duration_seconds or 0)
+        hours = duration_seconds // 3600
+        minutes = (duration_seconds % 3600) // 60
+        seconds = duration_seconds % 60
+
+        if hours > 0:
+            return f"{hours}시간 {minutes}분 {seconds}초"
+        elif minutes > 0:
+            return f"{minutes}분 {seconds}초"
+        else:
+            return f"{seconds}초"
+    except Exception:
+        return "알 수 없음"
+
+
 def format_upload_date(date_str: str) -> str:
     """업로드 날짜 포맷팅 (YYYYMMDD -> YYYY.MM.DD)"""
     if not date_str:
@@ -327,13 +595,14 @@ def format_view_count(count: int) -> str:
         return "조회수 정보 없음"
 
 
-def get_transcript(video_id: str, languages: List[str] = None) -> Tuple[Optional[str], Optional[str]]:
+def get_transcript(video_id: str, languages: List[str] = None, use_cache: bool = True) -> Tuple[Optional[str], Optional[str]]:
     """
     유튜브 자막 추출
 
     Args:
         video_id: 유튜브 비디오 ID
         languages: 선호 언어 리스트 (기본: ['ko', 'ko-KR', 'en', 'en-US'])
+        use_cache: 디스크 캐시 사용 여부 (비디오 ID + 언어 목록 기준)
 
     Returns:
         Tuple of (transcript_text, language_used) or (None, error_message)
@@ -350,9 +619,33 @@ def get_transcript(video_id: str, languages: List[str] = None) -> Tuple[Optional
         return None, "비디오 ID가 비어있어요."
 
     if languages is None:
-        # 한국어 우선, 영어 대체
-        languages = ['ko', 'ko-KR', 'ko-kr', 'en', 'en-US', 'en-GB']
+        languages = DEFAULT_TRANSCRIPT_LANGUAGES
+
+    cache_key = make_cache_key("transcript", video_id, list(languages))
+    if use_cache:
+        cached = _transcript_cache.get(cache_key)
+        if cached:
+            return cached["text"], cached["language"]
+
+    segments, lang_or_error = _fetch_transcript_segments(video_id, languages)
+    if not segments:
+        return None, lang_or_error
+
+    transcript = " ".join(segment['text'] for segment in segments)
+    if use_cache:
+        # 타임스탬프 구간도 함께 보관 (get_transcript_with_timestamps가 재사용)
+        _transcript_cache.set(cache_key, {"text": transcript, "language": lang_or_error, "segments": segments})
+    return transcript, lang_or_error
+
 
+def _fetch_transcript_segments(video_id: str, languages: List[str]) -> Tuple[Optional[List[Dict]], Optional[str]]:
+    """
+    youtube_transcript_api로 자막을 실제로 가져오기
+
+    Returns:
+        ([{'start': float, 'duration': float, 'text': str}, ...], language_used)
+        또는 (None, error_message)
+    """
     try:
         from youtube_transcript_api import YouTubeTranscriptApi
         from youtube_transcript_api._errors import (
@@ -410,26 +703,28 @@ def get_transcript(video_id: str, languages: List[str] = None) -> Tuple[Optional
                 try:
                     transcript_data = transcript.fetch()
 
-                    # 자막 텍스트 조합 (중복 제거 및 정리)
-                    full_text = ""
+                    # 자막 구간 정리 (중복 제거, 시작 시각 유지)
+                    segments = []
                     prev_text = ""
                     for entry in transcript_data:
-                        text = entry.get('text', '').strip()
+                        text = (_entry_value(entry, 'text') or '').strip()
                         # 중복 제거 및 빈 텍스트 스킵
                         if text and text != prev_text:
                             # 자동 생성 자막의 경우 [음악], [박수] 등 태그 제거
                             if is_auto_generated:
                                 text = clean_auto_caption(text)
                             if text:
-                                full_text += text + " "
+                                segments.append({
+                                    'start': float(_entry_value(entry, 'start') or 0),
+                                    'duration': float(_entry_value(entry, 'duration') or 0),
+                                    'text': text,
+                                })
                                 prev_text = text
 
-                    cleaned_text = full_text.strip()
-
-                    if not cleaned_text:
+                    if not segments:
                         return None, "자막이 있지만 내용이 비어있습니다."
 
-                    return cleaned_text, used_language
+                    return segments, used_language
 
                 except Exception as e:
                     return None, f"자막 데이터를 가져오는 중 오류가 발생했어요: {str(e)[:100]}"
@@ -485,59 +780,51 @@ def clean_auto_caption(text: str) -> str:
         return text
 
 
-def get_transcript_with_timestamps(video_id: str, languages: List[str] = None) -> Tuple[Optional[List[Dict]], Optional[str]]:
+def get_transcript_with_timestamps(
+    video_id: str,
+    languages: List[str] = None,
+    use_cache: bool = True,
+) -> Tuple[Optional[List[Dict]], Optional[str]]:
     """
     타임스탬프가 포함된 자막 추출
 
+    get_transcript와 같은 캐시 항목을 쓰므로 자막을 이미 추출했다면 다시 요청하지 않습니다.
+
     Returns:
         Tuple of (transcript_list, language_used) or (None, error_message)
         transcript_list: [{'start': float, 'duration': float, 'text': str}, ...]
     """
     # 입력 검증
-    if not video_id:
+    if not video_id or not isinstance(video_id, str) or not video_id.strip():
         return None, "비디오 ID가 없어요."
+    video_id = video_id.strip()
 
     if languages is None:
-        languages = ['ko', 'en']
+        languages = DEFAULT_TRANSCRIPT_LANGUAGES
 
-    try:
-        from youtube_transcript_api import YouTubeTranscriptApi
+    cache_key = make_cache_key("transcript", video_id, list(languages))
+    if use_cache:
+        cached = _transcript_cache.get(cache_key)
+        if cached and cached.get("segments"):
+            return cached["segments"], cached["language"]
 
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+    segments, lang_or_error = _fetch_transcript_segments(video_id, languages)
+    if segments and use_cache:
+        transcript = " ".join(segment['text'] for segment in segments)
+        _transcript_cache.set(cache_key, {"text": transcript, "language": lang_or_error, "segments": segments})
+    return segments, lang_or_error
 
-        transcript = None
-        used_language = None
 
-        # 수동 자막 먼저 시도
-        for lang in languages:
-            try:
-                transcript = transcript_list.find_manually_created_transcript([lang])
-                used_language = lang
-                break
-            except Exception:
-                continue
+def _entry_value(entry, key: str):
+    """자막 항목 값 읽기 (라이브러리 버전에 따라 dict 또는 객체)"""
+    if isinstance(entry, dict):
+        return entry.get(key)
+    return getattr(entry, key, None)
 
-        # 자동 생성 자막 시도
-        if transcript is None:
-            for lang in languages:
-                try:
-                    transcript = transcript_list.find_generated_transcript([lang])
-                    used_language = f"{lang} (자동 생성)"
-                    break
-                except Exception:
-                    continue
-
-        if transcript:
-            transcript_data = transcript.fetch()
-            return transcript_data, used_language
-        else:
-            return None, "사용 가능한 자막이 없습니다."
 
-    except ImportError:
-        return None, ERROR_MESSAGES["library_missing"]
-    except Exception as e:
-        error_type = classify_youtube_error(e)
-        return None, ERROR_MESSAGES.get(error_type, f"자막 추출 중 오류 발생: {str(e)[:100]}")
+def build_timestamp_url(video_id: str, seconds: float) -> str:
+    """영상의 특정 시각으로 바로 가는 유튜브 링크"""
+    return f"https://www.youtube.com/watch?v={video_id}&t={max(0, int(seconds))}s"
 
 
 def format_timestamp(seconds: float) -> str:
@@ -557,13 +844,14 @@ def format_timestamp(seconds: float) -> str:
         return "00:00"
 
 
-def chunk_transcript(transcript: str, max_chars: int = 4000) -> List[str]:
+def chunk_transcript(transcript: str, max_chars: int = 4000, overlap: int = 0) -> List[str]:
     """
     긴 자막을 청크로 분할 (API 토큰 제한 대응)
 
     Args:
         transcript: 전체 자막 텍스트
         max_chars: 청크당 최대 문자 수
+        overlap: 앞 청크 끝 문장을 다음 청크 앞에 다시 넣을 최대 글자 수
 
     Returns:
         청크 리스트
@@ -578,109 +866,191 @@ def chunk_transcript(transcript: str, max_chars: int = 4000) -> List[str]:
     if len(transcript) <= max_chars:
         return [transcript]
 
-    chunks = []
+    try:
+        # 문장 끝(마침표, ~다/~요 등)에서 나누고, 너무 긴 문장은 공백 위치에서 나눔
+        return chunk_text(transcript, max_chars, overlap)
+    except Exception:
+        # 문장 분할 실패 시 단순 분할
+        return [transcript[i:i + max_chars] for i in range(0, len(transcript), max_chars)]
 
+
+def _process_single_video(
+    part_number: int,
+    url: str,
+    info_fn: Callable[[str], Optional[Dict]],
+    transcript_fn: Callable[[str], Tuple[Optional[str], Optional[str]]],
+    fetch_transcript: bool = True,
+) -> Dict:
+    """영상 하나의 정보(+자막)를 가져와 process_multiple_videos 결과 형식으로 반환"""
     try:
-        sentences = transcript.replace('. ', '.|').replace('? ', '?|').replace('! ', '!|').split('|')
+        video_id = extract_video_id(url)
+        if not video_id:
+            return {
+                'url': url,
+                'error': '유효하지 않은 유튜브 URL입니다.',
+                'part_number': part_number,
+                'has_error': True,
+            }
 
-        current_chunk = ""
-        for sentence in sentences:
-            if len(current_chunk) + len(sentence) <= max_chars:
-                current_chunk += sentence + " "
-            else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = sentence + " "
+        # 영상 정보 가져오기
+        video_info = info_fn(url)
+        if not video_info or 'error' in video_info:
+            return {
+                'url': url,
+                'error': video_info['error'] if video_info else ERROR_MESSAGES["unknown"],
+                'part_number': part_number,
+                'has_error': True,
+            }
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        result = {
+            'url': url,
+            'video_id': video_id,
+            'part_number': part_number,
+            'info': video_info,
+            'has_error': False,
+            'error': None,
+        }
+        if not fetch_transcript:
+            return result
+
+        # 자막 가져오기
+        transcript, lang = transcript_fn(video_id)
+        result.update({
+            'transcript': transcript,
+            'transcript_language': lang,
+            'has_error': transcript is None,
+            'error': lang if transcript is None else None,
+        })
+        return result
 
-    except Exception:
-        # 문장 분할 실패 시 단순 분할
-        for i in range(0, len(transcript), max_chars):
-            chunks.append(transcript[i:i + max_chars])
+    except Exception as e:
+        return {
+            'url': url,
+            'error': f"처리 중 오류 발생: {str(e)[:100]}",
+            'part_number': part_number,
+            'has_error': True,
+        }
 
-    return chunks
 
+def _run_parallel(tasks: List[Tuple], worker: Callable, max_workers: int = None) -> Iterator[Tuple]:
+    """
+    (키, 인자...) 작업들을 스레드 풀에서 실행하고 끝나는 순서대로 (키, 결과) 반환
 
-def process_multiple_videos(urls: List[str]) -> List[Dict]:
+    영상 처리는 대부분 네트워크 대기라서 스레드로 충분합니다.
+    """
+    if not tasks:
+        return
+
+    max_workers = max(1, min(max_workers or DEFAULT_INGEST_WORKERS, MAX_INGEST_WORKERS, len(tasks)))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="youtube") as executor:
+        futures = {executor.submit(worker, *task[1:]): task[0] for task in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def iter_process_videos(
+    urls: List[str],
+    max_workers: int = None,
+    info_fn: Callable[[str], Optional[Dict]] = None,
+    transcript_fn: Callable[[str], Tuple[Optional[str], Optional[str]]] = None,
+    fetch_transcript: bool = True,
+    start_part: int = 1,
+    known_info: Dict[str, Dict] = None,
+) -> Iterator[Dict]:
     """
-    여러 유튜브 영상 일괄 처리
+    여러 유튜브 영상을 동시에 처리하고, 끝나는 순서대로 결과 반환
 
     Args:
-        urls: 유튜브 URL 리스트
-
-    Returns:
-        처리 결과 리스트
+        urls: 유튜브 URL 리스트 (빈 줄은 건너뛰되 part_number는 원래 위치 기준)
+        max_workers: 동시 처리 영상 수 (기본 DEFAULT_INGEST_WORKERS)
+        info_fn: 영상 정보 함수 (기본: get_video_info)
+        transcript_fn: 자막 함수 (기본: get_transcript)
+        fetch_transcript: False면 영상 정보만 확인
+        start_part: 첫 URL의 part_number (이미 가져온 영상 뒤에 이어 붙일 때)
+        known_info: {video_id: 영상 정보} 재생목록 평면 추출로 이미 받은 정보 (info_fn 호출 생략)
+
+    Yields:
+        process_multiple_videos와 같은 형식의 결과 딕셔너리
     """
-    results = []
+    if not urls or not isinstance(urls, list):
+        return
 
-    # 입력 검증
-    if not urls:
-        return []
+    info_fn = info_fn or get_video_info
+    transcript_fn = transcript_fn or get_transcript
+    if known_info:
+        fallback_info_fn = info_fn
 
-    if not isinstance(urls, list):
-        return []
+        def info_fn(url):
+            return known_info.get(extract_video_id(url)) or fallback_info_fn(url)
 
+    tasks = []
     for i, url in enumerate(urls):
-        try:
-            # URL 검증
-            if not url:
-                continue
+        if not url or not isinstance(url, str) or not url.strip():
+            continue
+        part_number = start_part + i
+        tasks.append((part_number, part_number, url.strip(), info_fn, transcript_fn, fetch_transcript))
 
-            if not isinstance(url, str):
-                continue
+    for _, result in _run_parallel(tasks, _process_single_video, max_workers):
+        yield result
 
-            url = url.strip()
-            if not url:
-                continue
 
-            video_id = extract_video_id(url)
-            if not video_id:
-                results.append({
-                    'url': url,
-                    'error': '유효하지 않은 유튜브 URL입니다.',
-                    'part_number': i + 1,
-                    'has_error': True,
-                })
-                continue
+def process_multiple_videos(
+    urls: List[str],
+    max_workers: int = None,
+    info_fn: Callable[[str], Optional[Dict]] = None,
+    transcript_fn: Callable[[str], Tuple[Optional[str], Optional[str]]] = None,
+    on_progress: Callable[[int, int, Dict], None] = None,
+) -> List[Dict]:
+    """
+    여러 유튜브 영상 일괄 처리 (영상 정보/자막을 동시에 가져옴)
 
-            # 영상 정보 가져오기
-            video_info = get_video_info(url)
-            if video_info and 'error' in video_info:
-                results.append({
-                    'url': url,
-                    'error': video_info['error'],
-                    'part_number': i + 1,
-                    'has_error': True,
-                })
-                continue
+    Args:
+        urls: 유튜브 URL 리스트
+        max_workers: 동시 처리 영상 수
+        info_fn: 영상 정보 함수 (테스트용 대체 가능)
+        transcript_fn: 자막 함수 (테스트용 대체 가능)
+        on_progress: 영상 하나가 끝날 때마다 호출 (완료 수, 전체 수, 결과)
 
-            # 자막 가져오기
-            transcript, lang = get_transcript(video_id)
+    Returns:
+        처리 결과 리스트 (part_number 순서)
+    """
+    if not urls or not isinstance(urls, list):
+        return []
+
+    total = sum(1 for url in urls if isinstance(url, str) and url.strip())
+    results = []
+    for result in iter_process_videos(urls, max_workers, info_fn, transcript_fn):
+        results.append(result)
+        if on_progress:
+            on_progress(len(results), total, result)
+
+    results.sort(key=lambda r: r['part_number'])
+    return results
 
-            result = {
-                'url': url,
-                'video_id': video_id,
-                'part_number': i + 1,
-                'info': video_info,
-                'transcript': transcript,
-                'transcript_language': lang,
-                'has_error': transcript is None,
-                'error': lang if transcript is None else None,
-            }
 
-            results.append(result)
+def iter_fetch_transcripts(
+    videos: List[Dict],
+    max_workers: int = None,
+    transcript_fn: Callable[[str], Tuple[Optional[str], Optional[str]]] = None,
+) -> Iterator[Tuple[Dict, Optional[str], Optional[str]]]:
+    """
+    이미 확인한 영상들의 자막을 동시에 가져오고, 끝나는 순서대로 반환
+
+    Yields:
+        (video, transcript_text 또는 None, 언어 또는 에러 메시지)
+    """
+    transcript_fn = transcript_fn or get_transcript
 
+    def fetch(video_id):
+        try:
+            return transcript_fn(video_id)
         except Exception as e:
-            results.append({
-                'url': url if isinstance(url, str) else str(url),
-                'error': f"처리 중 오류 발생: {str(e)[:100]}",
-                'part_number': i + 1,
-                'has_error': True,
-            })
+            error_type = classify_youtube_error(e)
+            return None, ERROR_MESSAGES.get(error_type, ERROR_MESSAGES["unknown"])
 
-    return results
+    tasks = [(i, video.get('video_id')) for i, video in enumerate(videos or [])]
+    for index, (transcript, lang_or_error) in _run_parallel(tasks, fetch, max_workers):
+        yield videos[index], transcript, lang_or_error
 
 
 def merge_transcripts_for_book(video_results: List[Dict]) -> str: